@@ -5,14 +5,37 @@ This module provides configurable timeout mechanisms for algorithm execution
 with graceful handling of timeout scenarios and proper cleanup.
 """
 
+import ctypes
 import signal
 import time
 import threading
-from typing import Any, Callable, Optional, TypeVar
+import concurrent.futures
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
 from contextlib import contextmanager
 
 T = TypeVar('T')
 
+# Worker threads for platforms (or threads) where SIGALRM cannot be used.
+# The pool is created on first use and kept alive so timed calls reuse an
+# idle worker instead of spawning a new thread each time.
+_worker_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_worker_pool_lock = threading.Lock()
+
+# Active signal-based timeouts, innermost last, as (deadline, seconds) pairs
+# where deadline is the monotonic time at which that block must stop. An
+# inner block never outlives its enclosing ones, so deadlines only decrease
+# towards the top. SIGALRM and its timer are process-wide, so the stack is
+# shared by all managers.
+_deadline_stack: List[Tuple[float, float]] = []
+
+# The SIGALRM handler that was installed before _raise_timeout took over
+# the signal. Alarms that are not timeouts are passed on to it.
+_original_alarm_handler: Any = None
+
+# How early an alarm may be seen relative to the monotonic deadline and
+# still count as the timer firing (the timer is rounded to microseconds)
+_ALARM_TOLERANCE = 0.01
+
 
 class TimeoutError(Exception):
     """Raised when an operation times out."""
@@ -35,7 +58,6 @@ class TimeoutManager:
             default_timeout: Default timeout in seconds
         """
         self.default_timeout = default_timeout
-        self._original_handler = None
         
     @contextmanager
     def timeout(self, seconds: Optional[float] = None):
@@ -59,73 +81,86 @@ class TimeoutManager:
             return
             
         # Use signal-based timeout on Unix-like systems
-        if hasattr(signal, 'SIGALRM'):
-            yield from self._signal_timeout(timeout_duration)
+        if _signals_available():
+            with self._signal_timeout(timeout_duration):
+                yield
         else:
             # Fallback to thread-based timeout on Windows
-            yield from self._thread_timeout(timeout_duration)
+            with self._thread_timeout(timeout_duration):
+                yield
     
     @contextmanager
     def _signal_timeout(self, seconds: float):
-        """Signal-based timeout implementation (Unix/Linux/Mac)."""
-        def timeout_handler(signum, frame):
-            raise TimeoutError(f"Operation timed out after {seconds} seconds")
+        """
+        Signal-based timeout implementation (Unix/Linux/Mac).
+        
+        The SIGALRM handler is installed by the first timed block and then
+        left in place, so a timed call only arms and disarms the timer.
+        Timed blocks may be nested: the timer always tracks the innermost
+        deadline, and leaving a block re-arms it for the enclosing one.
+        """
+        global _original_alarm_handler
         
-        # Save original handler
-        self._original_handler = signal.signal(signal.SIGALRM, timeout_handler)
+        if signal.getsignal(signal.SIGALRM) is not _raise_timeout:
+            # First timed block, or the handler was replaced since
+            _original_alarm_handler = signal.signal(signal.SIGALRM, _raise_timeout)
         
+        # An alarm can interrupt the bookkeeping below at any call, so this
+        # block's entry is dropped by truncating to the depth it started at
+        depth = len(_deadline_stack)
+        deadline = time.monotonic() + seconds
         try:
-            # Set alarm
-            signal.alarm(int(seconds))
+            if _deadline_stack and _deadline_stack[-1][0] <= deadline:
+                # The enclosing timeout expires first and keeps the timer
+                _deadline_stack.append(_deadline_stack[-1])
+            else:
+                _deadline_stack.append((deadline, seconds))
+                # Arm a one-shot real-time timer; unlike signal.alarm() this
+                # accepts fractional seconds instead of truncating them
+                signal.setitimer(signal.ITIMER_REAL, seconds)
             yield
-        except TimeoutError:
-            raise
         finally:
-            # Clean up: cancel alarm and restore original handler
-            signal.alarm(0)
-            if self._original_handler is not None:
-                signal.signal(signal.SIGALRM, self._original_handler)
-                self._original_handler = None
+            try:
+                # Clean up: disarm the timer while this block's deadline is
+                # still on the stack, so an alarm that was already due is
+                # handled as this block's timeout
+                signal.setitimer(signal.ITIMER_REAL, 0)
+            finally:
+                del _deadline_stack[depth:]
+                if _deadline_stack:
+                    # Hand the timer back to the enclosing block, firing almost
+                    # immediately if its deadline has already passed
+                    remaining = _deadline_stack[-1][0] - time.monotonic()
+                    signal.setitimer(signal.ITIMER_REAL, max(remaining, 1e-6))
     
     @contextmanager
     def _thread_timeout(self, seconds: float):
-        """Thread-based timeout implementation (Windows compatible)."""
-        result = [None]
-        exception = [None]
-        finished = threading.Event()
-        
-        def target():
-            try:
-                # This is a placeholder - the actual work happens in the context
-                finished.wait()
-            except Exception as e:
-                exception[0] = e
+        """
+        Deadline-based timeout implementation (Windows compatible).
         
-        thread = threading.Thread(target=target)
-        thread.daemon = True
-        thread.start()
+        Without signals the body of a with-block cannot be preempted, so
+        the elapsed time is measured with a monotonic clock and the timeout
+        is reported once the block finishes. Use execute_with_timeout() to
+        have a callable interrupted while it runs.
+        """
+        deadline = time.monotonic() + seconds
         
-        try:
-            yield
-            finished.set()
-        except Exception as e:
-            finished.set()
-            raise
+        yield
         
         # Check if we timed out
-        thread.join(timeout=seconds)
-        if thread.is_alive():
-            finished.set()
+        if time.monotonic() > deadline:
             raise TimeoutError(f"Operation timed out after {seconds} seconds")
-        
-        if exception[0]:
-            raise exception[0]
     
     def execute_with_timeout(self, func: Callable[[], T], 
                            timeout_seconds: Optional[float] = None) -> T:
         """
         Execute a function with timeout protection.
         
+        On Unix the function runs on the calling thread under SIGALRM. Where
+        signals are unavailable (Windows, or any thread other than the main
+        thread) it runs on a pooled worker thread instead, and the caller
+        waits for it with a deadline.
+        
         Args:
             func: Function to execute
             timeout_seconds: Timeout duration in seconds
@@ -136,8 +171,62 @@ class TimeoutManager:
         Raises:
             TimeoutError: If the function times out
         """
-        with self.timeout(timeout_seconds):
+        timeout_duration = timeout_seconds if timeout_seconds is not None else self.default_timeout
+        
+        if timeout_duration <= 0:
+            # No timeout requested: skip the timeout machinery entirely
             return func()
+        
+        if not _signals_available():
+            return self._execute_in_worker(func, timeout_duration)
+        
+        with self._signal_timeout(timeout_duration):
+            return func()
+    
+    def _execute_in_worker(self, func: Callable[[], T], seconds: float) -> T:
+        """
+        Run a function on a pooled worker thread with a deadline.
+        
+        If the deadline passes, a TimeoutError is raised in the caller and
+        asynchronously injected into the worker so the abandoned call stops
+        at its next bytecode boundary. Code blocked inside a C extension
+        cannot be interrupted and finishes in the background.
+        
+        Args:
+            func: Function to execute
+            seconds: Timeout duration in seconds
+            
+        Returns:
+            Result of the function execution
+            
+        Raises:
+            TimeoutError: If the function times out
+        """
+        state_lock = threading.Lock()
+        state = {'thread_id': None, 'done': False, 'interrupted': False}
+        
+        def run():
+            with state_lock:
+                state['thread_id'] = threading.get_ident()
+            try:
+                return func()
+            finally:
+                with state_lock:
+                    state['done'] = True
+                    if state['interrupted']:
+                        # Drop the injected exception if it has not fired yet,
+                        # so it cannot escape into the pool's worker loop
+                        _interrupt_thread(state['thread_id'], None)
+        
+        future = _get_worker_pool().submit(run)
+        try:
+            return future.result(timeout=seconds)
+        except concurrent.futures.TimeoutError:
+            with state_lock:
+                if not future.cancel() and not state['done'] and state['thread_id'] is not None:
+                    state['interrupted'] = True
+                    _interrupt_thread(state['thread_id'], TimeoutError)
+            raise TimeoutError(f"Operation timed out after {seconds} seconds") from None
     
     def safe_execute(self, func: Callable[[], T], 
                     timeout_seconds: Optional[float] = None,
@@ -163,6 +252,60 @@ class TimeoutManager:
             raise
 
 
+def _raise_timeout(signum, frame):
+    """
+    SIGALRM handler shared by all signal-based timeouts.
+    
+    The timer only fires once the innermost deadline has passed, which
+    raises TimeoutError. Any other SIGALRM, outside timed blocks or sent
+    well before the deadline, is passed on to the handler that was
+    installed before this one.
+    """
+    if _deadline_stack:
+        deadline, seconds = _deadline_stack[-1]
+        if time.monotonic() >= deadline - _ALARM_TOLERANCE:
+            raise TimeoutError(f"Operation timed out after {seconds} seconds")
+    
+    handler = _original_alarm_handler
+    if callable(handler):
+        handler(signum, frame)
+    elif handler != signal.SIG_IGN:
+        # SIG_DFL, or a handler installed outside Python (reported as None):
+        # take the default action as if no handler had been installed
+        signal.signal(signal.SIGALRM, signal.SIG_DFL)
+        signal.raise_signal(signal.SIGALRM)
+
+
+def _signals_available() -> bool:
+    """Return True if SIGALRM-based timeouts can be used from the current thread."""
+    return hasattr(signal, 'SIGALRM') and threading.current_thread() is threading.main_thread()
+
+
+def _get_worker_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the shared worker pool, creating it on first use."""
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            _worker_pool = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="timeout-worker")
+        return _worker_pool
+
+
+def _interrupt_thread(thread_id: int, exception: Optional[type]) -> None:
+    """
+    Asynchronously raise an exception in another thread (CPython only).
+    
+    Args:
+        thread_id: Identifier of the target thread (threading.get_ident())
+        exception: Exception class to raise, or None to clear a pending one
+    """
+    try:
+        set_async_exc = ctypes.pythonapi.PyThreadState_SetAsyncExc
+    except AttributeError:
+        return
+    set_async_exc(ctypes.c_ulong(thread_id),
+                  ctypes.py_object(exception) if exception is not None else None)
+
+
 # Global timeout manager instance
 default_timeout_manager = TimeoutManager()
 
@@ -5,19 +5,21 @@ This module defines the core data structures used throughout the system
 for representing problem instances, benchmark results, and algorithm configurations.
 """
 
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional, Type
 from core.base_solver import BaseSolver
 
 
-@dataclass
+@dataclass(slots=True)
 class ProblemInstance:
     """
     Represents a problem instance for benchmarking.
     
     This class encapsulates all the information needed to describe a specific
     problem instance, including its type, size, parameters, and actual data.
+    Instances use __slots__, since benchmark runs can hold many of them.
     """
     problem_type: str
     """The type of problem (e.g., 'SAT', 'SubsetSum', 'TSP')"""
@@ -33,15 +35,21 @@ class ProblemInstance:
     
     metadata: Dict[str, Any]
     """Additional metadata about the problem instance"""
+    
+    def __post_init__(self):
+        # Only a handful of problem types exist, so share one string object
+        if isinstance(self.problem_type, str):
+            self.problem_type = sys.intern(self.problem_type)
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """
     Represents the result of running a benchmark on a problem instance.
     
     This class captures all relevant information about a benchmark run,
-    including timing, solution status, and resource usage.
+    including timing, solution status, and resource usage. Instances use
+    __slots__, since a benchmark run can produce tens of thousands of them.
     """
     algorithm_name: str
     """Name of the algorithm that was benchmarked"""
@@ -66,6 +74,11 @@ class BenchmarkResult:
     
     timestamp: datetime
     """When the benchmark was executed"""
+    
+    def __post_init__(self):
+        # Results of one algorithm share a single name string
+        if isinstance(self.algorithm_name, str):
+            self.algorithm_name = sys.intern(self.algorithm_name)
 
 
 @dataclass
@@ -10,6 +10,11 @@ from core.base_solver import BaseSolver
 from generators.sat_generator import SATInstance
 
 
+# Number of low-order variables whose assignments the brute-force solver
+# evaluates together as one truth-table block (2^16 bits = 8 KiB per column)
+_BLOCK_VARIABLES = 16
+
+
 class SATBruteForceSolver(BaseSolver):
     """
     Brute-force SAT solver using exhaustive truth table evaluation.
@@ -30,42 +35,32 @@ class SATBruteForceSolver(BaseSolver):
             Dict containing:
                 - 'satisfiable': bool indicating if the instance is satisfiable
                 - 'assignment': List[bool] with the satisfying assignment (if found)
-                - 'assignments_tried': int number of assignments evaluated
+                - 'assignments_tried': int number of assignments up to and including
+                  the first satisfying one in enumeration order (2^n if none).
+                  Derived from the solution's position rather than counted.
         """
         if not isinstance(problem_instance, SATInstance):
             raise TypeError("Expected SATInstance, got {}".format(type(problem_instance)))
         
         num_variables = problem_instance.num_variables
-        clauses = problem_instance.clauses
-        assignments_tried = 0
+        clause_masks = _compile_clause_masks(problem_instance.clauses)
         
-        # Try all possible truth assignments (2^n possibilities)
-        for assignment_int in range(2 ** num_variables):
-            assignments_tried += 1
-            
-            # Convert integer to binary assignment
-            # assignment_int = 0 -> [False, False, ..., False]
-            # assignment_int = 1 -> [False, False, ..., True]
-            # etc.
-            assignment = []
-            temp = assignment_int
-            for _ in range(num_variables):
-                assignment.append(bool(temp & 1))
-                temp >>= 1
-            
-            # Check if this assignment satisfies all clauses
-            if self._evaluate_assignment(assignment, clauses):
-                return {
-                    'satisfiable': True,
-                    'assignment': assignment,
-                    'assignments_tried': assignments_tried
-                }
+        assignment_int = _first_satisfying_assignment(clause_masks, num_variables)
+        if assignment_int is not None:
+            # The first satisfying assignment in enumeration order was the
+            # (index + 1)-th one tried
+            assignment = [bool((assignment_int >> i) & 1) for i in range(num_variables)]
+            return {
+                'satisfiable': True,
+                'assignment': assignment,
+                'assignments_tried': assignment_int + 1
+            }
         
         # No satisfying assignment found
         return {
             'satisfiable': False,
             'assignment': None,
-            'assignments_tried': assignments_tried
+            'assignments_tried': 2 ** num_variables
         }
     
     def _evaluate_assignment(self, assignment: List[bool], clauses: List[List[int]]) -> bool:
@@ -79,31 +74,8 @@ class SATBruteForceSolver(BaseSolver):
         Returns:
             bool: True if all clauses are satisfied, False otherwise
         """
-        for clause in clauses:
-            clause_satisfied = False
-            
-            # Check each literal in the clause
-            for literal in clause:
-                variable_index = abs(literal) - 1  # Convert to 0-based index
-                variable_value = assignment[variable_index]
-                
-                if literal > 0:
-                    # Positive literal: satisfied if variable is True
-                    if variable_value:
-                        clause_satisfied = True
-                        break
-                else:
-                    # Negative literal: satisfied if variable is False
-                    if not variable_value:
-                        clause_satisfied = True
-                        break
-            
-            # If any clause is not satisfied, the entire formula is not satisfied
-            if not clause_satisfied:
-                return False
-        
-        # All clauses are satisfied
-        return True
+        assignment_bits = _assignment_to_bits(assignment)
+        return _satisfies_clause_masks(assignment_bits, _compile_clause_masks(clauses))
     
     def get_complexity_class(self) -> str:
         """Return the theoretical computational complexity class."""
@@ -114,6 +86,114 @@ class SATBruteForceSolver(BaseSolver):
         return "Brute Force SAT Solver"
 
 
+def _truth_table_columns(num_variables: int) -> Tuple[List[int], int]:
+    """
+    Build the truth-table column of every variable as a Python integer.
+    
+    Bit a of column i is set when assignment a (an integer from 0 to 2^n - 1)
+    sets variable i+1 to True, i.e. when bit i of a is set. Each column is a
+    repeating run of 2^i zeros followed by 2^i ones, built by repeatedly
+    doubling one period with shifts instead of a loop over all 2^n assignments.
+    
+    Args:
+        num_variables: Number of boolean variables n
+    
+    Returns:
+        Tuple of (columns, all_assignments) where all_assignments is the
+        column with every one of the 2^n bits set
+    """
+    num_assignments = 1 << num_variables
+    all_assignments = (1 << num_assignments) - 1
+    columns = []
+    
+    for i in range(num_variables):
+        run = 1 << i
+        period = run << 1
+        column = ((1 << run) - 1) << run  # 2^i zeros, then 2^i ones
+        length = period
+        while length < num_assignments:
+            column |= column << length
+            length <<= 1
+        columns.append(column)
+    
+    return columns, all_assignments
+
+
+def _first_satisfying_assignment(clause_masks: List[Tuple[int, int]],
+                                 num_variables: int) -> Optional[int]:
+    """
+    Find the lowest-numbered assignment satisfying every clause.
+    
+    This is the brute-force kernel. It works only on integers, so it is
+    independent of how clauses are represented elsewhere.
+    
+    The truth table is evaluated one block at a time. Bit a of a
+    truth-table column is the value of that column's expression under
+    assignment a (assignment a sets variable i+1 to bit i of a), so Python's
+    big-int AND/OR operate on a whole block of assignments in parallel. A
+    block fixes the variables above the low ones, so each clause is either
+    already satisfied by its high literals or reduces to the column of its
+    low literals.
+    
+    Args:
+        clause_masks: Clause masks from _compile_clause_masks
+        num_variables: Number of boolean variables n
+    
+    Returns:
+        The satisfying assignment as an integer (bit i = variable i+1),
+        or None if the clauses are unsatisfiable
+    """
+    low_count = min(num_variables, _BLOCK_VARIABLES)
+    columns, block_assignments = _truth_table_columns(low_count)
+    low_mask = (1 << low_count) - 1
+    
+    # Clauses over low variables only are the same in every block
+    always_satisfying = block_assignments
+    split_clauses = []
+    
+    for positive_mask, negative_mask in clause_masks:
+        low_column = 0
+        
+        low_positive = positive_mask & low_mask
+        while low_positive:
+            lowest = low_positive & -low_positive
+            low_column |= columns[lowest.bit_length() - 1]
+            low_positive ^= lowest
+        
+        low_negative = negative_mask & low_mask
+        while low_negative:
+            lowest = low_negative & -low_negative
+            low_column |= block_assignments ^ columns[lowest.bit_length() - 1]
+            low_negative ^= lowest
+        
+        high_positive = positive_mask >> low_count
+        high_negative = negative_mask >> low_count
+        if high_positive or high_negative:
+            split_clauses.append((low_column, high_positive, high_negative))
+        else:
+            always_satisfying &= low_column
+    
+    if not always_satisfying:
+        return None
+    
+    for high_bits in range(1 << (num_variables - low_count)):
+        satisfying = always_satisfying
+        
+        for low_column, high_positive, high_negative in split_clauses:
+            if not ((high_bits & high_positive) | (~high_bits & high_negative)):
+                satisfying &= low_column
+                if not satisfying:
+                    # No assignment in this block survives
+                    break
+        
+        if satisfying:
+            # The lowest set bit is the first satisfying assignment in the block
+            low_bits = (satisfying & -satisfying).bit_length() - 1
+            return (high_bits << low_count) | low_bits
+    
+    return None
+
+
 class SATResult:
     """
     Container for SAT solver results with additional utility methods.
@@ -162,8 +242,9 @@ class SATOptimizedSolver(BaseSolver):
     Optimized SAT solver using DPLL-style algorithm.
     
     This solver implements the Davis-Putnam-Logemann-Loveland (DPLL) algorithm
-    with unit propagation and pure literal elimination. While still exponential
-    in the worst case, it performs much better than brute force on many instances.
+    with unit propagation, pure literal elimination and Jeroslow-Wang
+    branching. While still exponential in the worst case, it performs much
+    better than brute force on many instances.
     """
     
     def solve(self, problem_instance: SATInstance) -> Dict:
@@ -188,11 +269,9 @@ class SATOptimizedSolver(BaseSolver):
         self.unit_propagations = 0
         self.pure_eliminations = 0
         
-        # Convert clauses to a more convenient format for DPLL
-        clauses = [clause[:] for clause in problem_instance.clauses]  # Deep copy
-        assignment = [None] * problem_instance.num_variables  # None = unassigned
-        
-        result = self._dpll(clauses, assignment)
+        self._initialize_search(problem_instance)
+        result = self._dpll()
+        assignment = self._assignment
         
         if result:
             return {
@@ -211,170 +290,317 @@ class SATOptimizedSolver(BaseSolver):
                 'pure_eliminations': self.pure_eliminations
             }
     
-    def _dpll(self, clauses: List[List[int]], assignment: List[Optional[bool]]) -> bool:
+    def _initialize_search(self, problem_instance: SATInstance) -> None:
         """
-        Recursive DPLL algorithm implementation.
+        Build the search state shared by the whole DPLL run.
         
-        Args:
-            clauses: Current set of clauses (modified during recursion)
-            assignment: Current partial assignment
+        The clauses are stored once and never copied. Unit propagation uses
+        two watched literals per clause (the first two positions of the
+        clause): assigning a literal only visits the clauses watching its
+        negation, and watches need no undo on backtrack. Satisfied clauses
+        are tracked separately through per-literal occurrence lists, which
+        drive the all-satisfied check and pure literal detection. Assigned
+        literals are pushed onto a trail, and backtracking undoes them in
+        reverse order.
         
-        Returns:
-            bool: True if satisfiable, False otherwise
+        Args:
+            problem_instance: The SATInstance being solved
         """
-        # Remove satisfied clauses and simplify remaining clauses
-        clauses = self._simplify_clauses(clauses, assignment)
+        num_variables = problem_instance.num_variables
         
-        # Check for empty clause (unsatisfiable)
-        if any(len(clause) == 0 for clause in clauses):
-            return False
+        # Drop repeated literals within a clause
+        clauses = [list(dict.fromkeys(clause)) for clause in problem_instance.clauses]
         
-        # Check if all clauses are satisfied
-        if len(clauses) == 0:
-            return True
-        
-        # Unit propagation
-        unit_literal = self._find_unit_literal(clauses)
-        if unit_literal is not None:
-            self.unit_propagations += 1
-            var_index = abs(unit_literal) - 1
-            assignment[var_index] = unit_literal > 0
-            return self._dpll(clauses, assignment)
-        
-        # Pure literal elimination
-        pure_literal = self._find_pure_literal(clauses)
-        if pure_literal is not None:
-            self.pure_eliminations += 1
-            var_index = abs(pure_literal) - 1
-            assignment[var_index] = pure_literal > 0
-            return self._dpll(clauses, assignment)
-        
-        # Choose a variable to branch on (first unassigned variable)
-        branch_var = self._choose_branch_variable(assignment)
-        if branch_var is None:
-            return True  # All variables assigned and no conflicts
-        
-        # Try positive assignment first
-        self.assignments_tried += 1
-        assignment_copy = assignment[:]
-        assignment_copy[branch_var - 1] = True
-        if self._dpll(clauses, assignment_copy):
-            # Copy successful assignment back
-            assignment[:] = assignment_copy
-            return True
-        
-        # Try negative assignment
-        self.assignments_tried += 1
-        assignment_copy = assignment[:]
-        assignment_copy[branch_var - 1] = False
-        if self._dpll(clauses, assignment_copy):
-            # Copy successful assignment back
-            assignment[:] = assignment_copy
-            return True
-        
-        return False
-    
-    def _simplify_clauses(self, clauses: List[List[int]], assignment: List[Optional[bool]]) -> List[List[int]]:
+        # Literal-indexed tables have 2n + 1 slots: literal v is stored at
+        # index v and literal -v at index -v, which Python maps to the
+        # upper half of the list
+        occurrences = [[] for _ in range(2 * num_variables + 1)]
+        watches = [[] for _ in range(2 * num_variables + 1)]
+        for clause_id, clause in enumerate(clauses):
+            for literal in clause:
+                occurrences[literal].append(clause_id)
+            for literal in clause[:2]:
+                watches[literal].append(clause_id)
+        
+        # Number of unsatisfied clauses containing each literal, mirrored
+        # by the presence bitsets used for pure literal detection
+        literal_count = [len(clause_ids) for clause_ids in occurrences]
+        positive_present = 0
+        negative_present = 0
+        for var in range(1, num_variables + 1):
+            if literal_count[var]:
+                positive_present |= 1 << var
+            if literal_count[-var]:
+                negative_present |= 1 << var
+        
+        # Jeroslow-Wang weights 2^-|C|, scaled by 2^k (k = longest clause)
+        # so that literal scores are exact integers
+        longest = max((len(clause) for clause in clauses), default=0)
+        clause_weight = [1 << (longest - len(clause)) for clause in clauses]
+        literal_weight = [0] * (2 * num_variables + 1)
+        for clause_id, clause in enumerate(clauses):
+            for literal in clause:
+                literal_weight[literal] += clause_weight[clause_id]
+        
+        self._clauses = clauses
+        self._occurrences = occurrences
+        self._watches = watches
+        self._true_count = [0] * len(clauses)  # true literals per clause
+        self._literal_count = literal_count
+        self._clause_weight = clause_weight
+        self._literal_weight = literal_weight  # Jeroslow-Wang score over unsatisfied clauses
+        self._positive_present = positive_present
+        self._negative_present = negative_present
+        self._unassigned_variables = ((1 << num_variables) - 1) << 1  # bit v for variable v
+        self._unsatisfied = len(clauses)
+        self._value = [None] * (2 * num_variables + 1)  # literal-indexed truth values
+        self._trail = []
+        self._propagated = 0  # trail entries whose watches have been processed
+        self._assignment = [None] * num_variables  # None = unassigned
+    
+    def _dpll(self) -> bool:
         """
-        Simplify clauses based on current assignment.
+        Iterative DPLL search over the shared search state.
         
-        Args:
-            clauses: List of clauses to simplify
-            assignment: Current variable assignment
+        A stack of decisions replaces recursion: each entry holds the trail
+        length before the decision, the literal chosen and whether it is
+        already the second branch. On a conflict the most recent decision
+        still on its first branch is flipped, discarding everything assigned
+        after it.
         
         Returns:
-            List of simplified clauses
+            bool: True if satisfiable, False otherwise
         """
-        simplified = []
-        
-        for clause in clauses:
-            new_clause = []
-            clause_satisfied = False
-            
-            for literal in clause:
-                var_index = abs(literal) - 1
-                var_value = assignment[var_index]
+        # Unit clauses and empty clauses are never watched, so handle
+        # them before the search starts
+        for clause in self._clauses:
+            if not clause:
+                return False
+            if len(clause) == 1:
+                literal = clause[0]
+                if self._value[literal] is False:
+                    return False
+                if self._value[literal] is None:
+                    self.unit_propagations += 1
+                    self._assign(literal)
+        
+        decisions = []
+        
+        while True:
+            if self._propagate():
+                # Check if all clauses are satisfied
+                if self._unsatisfied == 0:
+                    return True
                 
-                if var_value is None:
-                    # Variable not assigned yet, keep literal
-                    new_clause.append(literal)
-                elif (literal > 0 and var_value) or (literal < 0 and not var_value):
-                    # Literal is satisfied, entire clause is satisfied
-                    clause_satisfied = True
-                    break
-                # If literal is false, don't add it to new_clause
+                branch_literal = self._choose_branch_literal()
+                decisions.append((len(self._trail), branch_literal, False))
+                self.assignments_tried += 1
+                self._assign(branch_literal)
+                continue
             
-            if not clause_satisfied:
-                simplified.append(new_clause)
-        
-        return simplified
+            # Conflict: flip the most recent decision with an untried branch
+            while decisions:
+                trail_mark, literal, flipped = decisions.pop()
+                self._backtrack(trail_mark)
+                if not flipped:
+                    decisions.append((trail_mark, -literal, True))
+                    self.assignments_tried += 1
+                    self._assign(-literal)
+                    break
+            else:
+                return False
     
-    def _find_unit_literal(self, clauses: List[List[int]]) -> Optional[int]:
+    def _choose_branch_literal(self) -> int:
         """
-        Find a unit literal (clause with only one unassigned literal).
+        Choose the literal to branch on with the two-sided Jeroslow-Wang rule.
         
-        Args:
-            clauses: List of clauses to search
+        Each literal scores the sum of 2^-|C| over the unsatisfied clauses C
+        containing it. The unassigned variable with the highest combined
+        score for both polarities is chosen, and its higher-scoring literal
+        is tried first. Ties go to the lowest variable and to the positive
+        literal, which reproduces first-unassigned branching when all scores
+        are equal.
         
         Returns:
-            The unit literal if found, None otherwise
+            int: The literal to assign first
         """
-        for clause in clauses:
-            if len(clause) == 1:
-                return clause[0]
-        return None
+        literal_weight = self._literal_weight
+        value = self._value
+        branch_literal = None
+        best_score = -1
+        
+        for var in range(1, len(self._assignment) + 1):
+            if value[var] is None:
+                positive_score = literal_weight[var]
+                negative_score = literal_weight[-var]
+                if positive_score + negative_score > best_score:
+                    best_score = positive_score + negative_score
+                    branch_literal = var if positive_score >= negative_score else -var
+        
+        return branch_literal
     
-    def _find_pure_literal(self, clauses: List[List[int]]) -> Optional[int]:
+    def _propagate(self) -> bool:
         """
-        Find a pure literal (variable that appears only in positive or only in negative form).
-        
-        Args:
-            clauses: List of clauses to search
+        Apply unit propagation and pure literal elimination until neither applies.
         
         Returns:
-            A pure literal if found, None otherwise
+            bool: False if a clause became falsified, True otherwise
         """
-        literal_occurrences = set()
+        trail = self._trail
+        
+        while True:
+            # Unit propagation over the watches of newly assigned literals
+            while self._propagated < len(trail):
+                literal = trail[self._propagated]
+                self._propagated += 1
+                if not self._propagate_literal(literal):
+                    return False
+            
+            # Check if all clauses are satisfied
+            if self._unsatisfied == 0:
+                return True
+            
+            # Pure literal elimination
+            pure_literal = _lowest_pure_literal(
+                self._positive_present, self._negative_present, self._unassigned_variables
+            )
+            if pure_literal is None:
+                return True
+            
+            self.pure_eliminations += 1
+            self._assign(pure_literal)
+    
+    def _propagate_literal(self, literal: int) -> bool:
+        """
+        Visit the clauses watching a literal's negation after it became true.
         
-        # Collect all literals that appear
-        for clause in clauses:
-            for literal in clause:
-                literal_occurrences.add(literal)
+        Each clause either moves its watch to another literal that is not
+        false, or is unit (its other watch gets assigned) or falsified.
         
-        # Find variables that appear only in one polarity
-        variables_checked = set()
-        for literal in literal_occurrences:
-            var = abs(literal)
-            if var in variables_checked:
-                continue
+        Args:
+            literal: The literal that was made true
+        
+        Returns:
+            bool: False if a clause became falsified, True otherwise
+        """
+        false_literal = -literal
+        clauses = self._clauses
+        watches = self._watches
+        value = self._value
+        watching = watches[false_literal]
+        kept = []
+        
+        for position, clause_id in enumerate(watching):
+            clause = clauses[clause_id]
             
-            variables_checked.add(var)
+            # Keep the falsified watch in position 1
+            if clause[0] == false_literal:
+                clause[0], clause[1] = clause[1], false_literal
+            other = clause[0]
             
-            # Check if both positive and negative forms exist
-            has_positive = var in literal_occurrences
-            has_negative = -var in literal_occurrences
+            if value[other] is True:
+                kept.append(clause_id)
+                continue
             
-            if has_positive and not has_negative:
-                return var  # Return positive literal
-            elif has_negative and not has_positive:
-                return -var  # Return negative literal
+            # Look for a replacement watch that is not false
+            for index in range(2, len(clause)):
+                candidate = clause[index]
+                if value[candidate] is not False:
+                    clause[1], clause[index] = candidate, false_literal
+                    watches[candidate].append(clause_id)
+                    break
+            else:
+                kept.append(clause_id)
+                if value[other] is False:
+                    # Conflict: keep the remaining watches untouched
+                    kept.extend(watching[position + 1:])
+                    watches[false_literal] = kept
+                    return False
+                
+                # Unit clause: the other watch must be true
+                self.unit_propagations += 1
+                self._assign(other)
         
-        return None
+        watches[false_literal] = kept
+        return True
+    
+    def _assign(self, literal: int) -> None:
+        """
+        Make a literal true and mark the clauses containing it as satisfied.
+        
+        Args:
+            literal: The literal to make true
+        """
+        var = abs(literal)
+        self._assignment[var - 1] = literal > 0
+        self._value[literal] = True
+        self._value[-literal] = False
+        self._unassigned_variables &= ~(1 << var)
+        self._trail.append(literal)
+        
+        # Newly satisfied clauses stop counting towards pure literal
+        # detection and branching scores
+        true_count = self._true_count
+        literal_count = self._literal_count
+        literal_weight = self._literal_weight
+        for clause_id in self._occurrences[literal]:
+            true_count[clause_id] += 1
+            if true_count[clause_id] == 1:
+                self._unsatisfied -= 1
+                weight = self._clause_weight[clause_id]
+                for clause_literal in self._clauses[clause_id]:
+                    literal_weight[clause_literal] -= weight
+                    literal_count[clause_literal] -= 1
+                    if not literal_count[clause_literal]:
+                        if clause_literal > 0:
+                            self._positive_present &= ~(1 << clause_literal)
+                        else:
+                            self._negative_present &= ~(1 << -clause_literal)
     
-    def _choose_branch_variable(self, assignment: List[Optional[bool]]) -> Optional[int]:
+    def _unassign(self, literal: int) -> None:
         """
-        Choose the next variable to branch on.
+        Undo _assign for a literal, restoring the clause counters.
         
         Args:
-            assignment: Current assignment
+            literal: The literal to unassign (must be the last one assigned)
+        """
+        true_count = self._true_count
+        literal_count = self._literal_count
+        literal_weight = self._literal_weight
+        for clause_id in self._occurrences[literal]:
+            true_count[clause_id] -= 1
+            if not true_count[clause_id]:
+                self._unsatisfied += 1
+                weight = self._clause_weight[clause_id]
+                for clause_literal in self._clauses[clause_id]:
+                    literal_weight[clause_literal] += weight
+                    literal_count[clause_literal] += 1
+                    if literal_count[clause_literal] == 1:
+                        if clause_literal > 0:
+                            self._positive_present |= 1 << clause_literal
+                        else:
+                            self._negative_present |= 1 << -clause_literal
+        
+        var = abs(literal)
+        self._assignment[var - 1] = None
+        self._value[literal] = None
+        self._value[-literal] = None
+        self._unassigned_variables |= 1 << var
+    
+    def _backtrack(self, trail_mark: int) -> None:
+        """
+        Undo assignments until the trail is back to the given length.
         
-        Returns:
-            Variable number (1-indexed) to branch on, or None if all assigned
+        Args:
+            trail_mark: Trail length to restore
         """
-        for i, value in enumerate(assignment):
-            if value is None:
-                return i + 1  # Return 1-indexed variable number
-        return None
+        trail = self._trail
+        while len(trail) > trail_mark:
+            self._unassign(trail.pop())
+        
+        # Everything left on the trail was fully propagated before the
+        # decision that is being undone
+        self._propagated = len(trail)
     
     def get_complexity_class(self) -> str:
         """Return the theoretical computational complexity class."""
@@ -385,6 +611,102 @@ class SATOptimizedSolver(BaseSolver):
         return "DPLL SAT Solver"
 
 
+def _compile_clause_masks(clauses: List[List[int]]) -> List[Tuple[int, int]]:
+    """
+    Compile clauses into (positive_mask, negative_mask) bit pairs.
+    
+    Bit i of a mask stands for variable i+1, so with the assignment packed
+    the same way a clause is satisfied exactly when
+    (assignment & positive_mask) | (~assignment & negative_mask) is nonzero.
+    Python integers have no fixed width, so this works for any number of
+    variables.
+    
+    Args:
+        clauses: List of clauses, each containing literals
+    
+    Returns:
+        One (positive_mask, negative_mask) pair per clause
+    """
+    masks = []
+    
+    for clause in clauses:
+        positive_mask = 0
+        negative_mask = 0
+        for literal in clause:
+            if literal > 0:
+                positive_mask |= 1 << (literal - 1)
+            else:
+                negative_mask |= 1 << (-literal - 1)
+        masks.append((positive_mask, negative_mask))
+    
+    return masks
+
+
+def _assignment_to_bits(assignment: List[bool]) -> int:
+    """
+    Pack a truth assignment into an integer (bit i = variable i+1).
+    
+    Args:
+        assignment: List of boolean values for variables (indexed from 0)
+    
+    Returns:
+        int: The packed assignment
+    """
+    assignment_bits = 0
+    for index, value in enumerate(assignment):
+        if value:
+            assignment_bits |= 1 << index
+    return assignment_bits
+
+
+def _satisfies_clause_masks(assignment_bits: int, clause_masks: List[Tuple[int, int]]) -> bool:
+    """
+    Check a packed assignment against compiled clause masks.
+    
+    Each clause costs one branch on its combined result, however many
+    literals it has; there is no per-literal sign or value test.
+    
+    Args:
+        assignment_bits: Packed assignment from _assignment_to_bits
+        clause_masks: Clause masks from _compile_clause_masks
+    
+    Returns:
+        bool: True if every clause has a true literal, False otherwise
+    """
+    inverted_bits = ~assignment_bits
+    for positive_mask, negative_mask in clause_masks:
+        if not ((assignment_bits & positive_mask) | (inverted_bits & negative_mask)):
+            return False
+    return True
+
+
+def _lowest_pure_literal(positive_present: int, negative_present: int,
+                         candidates: int) -> Optional[int]:
+    """
+    Pick a pure literal from literal presence bitsets.
+    
+    Bit v of positive_present (negative_present) records that variable v
+    occurs positively (negatively); variables set in exactly one of them
+    are pure.
+    
+    Args:
+        positive_present: Bitset of variables occurring positively
+        negative_present: Bitset of variables occurring negatively
+        candidates: Bitset of variables that may be chosen (-1 for all)
+    
+    Returns:
+        The pure literal of the lowest-numbered pure candidate, or None
+    """
+    pure_variables = (positive_present ^ negative_present) & candidates
+    if not pure_variables:
+        return None
+    
+    var = (pure_variables & -pure_variables).bit_length() - 1
+    if (positive_present >> var) & 1:
+        return var  # Return positive literal
+    return -var  # Return negative literal
+
+
 def verify_sat_solution(sat_instance: SATInstance, assignment: List[bool]) -> bool:
     """
     Verify that a given assignment satisfies a SAT instance.
@@ -408,25 +730,60 @@ def verify_sat_solution(sat_instance: SATInstance, assignment: List[bool]) -> bo
             f"number of variables ({sat_instance.num_variables})"
         )
     
+    assignment_bits = _assignment_to_bits(assignment)
+    return _satisfies_clause_masks(assignment_bits, _compile_clause_masks(sat_instance.clauses))
+
+
+def verify_sat_solutions(sat_instance: SATInstance, assignments: List[List[bool]]) -> List[bool]:
+    """
+    Verify many candidate assignments against a SAT instance at once.
+    
+    The candidates are bit-sliced: bit b of variable i's column is the value
+    of variable i+1 in candidate b, so each clause is evaluated for every
+    candidate with a few big-int AND/OR operations instead of one Python
+    loop per candidate.
+    
+    Args:
+        sat_instance: The SAT instance to verify against
+        assignments: The truth assignments to verify
+    
+    Returns:
+        List[bool]: For each assignment, whether it satisfies all clauses
+    
+    Raises:
+        ValueError: If an assignment's length doesn't match number of variables
+    """
+    num_variables = sat_instance.num_variables
+    
+    for assignment in assignments:
+        if len(assignment) != num_variables:
+            raise ValueError(
+                f"Assignment length ({len(assignment)}) doesn't match "
+                f"number of variables ({num_variables})"
+            )
+    
+    if not assignments:
+        return []
+    
+    # Column i holds variable i+1 across all candidates (bit b = candidate b)
+    all_candidates = (1 << len(assignments)) - 1
+    columns = [
+        int(''.join('1' if values[i] else '0' for values in reversed(assignments)), 2)
+        for i in range(num_variables)
+    ]
+    
+    satisfying = all_candidates
     for clause in sat_instance.clauses:
-        clause_satisfied = False
-        
+        clause_column = 0
         for literal in clause:
-            variable_index = abs(literal) - 1
-            variable_value = assignment[variable_index]
-            
+            column = columns[abs(literal) - 1]
             if literal > 0:
-                # Positive literal
-                if variable_value:
-                    clause_satisfied = True
-                    break
+                clause_column |= column
             else:
-                # Negative literal
-                if not variable_value:
-                    clause_satisfied = True
-                    break
+                clause_column |= all_candidates ^ column
         
-        if not clause_satisfied:
-            return False
+        satisfying &= clause_column
+        if not satisfying:
+            break
     
-    return True
\ No newline at end of file
+    return [bool((satisfying >> b) & 1) for b in range(len(assignments))]
@@ -5,11 +5,105 @@ This module provides different algorithms for solving the Subset Sum problem,
 including brute-force and optimized approaches for educational and benchmarking purposes.
 """
 
-from typing import List, Optional, Dict, Set, Tuple
+import math
+from collections import Counter
+from typing import Iterator, List, Optional, Dict, Sequence, Set, Tuple, Union
 from core.base_solver import BaseSolver
 from generators.subset_generator import SubsetSumInstance
 
 
+# Maximum number of low-order elements whose subsets
+# find_all_subset_sum_solutions_iter tabulates once and reuses for every
+# combination of the remaining elements (2^16 table entries)
+_BLOCK_ELEMENTS = 16
+
+# Number of low-order elements whose subset sums _gray_code_sums reads from
+# a lookup table instead of updating one step at a time
+_LOOKUP_ELEMENTS = 8
+
+
+def _gray_code_sums(numbers: List[int]) -> Iterator[int]:
+    """
+    Yield the sums of all subsets of numbers in Gray-code order.
+    
+    Step k yields the sum of the subset with mask k ^ (k >> 1). The sums
+    of the lowest 8 elements are looked up in a 256-entry table of their
+    own Gray-code sums, read forwards or backwards as the reflected code
+    requires. Only the remaining elements are flipped one step at a time
+    (once per 256 subsets), each step deriving the sum from the previous
+    one in O(1).
+    
+    Args:
+        numbers: The elements to form subsets of
+    
+    Yields:
+        int: The sum of each of the 2^n subsets in turn
+    """
+    low_count = min(len(numbers), _LOOKUP_ELEMENTS)
+    low_sums = _gray_code_sum_table(numbers[:low_count])
+    reversed_low_sums = low_sums[::-1]
+    high_numbers = numbers[low_count:]
+    subset_mask = 0
+    high_sum = 0
+    
+    for step in range(2 ** len(high_numbers)):
+        if step:
+            # Flip the element at the lowest set bit of the step number
+            i = (step & -step).bit_length() - 1
+            if subset_mask >> i & 1:
+                high_sum -= high_numbers[i]
+            else:
+                high_sum += high_numbers[i]
+            subset_mask ^= 1 << i
+        
+        yield from map(high_sum.__add__, reversed_low_sums if step & 1 else low_sums)
+
+
+def _gray_code_sum_table(numbers: List[int]) -> List[int]:
+    """
+    List the sums of all subsets of numbers in Gray-code order.
+    
+    Produces the same sequence as _gray_code_sums, but builds it by
+    reflection: the reflected Gray code over j + 1 elements is the code over
+    j elements followed by its reverse with element j added. Each element
+    therefore costs one list comprehension rather than an interpreter
+    iteration per subset.
+    
+    Args:
+        numbers: The elements to form subsets of
+    
+    Returns:
+        List[int]: The 2^n subset sums, indexed by Gray-code step
+    """
+    sums = [0]
+    for number in numbers:
+        sums += [subset_sum + number for subset_sum in reversed(sums)]
+    return sums
+
+
+def _mask_indices(subset_mask: int) -> List[int]:
+    """
+    List the positions of the set bits of a subset mask, lowest first.
+    
+    Reads the binary digits of the mask instead of testing every position,
+    so only the final filter runs per bit in the interpreter.
+    
+    Args:
+        subset_mask: Bitmask with bit i set when element i is in the subset
+    
+    Returns:
+        List[int]: The indices of the elements in the subset
+    """
+    # bin() puts the lowest bit last; the reversed '0b' prefix never matches
+    return [i for i, bit in enumerate(reversed(bin(subset_mask))) if bit == '1']
+
+
+def _low_block_size(n: int) -> int:
+    """Return how many low elements to tabulate for a set of n elements."""
+    # Splitting evenly minimises table size plus number of blocks
+    return min((n + 1) // 2, _BLOCK_ELEMENTS)
+
+
 class SubsetSumBruteForce(BaseSolver):
     """
     Brute-force Subset Sum solver using exhaustive subset enumeration.
@@ -40,31 +134,21 @@ class SubsetSumBruteForce(BaseSolver):
         numbers = problem_instance.numbers
         target = problem_instance.target
         n = len(numbers)
-        subsets_tried = 0
         
-        # Try all possible subsets (2^n possibilities)
-        # Use bit manipulation: each integer from 0 to 2^n-1 represents a subset
-        for subset_mask in range(2 ** n):
-            subsets_tried += 1
-            
-            # Extract subset based on bit mask
-            current_subset = []
-            current_indices = []
-            current_sum = 0
-            
-            for i in range(n):
-                if subset_mask & (1 << i):  # Check if i-th bit is set
-                    current_subset.append(numbers[i])
-                    current_indices.append(i)
-                    current_sum += numbers[i]
-            
-            # Check if this subset sums to the target
-            if current_sum == target:
+        # Try all possible subsets (2^n possibilities) in Gray-code order,
+        # where step k visits the subset with mask k ^ (k >> 1) (bit i set
+        # when numbers[i] is in the subset). Consecutive subsets differ in
+        # one element, so each sum is derived from the previous one in O(1).
+        for step, subset_sum in enumerate(_gray_code_sums(numbers)):
+            # Check if this subset sums to target
+            if subset_sum == target:
+                subset_mask = step ^ (step >> 1)
+                current_indices = _mask_indices(subset_mask)
                 return {
                     'solution_found': True,
-                    'solution_subset': current_subset,
+                    'solution_subset': [numbers[i] for i in current_indices],
                     'solution_indices': current_indices,
-                    'subsets_tried': subsets_tried,
+                    'subsets_tried': step + 1,
                     'target': target
                 }
         
@@ -73,7 +157,7 @@ class SubsetSumBruteForce(BaseSolver):
             'solution_found': False,
             'solution_subset': None,
             'solution_indices': None,
-            'subsets_tried': subsets_tried,
+            'subsets_tried': 2 ** n,
             'target': target
         }
     
@@ -86,24 +170,136 @@ class SubsetSumBruteForce(BaseSolver):
         return "Brute Force Subset Sum Solver"
 
 
+class SubsetSumBranchAndBound(BaseSolver):
+    """
+    Subset Sum solver using depth-first branch and bound.
+    
+    This solver decides the elements one at a time, largest magnitude first,
+    trying to include each element before excluding it. A branch is
+    abandoned as soon as the still undecided elements can no longer bring
+    the running sum to the target. The worst case is still O(2^n), but
+    typical instances explore only a small part of the search tree.
+    """
+    
+    def solve(self, problem_instance: SubsetSumInstance) -> Dict:
+        """
+        Solve the Subset Sum instance using branch and bound.
+        
+        Args:
+            problem_instance: A SubsetSumInstance containing numbers and target
+        
+        Returns:
+            Dict containing:
+                - 'solution_found': bool indicating if a solution exists
+                - 'solution_subset': List[int] with the subset that sums to target (if found)
+                - 'solution_indices': List[int] with indices of solution elements (if found)
+                - 'subsets_tried': int number of partial subsets (search nodes) visited
+                - 'target': int the target sum
+        """
+        if not isinstance(problem_instance, SubsetSumInstance):
+            raise TypeError("Expected SubsetSumInstance, got {}".format(type(problem_instance)))
+        
+        numbers = problem_instance.numbers
+        target = problem_instance.target
+        n = len(numbers)
+        
+        # Decide large elements first: they move the sum the most, so bad
+        # branches are cut close to the root
+        self._order = sorted(range(n), key=lambda i: abs(numbers[i]), reverse=True)
+        self._values = tuple(numbers[i] for i in self._order)
+        
+        # (lowest, highest) sum the undecided elements values[k:] can still
+        # add. The entry for k = n is (0, 0), so the range check alone also
+        # stops the search once every element has been decided.
+        bounds = [(0, 0)]
+        for value in reversed(self._values):
+            lowest, highest = bounds[-1]
+            bounds.append((lowest + min(value, 0), highest + max(value, 0)))
+        self._bounds = tuple(reversed(bounds))
+        
+        self.subsets_tried = 0
+        chosen = []
+        
+        if self._branch_and_bound(0, target, chosen):
+            solution_indices = sorted(self._order[k] for k in chosen)
+            return {
+                'solution_found': True,
+                'solution_subset': [numbers[i] for i in solution_indices],
+                'solution_indices': solution_indices,
+                'subsets_tried': self.subsets_tried,
+                'target': target
+            }
+        
+        # No solution found
+        return {
+            'solution_found': False,
+            'solution_subset': None,
+            'solution_indices': None,
+            'subsets_tried': self.subsets_tried,
+            'target': target
+        }
+    
+    def _branch_and_bound(self, k: int, remaining: int, chosen: List[int]) -> bool:
+        """
+        Search for a subset of the undecided elements summing to remaining.
+        
+        Args:
+            k: Number of elements already decided (in search order)
+            remaining: Target minus the sum of the chosen elements
+            chosen: Search-order positions of the chosen elements (extended in place)
+        
+        Returns:
+            bool: True if a solution was found, False otherwise
+        """
+        self.subsets_tried += 1
+        
+        if remaining == 0:
+            return True
+        
+        # Prune when the undecided elements cannot reach the remaining sum
+        lowest, highest = self._bounds[k]
+        if not lowest <= remaining <= highest:
+            return False
+        
+        # Try including the element first, then excluding it
+        chosen.append(k)
+        if self._branch_and_bound(k + 1, remaining - self._values[k], chosen):
+            return True
+        chosen.pop()
+        
+        return self._branch_and_bound(k + 1, remaining, chosen)
+    
+    def get_complexity_class(self) -> str:
+        """Return the theoretical computational complexity class."""
+        return "NP-Complete (Exponential Time)"
+    
+    def get_algorithm_name(self) -> str:
+        """Return a human-readable name for this algorithm."""
+        return "Branch and Bound Subset Sum Solver"
+
+
 class SubsetSumResult:
     """
     Container for Subset Sum solver results with additional utility methods.
     """
     
-    def __init__(self, solution_found: bool, solution_subset: Optional[List[int]] = None,
-                 solution_indices: Optional[List[int]] = None, subsets_tried: int = 0,
-                 target: int = 0, additional_info: Dict = None):
+    def __init__(self, solution_found: bool, solution_subset: Optional[Sequence[int]] = None,
+                 solution_indices: Optional[Sequence[int]] = None, subsets_tried: int = 0,
+                 target: int = 0, additional_info: Dict = None,
+                 solution_sum: Optional[int] = None):
         """
         Initialize Subset Sum result.
         
         Args:
             solution_found: Whether a solution was found
-            solution_subset: The subset that sums to target (if found)
+            solution_subset: The subset that sums to target (if found); any
+                sequence, such as a list, tuple or array.array, is kept as given
             solution_indices: Indices of solution elements (if found)
             subsets_tried: Number of subsets evaluated
             target: The target sum
             additional_info: Additional solver-specific information
+            solution_sum: Sum of solution_subset, if already known (computed
+                from the subset otherwise)
         """
         self.solution_found = solution_found
         self.solution_subset = solution_subset or []
@@ -111,22 +307,38 @@ class SubsetSumResult:
         self.subsets_tried = subsets_tried
         self.target = target
         self.additional_info = additional_info or {}
+        self.solution_sum = solution_sum if solution_sum is not None else sum(self.solution_subset)
     
     def __str__(self) -> str:
         """Return human-readable string representation."""
         if self.solution_found:
             subset_str = "{" + ", ".join(map(str, self.solution_subset)) + "}"
-            sum_value = sum(self.solution_subset)
-            return f"SOLUTION FOUND: {subset_str} = {sum_value} (tried {self.subsets_tried} subsets)"
+            return f"SOLUTION FOUND: {subset_str} = {self.solution_sum} (tried {self.subsets_tried} subsets)"
         else:
             return f"NO SOLUTION (tried {self.subsets_tried} subsets)"
     
-    def to_dict(self) -> Dict:
-        """Convert result to dictionary format."""
+    def to_dict(self, as_lists: bool = False) -> Dict:
+        """
+        Convert result to dictionary format.
+        
+        Args:
+            as_lists: Copy the subset and indices into new lists instead of
+                returning the stored sequences
+        
+        Returns:
+            Dict with the same keys as the solvers' result dicts, plus any
+            additional information
+        """
+        solution_subset = self.solution_subset
+        solution_indices = self.solution_indices
+        if as_lists:
+            solution_subset = list(solution_subset)
+            solution_indices = list(solution_indices)
+        
         result = {
             'solution_found': self.solution_found,
-            'solution_subset': self.solution_subset,
-            'solution_indices': self.solution_indices,
+            'solution_subset': solution_subset,
+            'solution_indices': solution_indices,
             'subsets_tried': self.subsets_tried,
             'target': self.target
         }
@@ -135,41 +347,108 @@ class SubsetSumResult:
 
 
 def verify_subset_sum_solution(subset_instance: SubsetSumInstance, 
-                              solution_subset: List[int]) -> bool:
+                              solution_subset: Union[Sequence[int], SubsetSumResult]) -> bool:
     """
     Verify that a given subset is a valid solution to a Subset Sum instance.
     
     This is a utility function that can be used to verify solutions
-    from any Subset Sum solver implementation.
+    from any Subset Sum solver implementation. A SubsetSumResult that
+    records the index of every element is checked through its indices,
+    which takes time proportional to the subset rather than the instance.
     
     Args:
         subset_instance: The Subset Sum instance to verify against
-        solution_subset: The subset to verify
+        solution_subset: The subset to verify, or a result holding it
     
     Returns:
         bool: True if the subset sums to the target, False otherwise
     
     Raises:
-        ValueError: If solution contains elements not in the original set
+        ValueError: If solution contains elements not in the original set,
+            or uses an element more often than it occurs there
     """
-    # Check that all elements in solution are from the original set
-    original_numbers = subset_instance.numbers
+    if isinstance(solution_subset, SubsetSumResult):
+        result = solution_subset
+        solution_subset = result.solution_subset
+        if len(result.solution_indices) == len(solution_subset):
+            return _verify_solution_indices(subset_instance, solution_subset,
+                                            result.solution_indices)
+    
+    # Check that all elements in solution are from the original set,
+    # counting multiplicities with hash lookups instead of list scans
+    available = Counter(subset_instance.numbers)
     for element in solution_subset:
-        if element not in original_numbers:
+        if available[element] <= 0:
+            if element in available:
+                raise ValueError(f"Solution uses element {element} more often than it occurs in original set")
             raise ValueError(f"Solution contains element {element} not in original set")
+        available[element] -= 1
     
     # Check that the subset sums to the target
     return sum(solution_subset) == subset_instance.target
 
 
+def _verify_solution_indices(subset_instance: SubsetSumInstance, solution_subset: Sequence[int],
+                             solution_indices: Sequence[int]) -> bool:
+    """
+    Verify a subset against the instance positions it claims to use.
+    
+    Args:
+        subset_instance: The Subset Sum instance to verify against
+        solution_subset: The subset to verify
+        solution_indices: Index of each subset element in the instance
+    
+    Returns:
+        bool: True if the subset sums to the target, False otherwise
+    
+    Raises:
+        ValueError: If an index is out of range or repeated, or does not
+            hold the corresponding subset element
+    """
+    numbers = subset_instance.numbers
+    n = len(numbers)
+    
+    if len(set(solution_indices)) != len(solution_indices):
+        raise ValueError("Solution uses an element of the original set more than once")
+    
+    for index, element in zip(solution_indices, solution_subset):
+        if not 0 <= index < n or numbers[index] != element:
+            raise ValueError(f"Solution contains element {element} not at index {index} of original set")
+    
+    return sum(solution_subset) == subset_instance.target
+
+
+def _extend_reachable_sums(reachable: int, number: int, mask: int) -> int:
+    """
+    Advance a DP row by one element.
+    
+    Args:
+        reachable: Bitset of sums reachable so far (bit j = the j-th
+            tracked sum, counting up from the lowest)
+        number: The element being considered
+        mask: Bitset of the sums tracked by the table
+    
+    Returns:
+        int: The reachable sums with the element either left out or included
+    """
+    if number >= mask.bit_length():
+        # Larger than every tracked sum: including it reaches nothing new
+        return reachable
+    if number >= 0:
+        return reachable | ((reachable << number) & mask)
+    return reachable | (reachable >> -number)
+
+
 class SubsetSumDP(BaseSolver):
     """
     Optimized Subset Sum solver using dynamic programming.
     
     This solver uses a dynamic programming approach with a 2D table to determine
     if a subset sum is possible. The time complexity is O(n * sum) where n is
-    the number of elements and sum is the target value. Space complexity is also
-    O(n * sum), but can be optimized to O(sum) with careful implementation.
+    the number of elements and sum is the target value (plus twice the
+    magnitude of the negative elements, if any). Each table row is a bitset
+    computed with word-parallel shift and OR operations, and only every
+    sqrt(n)-th row is stored, so space is O(sqrt(n) * sum) bits.
     """
     
     def solve(self, problem_instance: SubsetSumInstance) -> Dict:
@@ -204,7 +483,15 @@ class SubsetSumDP(BaseSolver):
                 'target': target
             }
         
-        if target < 0:
+        # With negative elements, partial sums can dip below 0 or rise above
+        # the target and still end at it later. A partial sum never falls
+        # below -negative_total, and anything above target + negative_total
+        # cannot come back down, so bit j of a row stands for the sum
+        # j - offset over that window. Without negative elements the offset
+        # is 0 and the window is just [0, target].
+        offset = -sum(number for number in numbers if number < 0)
+        target_bit = target + offset
+        if target_bit < 0:
             return {
                 'solution_found': False,
                 'solution_subset': None,
@@ -212,44 +499,60 @@ class SubsetSumDP(BaseSolver):
                 'dp_table_size': 0,
                 'target': target
             }
+        table_width = target_bit + offset + 1
         
-        # Create DP table: dp[i][j] = True if subset of first i elements can sum to j
-        # We use (n+1) x (target+1) table for easier indexing
-        dp = [[False for _ in range(target + 1)] for _ in range(n + 1)]
-        
-        # Base case: empty subset sums to 0
-        for i in range(n + 1):
-            dp[i][0] = True
+        # DP table as bitsets: bit j of row i is set if a subset of the
+        # first i elements can sum to j - offset. Python's big-int shifts and
+        # ORs update a whole row per element, one machine word per 64 sums.
+        # Only one row is live while filling; every k-th row is kept as a
+        # checkpoint (k ~ sqrt(n)), so the table takes O(sqrt(n) * target)
+        # bits instead of O(n * target).
+        mask = (1 << table_width) - 1
+        checkpoint_interval = max(1, math.isqrt(n))
+        checkpoints = {0: 1 << offset}  # Base case: empty subset sums to 0
         
-        # Fill the DP table
-        for i in range(1, n + 1):
-            for j in range(1, target + 1):
-                # Option 1: Don't include current element
-                dp[i][j] = dp[i-1][j]
-                
-                # Option 2: Include current element (if it doesn't exceed target)
-                if numbers[i-1] <= j:
-                    dp[i][j] = dp[i][j] or dp[i-1][j - numbers[i-1]]
+        # Fill the DP table. Rows only gain bits, so once the target is
+        # reachable every later row can be skipped: backtracking from row n
+        # would pass over them without taking an element.
+        reachable = 1 << offset
+        filled_rows = 0
+        for number in numbers:
+            reachable = _extend_reachable_sums(reachable, number, mask)
+            filled_rows += 1
+            if filled_rows % checkpoint_interval == 0:
+                checkpoints[filled_rows] = reachable
+            if (reachable >> target_bit) & 1:
+                break
         
         # Check if solution exists
-        if not dp[n][target]:
+        if not (reachable >> target_bit) & 1:
             return {
                 'solution_found': False,
                 'solution_subset': None,
                 'solution_indices': None,
-                'dp_table_size': (n + 1) * (target + 1),
+                'dp_table_size': (n + 1) * table_width,
                 'target': target
             }
         
-        # Reconstruct the solution by backtracking through the DP table
+        # Reconstruct the solution by backtracking through the DP table,
+        # recomputing one segment of rows from its checkpoint at a time
         solution_subset = []
         solution_indices = []
-        i, j = n, target
+        segment_rows = {}
+        i, j = filled_rows, target_bit
         
-        while i > 0 and j > 0:
-            # If dp[i][j] is True but dp[i-1][j] is False,
+        while i > 0 and j != offset:
+            if i - 1 not in segment_rows:
+                start = (i - 1) - (i - 1) % checkpoint_interval
+                segment_rows = {start: checkpoints[start]}
+                row = checkpoints[start]
+                for k in range(start, min(start + checkpoint_interval, filled_rows)):
+                    row = _extend_reachable_sums(row, numbers[k], mask)
+                    segment_rows[k + 1] = row
+            
+            # If sum j is reachable with i elements but not with i-1,
             # then the i-th element must be included
-            if dp[i][j] and not dp[i-1][j]:
+            if not (segment_rows[i - 1] >> j) & 1:
                 solution_subset.append(numbers[i-1])
                 solution_indices.append(i-1)
                 j -= numbers[i-1]
@@ -263,7 +566,7 @@ class SubsetSumDP(BaseSolver):
             'solution_found': True,
             'solution_subset': solution_subset,
             'solution_indices': solution_indices,
-            'dp_table_size': (n + 1) * (target + 1),
+            'dp_table_size': (n + 1) * table_width,
             'target': target
         }
     
@@ -276,6 +579,172 @@ class SubsetSumDP(BaseSolver):
         return "Dynamic Programming Subset Sum Solver"
 
 
+class SubsetSumSparseDP(BaseSolver):
+    """
+    Subset Sum solver using dynamic programming over the reachable sums only.
+    
+    Like SubsetSumDP, this solver tracks the sums the elements seen so far
+    can reach, dropping those that can no longer lead to the target, but it
+    keeps them as a set instead of a row of bits. The time and space complexity are therefore
+    O(n * R), where R is the number of distinct reachable sums, which can be
+    far below the target for instances with few elements and large values.
+    """
+    
+    def solve(self, problem_instance: SubsetSumInstance) -> Dict:
+        """
+        Solve the Subset Sum instance using sparse dynamic programming.
+        
+        Args:
+            problem_instance: A SubsetSumInstance containing numbers and target
+        
+        Returns:
+            Dict containing:
+                - 'solution_found': bool indicating if a solution exists
+                - 'solution_subset': List[int] with the subset that sums to target (if found)
+                - 'solution_indices': List[int] with indices of solution elements (if found)
+                - 'sums_reached': int number of distinct sums reached
+                - 'target': int the target sum
+        """
+        if not isinstance(problem_instance, SubsetSumInstance):
+            raise TypeError("Expected SubsetSumInstance, got {}".format(type(problem_instance)))
+        
+        numbers = problem_instance.numbers
+        target = problem_instance.target
+        
+        # Each reached sum maps to (previous sum, index of the element added
+        # to reach it); the empty subset reaches 0
+        parent = {0: None}
+        
+        # Extend the reached sums by one element at a time, iterating over a
+        # snapshot so that each element is added at most once per subset.
+        # A sum is only worth keeping if the negative elements still to come
+        # can bring it back down to the target; with no negative elements
+        # left, that means not exceeding the target.
+        negative_remaining = -sum(number for number in numbers if number < 0)
+        if target != 0:
+            for i, number in enumerate(numbers):
+                if number < 0:
+                    negative_remaining += number
+                highest = target + negative_remaining
+                for previous_sum in list(parent):
+                    new_sum = previous_sum + number
+                    if new_sum <= highest and new_sum not in parent:
+                        parent[new_sum] = (previous_sum, i)
+                if target in parent:
+                    break
+        
+        # Check if solution exists
+        if target not in parent:
+            return {
+                'solution_found': False,
+                'solution_subset': None,
+                'solution_indices': None,
+                'sums_reached': len(parent),
+                'target': target
+            }
+        
+        # Reconstruct the solution by walking back from the target to 0.
+        # Each step was recorded from a sum reached with earlier elements
+        # only, so the indices come out strictly decreasing.
+        solution_indices = []
+        current_sum = target
+        while parent[current_sum] is not None:
+            current_sum, i = parent[current_sum]
+            solution_indices.append(i)
+        solution_indices.reverse()
+        
+        return {
+            'solution_found': True,
+            'solution_subset': [numbers[i] for i in solution_indices],
+            'solution_indices': solution_indices,
+            'sums_reached': len(parent),
+            'target': target
+        }
+    
+    def get_complexity_class(self) -> str:
+        """Return the theoretical computational complexity class."""
+        return "Pseudo-polynomial Time (O(n * reachable sums))"
+    
+    def get_algorithm_name(self) -> str:
+        """Return a human-readable name for this algorithm."""
+        return "Sparse Dynamic Programming Subset Sum Solver"
+
+
+class SubsetSumMITM(BaseSolver):
+    """
+    Meet-in-the-middle Subset Sum solver (Horowitz-Sahni).
+    
+    This solver splits the numbers into two halves, enumerates the subset
+    sums of each half, and looks up the complement of every sum of the first
+    half among the sums of the second. The time and space complexity are
+    O(2^(n/2)) instead of the O(2^n) of exhaustive enumeration.
+    """
+    
+    def solve(self, problem_instance: SubsetSumInstance) -> Dict:
+        """
+        Solve the Subset Sum instance using meet-in-the-middle approach.
+        
+        Args:
+            problem_instance: A SubsetSumInstance containing numbers and target
+        
+        Returns:
+            Dict containing:
+                - 'solution_found': bool indicating if a solution exists
+                - 'solution_subset': List[int] with the subset that sums to target (if found)
+                - 'solution_indices': List[int] with indices of solution elements (if found)
+                - 'sums_enumerated': int number of half-subset sums computed
+                - 'target': int the target sum
+        """
+        if not isinstance(problem_instance, SubsetSumInstance):
+            raise TypeError("Expected SubsetSumInstance, got {}".format(type(problem_instance)))
+        
+        numbers = problem_instance.numbers
+        target = problem_instance.target
+        n = len(numbers)
+        half = n // 2
+        
+        # Subset sums of each half, indexed by Gray-code step
+        left_sums = _gray_code_sum_table(numbers[:half])
+        right_sums = _gray_code_sum_table(numbers[half:])
+        sums_enumerated = len(left_sums) + len(right_sums)
+        
+        # Later entries overwrite earlier ones, so each sum maps to the
+        # first Gray-code step of the right half that produces it
+        right_position = dict(zip(reversed(right_sums), reversed(range(len(right_sums)))))
+        
+        for left_step, left_sum in enumerate(left_sums):
+            right_step = right_position.get(target - left_sum)
+            if right_step is not None:
+                left_mask = left_step ^ (left_step >> 1)
+                right_mask = right_step ^ (right_step >> 1)
+                subset_mask = left_mask | (right_mask << half)
+                solution_indices = _mask_indices(subset_mask)
+                return {
+                    'solution_found': True,
+                    'solution_subset': [numbers[i] for i in solution_indices],
+                    'solution_indices': solution_indices,
+                    'sums_enumerated': sums_enumerated,
+                    'target': target
+                }
+        
+        # No solution found
+        return {
+            'solution_found': False,
+            'solution_subset': None,
+            'solution_indices': None,
+            'sums_enumerated': sums_enumerated,
+            'target': target
+        }
+    
+    def get_complexity_class(self) -> str:
+        """Return the theoretical computational complexity class."""
+        return "NP-Complete (O(2^(n/2)) Time)"
+    
+    def get_algorithm_name(self) -> str:
+        """Return a human-readable name for this algorithm."""
+        return "Meet-in-the-Middle Subset Sum Solver"
+
+
 def find_all_subset_sum_solutions(subset_instance: SubsetSumInstance) -> List[List[int]]:
     """
     Find all possible solutions to a Subset Sum instance.
@@ -289,22 +758,58 @@ def find_all_subset_sum_solutions(subset_instance: SubsetSumInstance) -> List[Li
     Returns:
         List of all solution subsets (each subset is a List[int])
     """
+    return list(find_all_subset_sum_solutions_iter(subset_instance))
+
+
+def find_all_subset_sum_solutions_iter(subset_instance: SubsetSumInstance,
+                                       limit: Optional[int] = None) -> Iterator[List[int]]:
+    """
+    Generate the solutions to a Subset Sum instance one at a time.
+    
+    Solutions are produced in the same order as find_all_subset_sum_solutions,
+    but only the current one is held in memory, so a caller can stop after
+    the first few on instances with exponentially many solutions.
+    
+    Args:
+        subset_instance: The Subset Sum instance to solve
+        limit: Maximum number of solutions to generate (all if None)
+    
+    Yields:
+        List[int]: Each solution subset in turn
+    """
     numbers = subset_instance.numbers
     target = subset_instance.target
     n = len(numbers)
-    all_solutions = []
     
-    # Try all possible subsets
-    for subset_mask in range(2 ** n):
-        current_subset = []
-        current_sum = 0
-        
-        for i in range(n):
-            if subset_mask & (1 << i):
-                current_subset.append(numbers[i])
-                current_sum += numbers[i]
-        
-        if current_sum == target:
-            all_solutions.append(current_subset)
+    if limit is not None and limit <= 0:
+        return
+    solutions_found = 0
+    
+    # Try all possible subsets in Gray-code order, where step k visits the
+    # subset with mask k ^ (k >> 1). The steps are split into blocks of 2^k:
+    # within a block the high elements are fixed and the low k elements run
+    # through their own Gray code, forwards in even blocks and backwards in
+    # odd ones. One table of low-subset sums therefore lists every solution
+    # in a block with a single lookup.
+    low_count = _low_block_size(n)
+    block_size = 1 << low_count
+    positions_by_sum = {}
+    for position, low_sum in enumerate(_gray_code_sum_table(numbers[:low_count])):
+        positions_by_sum.setdefault(low_sum, []).append(position)
     
-    return all_solutions
\ No newline at end of file
+    for block, high_sum in enumerate(_gray_code_sums(numbers[low_count:])):
+        positions = positions_by_sum.get(target - high_sum, ())
+        if block & 1:
+            positions = [block_size - 1 - position for position in reversed(positions)]
+        
+        for position in positions:
+            step = block * block_size + position
+            subset_mask = step ^ (step >> 1)
+            
+            # Pair the elements with the mask's binary digits, lowest first
+            # (the reversed '0b' prefix never matches)
+            yield [number for number, bit in zip(numbers, reversed(bin(subset_mask))) if bit == '1']
+            
+            solutions_found += 1
+            if solutions_found == limit:
+                return
@@ -6,11 +6,66 @@ including brute-force and optimized approaches for educational and benchmarking
 """
 
 import itertools
+import math
+import weakref
 from typing import List, Optional, Dict, Tuple
 from core.base_solver import BaseSolver
 from generators.tsp_generator import TSPInstance
 
 
+# Number of nearest neighbours whose 2-opt moves are tried before the full
+# neighbourhood is swept
+_TWO_OPT_NEIGHBORS = 10
+
+
+def _neighbors_by_distance(distance_matrix: List[List[float]]) -> List[List[int]]:
+    """
+    Sort the cities by distance from each city.
+    
+    Equally distant cities keep increasing index order, so the first
+    unvisited entry of a list is the nearest unvisited city with ties going
+    to the lowest index.
+    
+    Args:
+        distance_matrix: Square matrix of distances between cities
+    
+    Returns:
+        List[List[int]]: For each city, all city indices nearest first
+    """
+    cities = range(len(distance_matrix))
+    return [sorted(cities, key=row.__getitem__) for row in distance_matrix]
+
+
+# Sorted neighbour lists per TSP instance, together with the distance matrix
+# they were built from; entries go away with their instance
+_neighbor_cache = weakref.WeakKeyDictionary()
+
+
+def _cached_neighbors(problem_instance: TSPInstance) -> List[List[int]]:
+    """
+    Return the sorted neighbour lists of an instance, building them once.
+    
+    Solving the same instance again, with the same or another solver, reuses
+    the lists instead of sorting every row of the matrix again. They are
+    rebuilt if the instance's distance_matrix is replaced by another matrix;
+    a matrix edited in place is not detected.
+    
+    Args:
+        problem_instance: The TSP instance
+    
+    Returns:
+        List[List[int]]: For each city, all city indices nearest first
+    """
+    distance_matrix = problem_instance.distance_matrix
+    cached = _neighbor_cache.get(problem_instance)
+    if cached is not None and cached[0] is distance_matrix:
+        return cached[1]
+    
+    neighbors = _neighbors_by_distance(distance_matrix)
+    _neighbor_cache[problem_instance] = (distance_matrix, neighbors)
+    return neighbors
+
+
 class TSPBruteForce(BaseSolver):
     """
     Brute-force TSP solver using exhaustive permutation enumeration.
@@ -59,35 +114,74 @@ class TSPBruteForce(BaseSolver):
                 'tours_tried': 1
             }
         
-        # For larger instances, try all permutations
-        cities = list(range(num_cities))
-        best_tour = None
-        best_distance = float('inf')
-        tours_tried = 0
+        # For larger instances, try all permutations of the cities after
+        # city 0 (fixing the first city avoids duplicate rotations), in the
+        # same lexicographic order as itertools.permutations. Tours sharing
+        # a prefix are extended from that prefix's partial distance, so
+        # each tour costs O(1) amortised instead of one add per edge.
+        # Partial distances accumulate edge by edge from the start, so every
+        # total is bit-identical to calculate_tour_distance.
+        self._distances = problem_instance.distance_matrix
+        self._path = [0]
+        self._best_tour = None
+        self._best_distance = float('inf')
         
-        # Generate all permutations starting from city 0 (to avoid duplicate rotations)
-        # We fix the first city to 0 and permute the rest
-        for perm in itertools.permutations(cities[1:]):
-            tours_tried += 1
-            
-            # Create full tour starting from city 0
-            tour = [0] + list(perm)
-            
-            # Calculate tour distance
-            distance = problem_instance.calculate_tour_distance(tour)
-            
-            # Update best tour if this one is better
-            if distance < best_distance:
-                best_distance = distance
-                best_tour = tour[:]
+        self._search_tours(0, list(range(1, num_cities)), 0.0)
         
         return {
             'tour_found': True,
-            'best_tour': best_tour,
-            'best_distance': best_distance,
-            'tours_tried': tours_tried
+            'best_tour': self._best_tour,
+            'best_distance': self._best_distance,
+            'tours_tried': math.factorial(num_cities - 1)
         }
     
+    def _search_tours(self, current_city: int, remaining: List[int],
+                      partial_distance: float) -> None:
+        """
+        Try every completion of the current path, recording improvements.
+        
+        Args:
+            current_city: Last city of the current path (self._path)
+            remaining: Cities not yet on the path, in increasing order
+            partial_distance: Distance along the path so far
+        """
+        distances = self._distances
+        row = distances[current_city]
+        path = self._path
+        
+        if not remaining:
+            distance = partial_distance + row[0]
+            if distance < self._best_distance:
+                self._best_distance = distance
+                self._best_tour = path[:]
+            return
+        
+        if len(remaining) == 3:
+            # Finish the last three cities inline: 6 tours, no calls
+            best_distance = self._best_distance
+            x, y, z = remaining
+            for a, b, c in ((x, y, z), (y, x, z), (z, x, y)):
+                distance_a = partial_distance + row[a]
+                row_a, row_b, row_c = distances[a], distances[b], distances[c]
+                
+                distance = distance_a + row_a[b] + row_b[c] + row_c[0]
+                if distance < best_distance:
+                    best_distance = distance
+                    self._best_tour = path + [a, b, c]
+                
+                distance = distance_a + row_a[c] + row_c[b] + row_b[0]
+                if distance < best_distance:
+                    best_distance = distance
+                    self._best_tour = path + [a, c, b]
+            self._best_distance = best_distance
+            return
+        
+        for k, city in enumerate(remaining):
+            path.append(city)
+            self._search_tours(city, remaining[:k] + remaining[k + 1:],
+                               partial_distance + row[city])
+            path.pop()
+    
     def get_complexity_class(self) -> str:
         """Return the theoretical computational complexity class."""
         return "NP-Complete (Factorial Time)"
@@ -199,9 +293,13 @@ class TSPNearestNeighbor(BaseSolver):
         best_starting_city = 0
         total_distance_calculations = 0
         
+        # Sort every city's neighbours once per instance and share the lists
+        # across all starting cities
+        neighbors = _cached_neighbors(problem_instance)
+        
         for start_city in range(num_cities):
             tour, distance, calculations = self._nearest_neighbor_from_city(
-                problem_instance, start_city
+                problem_instance, start_city, neighbors
             )
             total_distance_calculations += calculations
             
@@ -219,43 +317,48 @@ class TSPNearestNeighbor(BaseSolver):
         }
     
     def _nearest_neighbor_from_city(self, problem_instance: TSPInstance, 
-                                   start_city: int) -> Tuple[List[int], float, int]:
+                                   start_city: int,
+                                   neighbors: Optional[List[List[int]]] = None
+                                   ) -> Tuple[List[int], float, int]:
         """
         Run nearest neighbor algorithm starting from a specific city.
         
         Args:
             problem_instance: The TSP instance
             start_city: Starting city index
+            neighbors: Every city's neighbours sorted by distance, as built
+                by _neighbors_by_distance (cached per instance if not given)
         
         Returns:
             Tuple of (tour, total_distance, distance_calculations)
         """
         num_cities = problem_instance.num_cities
-        unvisited = set(range(num_cities))
+        distances = problem_instance.distance_matrix
+        if neighbors is None:
+            neighbors = _cached_neighbors(problem_instance)
+        
+        visited = bytearray(num_cities)
+        visited[start_city] = 1
         tour = [start_city]
-        unvisited.remove(start_city)
         current_city = start_city
         total_distance = 0.0
         distance_calculations = 0
         
         # Build tour by always going to nearest unvisited city
-        while unvisited:
-            nearest_city = None
-            nearest_distance = float('inf')
+        for unvisited_count in range(num_cities - 1, 0, -1):
+            # The nearest unvisited city is the first unvisited one in the
+            # current city's sorted neighbour list
+            for nearest_city in neighbors[current_city]:
+                if not visited[nearest_city]:
+                    break
             
-            # Find nearest unvisited city
-            for city in unvisited:
-                distance = problem_instance.get_distance(current_city, city)
-                distance_calculations += 1
-                
-                if distance < nearest_distance:
-                    nearest_distance = distance
-                    nearest_city = city
+            # Count the comparisons a scan over the unvisited cities makes
+            distance_calculations += unvisited_count
             
             # Move to nearest city
             tour.append(nearest_city)
-            unvisited.remove(nearest_city)
-            total_distance += nearest_distance
+            visited[nearest_city] = 1
+            total_distance += distances[current_city][nearest_city]
             current_city = nearest_city
         
         # Add distance back to start city to complete the tour
@@ -282,8 +385,18 @@ class TSPNearestNeighborWith2Opt(BaseSolver):
     then improves it using 2-opt local search. The 2-opt algorithm repeatedly
     looks for two edges in the tour that can be removed and reconnected in a
     different way to reduce the total tour length.
+    
+    By default the starting tour is the best nearest neighbor tour over all
+    starting cities, so the result is never worse than TSPNearestNeighbor.
+    Setting n_starts (on the class or on an instance) runs nearest neighbor
+    from only the first n_starts cities instead, which makes the warm start
+    about num_cities / n_starts times cheaper; 2-opt usually recovers most
+    of the difference, but the final tour may then be longer.
     """
     
+    # Number of nearest neighbor starting cities, or None for all of them
+    n_starts: Optional[int] = None
+    
     def solve(self, problem_instance: TSPInstance) -> Dict:
         """
         Solve the TSP instance using nearest neighbor + 2-opt improvement.
@@ -331,14 +444,31 @@ class TSPNearestNeighborWith2Opt(BaseSolver):
         
         # Step 1: Get initial tour using nearest neighbor
         nn_solver = TSPNearestNeighbor()
-        nn_result = nn_solver.solve(problem_instance)
-        
-        if not nn_result['tour_found']:
-            return nn_result
         
-        initial_tour = nn_result['best_tour']
-        initial_distance = nn_result['best_distance']
-        distance_calculations = nn_result['distance_calculations']
+        if self.n_starts is None:
+            nn_result = nn_solver.solve(problem_instance)
+            
+            if not nn_result['tour_found']:
+                return nn_result
+            
+            initial_tour = nn_result['best_tour']
+            initial_distance = nn_result['best_distance']
+            distance_calculations = nn_result['distance_calculations']
+        else:
+            # Only the first n_starts cities (at least one) are tried
+            initial_tour = None
+            initial_distance = float('inf')
+            distance_calculations = 0
+            
+            for start_city in range(max(1, min(self.n_starts, num_cities))):
+                tour, distance, calculations = nn_solver._nearest_neighbor_from_city(
+                    problem_instance, start_city
+                )
+                distance_calculations += calculations
+                
+                if distance < initial_distance:
+                    initial_distance = distance
+                    initial_tour = tour
         
         # Step 2: Improve tour using 2-opt
         improved_tour, improved_distance, improvement_iterations, additional_calculations = \
@@ -356,63 +486,146 @@ class TSPNearestNeighborWith2Opt(BaseSolver):
         }
     
     def _two_opt_improvement(self, problem_instance: TSPInstance, 
-                           initial_tour: List[int]) -> Tuple[List[int], float, int, int]:
+                           initial_tour: List[int],
+                           neighbors: Optional[List[List[int]]] = None
+                           ) -> Tuple[List[int], float, int, int]:
         """
         Improve a tour using 2-opt local search.
         
+        Moves that join a city to one of its nearest neighbours are tried
+        first, which finds most improvements at O(n * k) cost per sweep.
+        Full sweeps over all moves then finish the search, so the result is
+        a local optimum for the whole 2-opt neighbourhood.
+        
         Args:
             problem_instance: The TSP instance
             initial_tour: Initial tour to improve
+            neighbors: Every city's neighbours sorted by distance, as built
+                by _neighbors_by_distance (cached per instance if not given)
         
         Returns:
             Tuple of (improved_tour, improved_distance, iterations, distance_calculations)
         """
+        # The working tour stays a list: an array('i') is smaller, but every
+        # element the sweep reads would be boxed into a new int object, which
+        # makes the sweep slower, not faster
         tour = initial_tour[:]
         best_distance = problem_instance.calculate_tour_distance(tour)
         num_cities = len(tour)
-        improvement_iterations = 0
-        distance_calculations = 0
+        distances = problem_instance.distance_matrix
+        if neighbors is None:
+            neighbors = _cached_neighbors(problem_instance)
+        
+        distance_change, improvement_iterations, distance_calculations = \
+            self._two_opt_neighbor_lists(tour, distances, neighbors)
+        best_distance += distance_change
         improved = True
         
+        # Sweep over all 2-opt moves, applying each improving one as soon as
+        # it is found and carrying on from there rather than restarting the
+        # sweep; repeat until a full sweep finds nothing to improve
         while improved:
             improved = False
             
-            # Try all possible 2-opt swaps
-            for i in range(num_cities):
-                for j in range(i + 2, num_cities):
-                    # Avoid adjacent edges and wrap-around cases that don't change the tour
-                    if j == num_cities - 1 and i == 0:
-                        continue
-                    
+            # From i = num_cities - 2 on there is no second edge left, so
+            # those positions are skipped and tour[i + 1] never wraps around
+            for i in range(num_cities - 2):
+                # Current first edge: (tour[i], tour[i+1])
+                city_i = tour[i]
+                row_i = distances[city_i]
+                next_i = tour[i + 1]
+                row_next_i = distances[next_i]
+                current_edge1_dist = row_i[next_i]
+                
+                # Second edges (tour[j], tour[(j+1) % num_cities]) for j >= i+2,
+                # avoiding adjacent edges and the wrap-around case that doesn't
+                # change the tour. A swap at j only reorders positions up to j,
+                # so the pairs still to come stay valid after it.
+                second_cities = tour[i + 2:num_cities - 1 if i == 0 else num_cities]
+                second_successors = tour[i + 3:] + tour[:1]
+                distance_calculations += 4 * len(second_cities)
+                
+                for j, city_j, next_j in zip(itertools.count(i + 2), second_cities, second_successors):
                     # Calculate the change in distance if we perform this 2-opt swap
                     # Current edges: (tour[i], tour[i+1]) and (tour[j], tour[(j+1) % num_cities])
                     # New edges: (tour[i], tour[j]) and (tour[i+1], tour[(j+1) % num_cities])
-                    
-                    current_edge1_dist = problem_instance.get_distance(tour[i], tour[(i + 1) % num_cities])
-                    current_edge2_dist = problem_instance.get_distance(tour[j], tour[(j + 1) % num_cities])
-                    new_edge1_dist = problem_instance.get_distance(tour[i], tour[j])
-                    new_edge2_dist = problem_instance.get_distance(tour[(i + 1) % num_cities], tour[(j + 1) % num_cities])
-                    
-                    distance_calculations += 4
-                    
-                    # Calculate change in total distance
-                    distance_change = (new_edge1_dist + new_edge2_dist) - (current_edge1_dist + current_edge2_dist)
+                    distance_change = (row_i[city_j] + row_next_i[next_j]) - (current_edge1_dist + distances[city_j][next_j])
                     
                     # If this swap improves the tour, perform it
                     if distance_change < -1e-10:  # Use small epsilon for floating point comparison
                         # Perform 2-opt swap: reverse the segment between i+1 and j
-                        new_tour = tour[:i+1] + tour[i+1:j+1][::-1] + tour[j+1:]
-                        tour = new_tour
+                        tour[i + 1:j + 1] = tour[j:i:-1]
                         best_distance += distance_change
                         improvement_iterations += 1
                         improved = True
-                        break
-                
-                if improved:
-                    break
+                        
+                        # tour[i+1] is now the old tour[j]
+                        next_i = city_j
+                        row_next_i = distances[next_i]
+                        current_edge1_dist = row_i[next_i]
         
         return tour, best_distance, improvement_iterations, distance_calculations
     
+    def _two_opt_neighbor_lists(self, tour: List[int], distances: List[List[float]],
+                                neighbors: List[List[int]]) -> Tuple[float, int, int]:
+        """
+        Apply improving 2-opt moves that connect each city to a near neighbour.
+        
+        A move replacing edges (tour[p], tour[p+1]) and (tour[q], tour[q+1])
+        is only tried when tour[p] and tour[q] are among each other's
+        _TWO_OPT_NEIGHBORS nearest cities. The tour is changed in place.
+        
+        Args:
+            tour: The tour to improve
+            distances: Square matrix of distances between cities
+            neighbors: Every city's neighbours sorted by distance
+        
+        Returns:
+            Tuple of (total_distance_change, iterations, distance_calculations)
+        """
+        num_cities = len(tour)
+        total_change = 0.0
+        improvement_iterations = 0
+        distance_calculations = 0
+        
+        near = [[city for city in city_neighbors[:_TWO_OPT_NEIGHBORS + 1] if city != c][:_TWO_OPT_NEIGHBORS]
+                for c, city_neighbors in enumerate(neighbors)]
+        position = [0] * num_cities
+        for index, city in enumerate(tour):
+            position[city] = index
+        
+        improved = True
+        while improved:
+            improved = False
+            
+            for i in range(num_cities):
+                for neighbor in near[tour[i]]:
+                    j = position[neighbor]
+                    p, q = (i, j) if i < j else (j, i)
+                    
+                    # Avoid adjacent edges and the wrap-around case
+                    if q - p < 2 or (p == 0 and q == num_cities - 1):
+                        continue
+                    
+                    city_p, next_p = tour[p], tour[p + 1]
+                    city_q, next_q = tour[q], tour[(q + 1) % num_cities]
+                    distance_change = (distances[city_p][city_q] + distances[next_p][next_q]) - \
+                        (distances[city_p][next_p] + distances[city_q][next_q])
+                    distance_calculations += 4
+                    
+                    if distance_change < -1e-10:
+                        # Reverse the segment between p+1 and q and move on
+                        # to the next position, whose city may have changed
+                        tour[p + 1:q + 1] = tour[q:p:-1]
+                        for index in range(p + 1, q + 1):
+                            position[tour[index]] = index
+                        total_change += distance_change
+                        improvement_iterations += 1
+                        improved = True
+                        break
+        
+        return total_change, improvement_iterations, distance_calculations
+    
     def get_complexity_class(self) -> str:
         """Return the theoretical computational complexity class."""
         return "Polynomial Time Approximation with Local Search (O(n^3))"
@@ -446,11 +659,12 @@ def verify_tsp_solution(tsp_instance: TSPInstance, tour: List[int]) -> bool:
         raise ValueError(f"Tour length ({len(tour)}) doesn't match number of cities ({num_cities})")
     
     # Check that all cities are included exactly once
-    if set(tour) != set(range(num_cities)):
+    visited = set(tour)
+    if visited != set(range(num_cities)):
         raise ValueError("Tour must visit each city exactly once")
     
     # Check for duplicate cities
-    if len(set(tour)) != len(tour):
+    if len(visited) != len(tour):
         raise ValueError("Tour contains duplicate cities")
     
     # If we get here, the tour is valid
@@ -472,7 +686,11 @@ def calculate_tour_improvement(tsp_instance: TSPInstance,
         Dict containing improvement statistics
     """
     original_distance = tsp_instance.calculate_tour_distance(original_tour)
-    improved_distance = tsp_instance.calculate_tour_distance(improved_tour)
+    if list(improved_tour) == list(original_tour):
+        # Same tour: no need to sum its edges twice
+        improved_distance = original_distance
+    else:
+        improved_distance = tsp_instance.calculate_tour_distance(improved_tour)
     
     absolute_improvement = original_distance - improved_distance
     relative_improvement = (absolute_improvement / original_distance) * 100 if original_distance > 0 else 0
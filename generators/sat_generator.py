@@ -5,7 +5,9 @@ This module provides functionality to generate 3-SAT problem instances
 with configurable parameters for educational and benchmarking purposes.
 """
 
+import itertools
 import random
+from array import array
 from typing import List, Tuple, Dict, Any
 from core.data_models import ProblemInstance
 
@@ -16,8 +18,11 @@ class SATInstance:
     
     A 3-SAT instance consists of a set of boolean variables and a set of clauses,
     where each clause contains exactly 3 literals (variables or their negations).
+    Instances use __slots__ to keep the per-instance footprint small.
     """
     
+    __slots__ = ('num_variables', 'clauses')
+    
     def __init__(self, num_variables: int, clauses: List[List[int]]):
         """
         Initialize a SAT instance.
@@ -30,9 +35,60 @@ class SATInstance:
         self.num_variables = num_variables
         self.clauses = clauses
     
+    def flat_clauses(self) -> Tuple[array, array]:
+        """
+        Return the clauses in compressed sparse row (CSR) form.
+        
+        All literals are stored back to back in one contiguous array, and
+        clause i occupies literals[starts[i]:starts[i + 1]]. This is a
+        compact copy without per-literal Python objects, suited to bulk
+        storage or to code working on flat buffers. The clause list remains
+        the primary representation, and the copy is rebuilt on every call.
+        
+        Returns:
+            Tuple of (literals, starts) as array('i') and array('q')
+        """
+        # Fill both arrays in bulk from iterators instead of extending them
+        # one clause at a time
+        literals = array('i', itertools.chain.from_iterable(self.clauses))
+        starts = array('q', [0])
+        starts.extend(itertools.accumulate(map(len, self.clauses)))
+        
+        return literals, starts
+    
+    def to_bitmasks(self) -> Tuple[List[int], List[int]]:
+        """
+        Return the clauses as positive and negative literal bitmasks.
+        
+        Bit v-1 of pos[i] is set when clause i contains x_v, and of neg[i]
+        when it contains ¬x_v. With an assignment packed the same way (bit
+        v-1 = value of x_v), clause i is satisfied exactly when
+        (assignment & pos[i]) | (~assignment & neg[i]) is nonzero. Python
+        integers have no fixed width, so any number of variables fits.
+        
+        Returns:
+            Tuple of (pos, neg) lists with one mask per clause
+        """
+        pos = []
+        neg = []
+        
+        for clause in self.clauses:
+            positive_mask = 0
+            negative_mask = 0
+            for literal in clause:
+                if literal > 0:
+                    positive_mask |= 1 << (literal - 1)
+                else:
+                    negative_mask |= 1 << (-literal - 1)
+            pos.append(positive_mask)
+            neg.append(negative_mask)
+        
+        return pos, neg
+    
     def __str__(self) -> str:
         """Return a human-readable string representation of the SAT instance."""
-        result = f"3-SAT instance with {self.num_variables} variables and {len(self.clauses)} clauses:\n"
+        # Collect the lines and join them once rather than growing one string
+        lines = [f"3-SAT instance with {self.num_variables} variables and {len(self.clauses)} clauses:\n"]
         for i, clause in enumerate(self.clauses):
             literals = []
             for literal in clause:
@@ -40,8 +96,52 @@ class SATInstance:
                     literals.append(f"x{literal}")
                 else:
                     literals.append(f"¬x{abs(literal)}")
-            result += f"  Clause {i+1}: ({' ∨ '.join(literals)})\n"
-        return result
+            lines.append(f"  Clause {i+1}: ({' ∨ '.join(literals)})\n")
+        return "".join(lines)
+
+
+def _validate_3sat_parameters(num_variables: int, num_clauses: int) -> None:
+    """
+    Check the parameters shared by the 3-SAT generators.
+    
+    Args:
+        num_variables: Number of boolean variables
+        num_clauses: Number of clauses
+    
+    Raises:
+        ValueError: If num_variables < 3 or num_clauses < 1
+    """
+    if num_variables < 3:
+        raise ValueError("Number of variables must be at least 3 for 3-SAT")
+    if num_clauses < 1:
+        raise ValueError("Number of clauses must be at least 1")
+
+
+def _sample_clause_variables(num_variables: int, rng=random) -> Tuple[int, int, int]:
+    """
+    Choose 3 distinct variables uniformly at random.
+    
+    Each draw scales random() to a variable index, as random.choices
+    does, which is several times cheaper than random.randint or
+    random.sample; a repeated variable is simply drawn again.
+    
+    Args:
+        num_variables: Number of boolean variables (must be >= 3)
+        rng: random.Random instance to draw from (defaults to the global
+            random state)
+    
+    Returns:
+        Tuple of 3 distinct variables between 1 and num_variables
+    """
+    rand = rng.random
+    first = int(rand() * num_variables) + 1
+    second = int(rand() * num_variables) + 1
+    while second == first:
+        second = int(rand() * num_variables) + 1
+    third = int(rand() * num_variables) + 1
+    while third == first or third == second:
+        third = int(rand() * num_variables) + 1
+    return first, second, third
 
 
 def generate_3sat_instance(num_variables: int, num_clauses: int, seed: int = None) -> ProblemInstance:
@@ -64,39 +164,25 @@ def generate_3sat_instance(num_variables: int, num_clauses: int, seed: int = Non
         ValueError: If parameters are invalid (num_variables < 3 or num_clauses < 1)
     """
     # Validate input parameters
-    if num_variables < 3:
-        raise ValueError("Number of variables must be at least 3 for 3-SAT")
-    if num_clauses < 1:
-        raise ValueError("Number of clauses must be at least 1")
+    _validate_3sat_parameters(num_variables, num_clauses)
     
-    # Set random seed if provided for reproducible results
-    if seed is not None:
-        random.seed(seed)
+    # Draw from a generator of our own if a seed is provided, for
+    # reproducible results without reseeding the global random state
+    rng = random.Random(seed) if seed is not None else random
     
+    getrandbits = rng.getrandbits
     clauses = []
     
     for _ in range(num_clauses):
-        # Generate a clause with 3 distinct literals
-        clause = []
-        used_variables = set()
-        
-        while len(clause) < 3:
-            # Choose a random variable (1 to num_variables)
-            variable = random.randint(1, num_variables)
-            
-            # Skip if we've already used this variable in this clause
-            if variable in used_variables:
-                continue
-            
-            used_variables.add(variable)
-            
-            # Randomly decide if the literal should be negated
-            if random.choice([True, False]):
-                clause.append(-variable)  # Negated literal
-            else:
-                clause.append(variable)   # Positive literal
-        
-        clauses.append(clause)
+        # Generate a clause with 3 distinct literals, using one random bit
+        # per literal to decide whether it is negated
+        first, second, third = _sample_clause_variables(num_variables, rng)
+        negated = getrandbits(3)
+        clauses.append([
+            -first if negated & 1 else first,
+            -second if negated & 2 else second,
+            -third if negated & 4 else third
+        ])
     
     # Create the SAT instance
     sat_instance = SATInstance(num_variables, clauses)
@@ -141,64 +227,45 @@ def generate_satisfiable_3sat_instance(num_variables: int, num_clauses: int, see
         ValueError: If parameters are invalid (num_variables < 3 or num_clauses < 1)
     """
     # Validate input parameters
-    if num_variables < 3:
-        raise ValueError("Number of variables must be at least 3 for 3-SAT")
-    if num_clauses < 1:
-        raise ValueError("Number of clauses must be at least 1")
+    _validate_3sat_parameters(num_variables, num_clauses)
     
-    # Set random seed if provided for reproducible results
-    if seed is not None:
-        random.seed(seed)
+    # Draw from a generator of our own if a seed is provided, for
+    # reproducible results without reseeding the global random state
+    rng = random.Random(seed) if seed is not None else random
     
     # Generate a random truth assignment
-    truth_assignment = [random.choice([True, False]) for _ in range(num_variables)]
+    assignment_bits = rng.getrandbits(num_variables)
+    truth_assignment = [bool(assignment_bits >> k & 1) for k in range(num_variables)]
+    
+    # satisfying_literals[variable] is the literal of that variable which is
+    # true under the assignment; its negation is the falsified literal
+    satisfying_literals = [0] + [
+        variable if truth_assignment[variable - 1] else -variable
+        for variable in range(1, num_variables + 1)
+    ]
     
+    rand = rng.random
     clauses = []
     
     for _ in range(num_clauses):
         # Generate a clause that is satisfied by the truth assignment
-        clause = []
-        used_variables = set()
-        
-        while len(clause) < 3:
-            # Choose a random variable (1 to num_variables)
-            variable = random.randint(1, num_variables)
-            
-            # Skip if we've already used this variable in this clause
-            if variable in used_variables:
-                continue
-            
-            used_variables.add(variable)
-            
-            # Add the literal in a way that makes the clause satisfied
-            # If the variable is True in our assignment, add it positively
-            # If the variable is False in our assignment, add it negatively
-            # But sometimes add it the opposite way to make the problem more interesting
-            if random.random() < 0.7:  # 70% chance to follow the satisfying assignment
-                if truth_assignment[variable - 1]:  # Variable is True
-                    clause.append(variable)  # Add positive literal
-                else:  # Variable is False
-                    clause.append(-variable)  # Add negative literal
-            else:  # 30% chance to add the opposite (still need at least one satisfying literal per clause)
-                if truth_assignment[variable - 1]:  # Variable is True
-                    clause.append(-variable)  # Add negative literal
-                else:  # Variable is False
-                    clause.append(variable)  # Add positive literal
+        first, second, third = _sample_clause_variables(num_variables, rng)
+        clause = [satisfying_literals[first], satisfying_literals[second], satisfying_literals[third]]
         
-        # Ensure at least one literal in the clause is satisfied by our truth assignment
-        satisfied = any(
-            (literal > 0 and truth_assignment[literal - 1]) or
-            (literal < 0 and not truth_assignment[abs(literal) - 1])
-            for literal in clause
-        )
+        # Each literal follows the assignment 70% of the time and is negated
+        # otherwise to make the problem more interesting
+        negated = 0
+        for position in range(3):
+            if rand() >= 0.7:
+                clause[position] = -clause[position]
+                negated += 1
         
-        if not satisfied:
-            # Replace the first literal with one that satisfies the clause
-            var_idx = abs(clause[0]) - 1
-            if truth_assignment[var_idx]:
-                clause[0] = abs(clause[0])  # Make it positive
-            else:
-                clause[0] = -abs(clause[0])  # Make it negative
+        # If all three came out false, restore one at a random position, so
+        # the clause is satisfied without any position giving the
+        # assignment away
+        if negated == 3:
+            position = int(rand() * 3)
+            clause[position] = -clause[position]
         
         clauses.append(clause)
     
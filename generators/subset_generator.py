@@ -5,6 +5,8 @@ This module provides functionality to generate Subset Sum problem instances
 with configurable parameters for educational and benchmarking purposes.
 """
 
+import itertools
+import operator
 import random
 from typing import List, Dict, Any, Set
 from core.data_models import ProblemInstance
@@ -16,8 +18,11 @@ class SubsetSumInstance:
     
     A Subset Sum instance consists of a set of positive integers and a target sum.
     The goal is to find a subset of the integers that sum exactly to the target.
+    Like ProblemInstance, instances use __slots__ rather than a __dict__.
     """
     
+    __slots__ = ('numbers', 'target')
+    
     def __init__(self, numbers: List[int], target: int):
         """
         Initialize a Subset Sum instance.
@@ -37,6 +42,51 @@ class SubsetSumInstance:
         return result
 
 
+def _validate_subset_parameters(set_size: int, max_value: int = None) -> None:
+    """
+    Check the parameters shared by the Subset Sum generators.
+    
+    Args:
+        set_size: Number of integers in the set
+        max_value: Maximum value for generated integers (None to skip)
+    
+    Raises:
+        ValueError: If set_size < 1 or max_value < 1
+    """
+    if set_size < 1:
+        raise ValueError("Set size must be at least 1")
+    if max_value is not None and max_value < 1:
+        raise ValueError("Maximum value must be at least 1")
+
+
+def _is_reachable_sum(numbers: List[int], target: int) -> bool:
+    """
+    Check whether some subset of positive integers sums to target.
+    
+    Sums are tracked as the bits of one Python integer (bit j = sum j is
+    reachable), so adding a number is a single shift and OR over the whole
+    bitset, done limb by limb in C. Sums above target are masked off, which
+    keeps the bitset at target + 1 bits.
+    
+    Args:
+        numbers: List of positive integers
+        target: Target sum
+    
+    Returns:
+        bool: True if a subset (possibly empty, for target 0) sums to target
+    """
+    if target < 0 or target > sum(numbers):
+        return False
+    
+    mask = (1 << (target + 1)) - 1
+    reachable = 1
+    for number in numbers:
+        reachable |= (reachable << number) & mask
+        if (reachable >> target) & 1:
+            return True
+    return bool((reachable >> target) & 1)
+
+
 def generate_subset_sum_instance(set_size: int, max_value: int = None, target: int = None, seed: int = None) -> ProblemInstance:
     """
     Generate a random Subset Sum problem instance.
@@ -57,10 +107,7 @@ def generate_subset_sum_instance(set_size: int, max_value: int = None, target: i
         ValueError: If parameters are invalid
     """
     # Validate input parameters
-    if set_size < 1:
-        raise ValueError("Set size must be at least 1")
-    if max_value is not None and max_value < 1:
-        raise ValueError("Maximum value must be at least 1")
+    _validate_subset_parameters(set_size, max_value)
     if target is not None and target < 0:
         raise ValueError("Target must be non-negative")
     
@@ -68,24 +115,33 @@ def generate_subset_sum_instance(set_size: int, max_value: int = None, target: i
     if max_value is None:
         max_value = set_size * 10
     
-    # Set random seed if provided for reproducible results
-    if seed is not None:
-        random.seed(seed)
+    # Draw from a generator of our own if a seed is provided, for
+    # reproducible results without reseeding the global random state
+    rng = random.Random(seed) if seed is not None else random
     
-    # Generate random positive integers
-    numbers = [random.randint(1, max_value) for _ in range(set_size)]
+    # Generate random positive integers, all in one random.choices call
+    # rather than one random.randint call per number
+    numbers = rng.choices(range(1, max_value + 1), k=set_size)
     
     # Generate target if not provided
     if target is None:
         # Create a random subset and use its sum as the target
         # This ensures the instance is solvable
-        subset_size = random.randint(1, min(set_size, 5))  # Limit subset size for reasonable targets
-        subset_indices = random.sample(range(set_size), subset_size)
+        subset_size = rng.randint(1, min(set_size, 5))  # Limit subset size for reasonable targets
+        subset_indices = rng.sample(range(set_size), subset_size)
         target = sum(numbers[i] for i in subset_indices)
+        is_solvable = True
+    else:
+        # A given target may not be reachable; the bitset check answers
+        # that in pseudo-polynomial time
+        is_solvable = _is_reachable_sum(numbers, target)
     
     # Create the Subset Sum instance
     subset_instance = SubsetSumInstance(numbers, target)
     
+    # Sum the numbers once for the total and the average
+    total_sum = sum(numbers)
+    
     # Create problem instance with metadata
     problem_instance = ProblemInstance(
         problem_type="SubsetSum",
@@ -98,10 +154,11 @@ def generate_subset_sum_instance(set_size: int, max_value: int = None, target: i
         },
         data=subset_instance,
         metadata={
-            "total_sum": sum(numbers),
-            "average_value": sum(numbers) / len(numbers),
+            "total_sum": total_sum,
+            "average_value": total_sum / set_size,
             "min_value": min(numbers),
             "max_value_actual": max(numbers),
+            "is_solvable": is_solvable,
             "generation_method": "random_subset_sum"
         }
     )
@@ -128,31 +185,32 @@ def generate_solvable_subset_sum_instance(set_size: int, max_value: int = None,
         ValueError: If parameters are invalid
     """
     # Validate input parameters
-    if set_size < 1:
-        raise ValueError("Set size must be at least 1")
-    if max_value is not None and max_value < 1:
-        raise ValueError("Maximum value must be at least 1")
+    _validate_subset_parameters(set_size, max_value)
     
     # Set default max_value if not provided
     if max_value is None:
         max_value = set_size * 10
     
-    # Set random seed if provided for reproducible results
-    if seed is not None:
-        random.seed(seed)
+    # Draw from a generator of our own if a seed is provided, for
+    # reproducible results without reseeding the global random state
+    rng = random.Random(seed) if seed is not None else random
     
-    # Generate random positive integers
-    numbers = [random.randint(1, max_value) for _ in range(set_size)]
+    # Generate random positive integers, all in one random.choices call
+    # rather than one random.randint call per number
+    numbers = rng.choices(range(1, max_value + 1), k=set_size)
     
     # Select a random subset and use its sum as the target
-    subset_size = random.randint(1, set_size)
-    subset_indices = random.sample(range(set_size), subset_size)
+    subset_size = rng.randint(1, set_size)
+    subset_indices = rng.sample(range(set_size), subset_size)
     target = sum(numbers[i] for i in subset_indices)
     solution_subset = [numbers[i] for i in subset_indices]
     
     # Create the Subset Sum instance
     subset_instance = SubsetSumInstance(numbers, target)
     
+    # Sum the numbers once for the total and the average
+    total_sum = sum(numbers)
+    
     # Create problem instance with metadata
     problem_instance = ProblemInstance(
         problem_type="SubsetSum",
@@ -166,8 +224,8 @@ def generate_solvable_subset_sum_instance(set_size: int, max_value: int = None,
         },
         data=subset_instance,
         metadata={
-            "total_sum": sum(numbers),
-            "average_value": sum(numbers) / len(numbers),
+            "total_sum": total_sum,
+            "average_value": total_sum / set_size,
             "min_value": min(numbers),
             "max_value_actual": max(numbers),
             "generation_method": "solvable_subset_sum",
@@ -198,43 +256,52 @@ def generate_structured_subset_sum_instance(set_size: int, structure_type: str =
         ValueError: If parameters are invalid or structure_type is unknown
     """
     # Validate input parameters
-    if set_size < 1:
-        raise ValueError("Set size must be at least 1")
+    _validate_subset_parameters(set_size)
     
     valid_structures = ["arithmetic", "geometric", "powers_of_2"]
     if structure_type not in valid_structures:
         raise ValueError(f"Unknown structure type '{structure_type}'. Valid types: {valid_structures}")
     
-    # Set random seed if provided for reproducible results
-    if seed is not None:
-        random.seed(seed)
+    # Draw from a generator of our own if a seed is provided, for
+    # reproducible results without reseeding the global random state
+    rng = random.Random(seed) if seed is not None else random
     
     # Generate structured numbers based on type
     if structure_type == "arithmetic":
         # Arithmetic progression: start, start+d, start+2d, ...
-        start = random.randint(1, 10)
-        diff = random.randint(1, 5)
-        numbers = [start + i * diff for i in range(set_size)]
+        start = rng.randint(1, 10)
+        diff = rng.randint(1, 5)
+        numbers = list(range(start, start + set_size * diff, diff))
     
     elif structure_type == "geometric":
         # Geometric progression: start, start*r, start*r^2, ...
-        start = random.randint(1, 5)
-        ratio = random.randint(2, 3)  # Keep ratio small to avoid huge numbers
-        numbers = [start * (ratio ** i) for i in range(set_size)]
+        start = rng.randint(1, 5)
+        ratio = rng.randint(2, 3)  # Keep ratio small to avoid huge numbers
+        # Each term is the previous one times the ratio, rather than a
+        # fresh power of the ratio
+        numbers = list(itertools.accumulate(itertools.repeat(ratio, set_size - 1), operator.mul, initial=start))
     
     elif structure_type == "powers_of_2":
-        # Powers of 2: 1, 2, 4, 8, 16, ...
-        numbers = [2 ** i for i in range(set_size)]
+        # Powers of 2: 1, 2, 4, 8, 16, ... as single shifts rather than
+        # general exponentiation
+        numbers = [1 << i for i in range(set_size)]
     
     # Generate a target by selecting a random subset
-    subset_size = random.randint(1, min(set_size, 4))  # Limit subset size for reasonable targets
-    subset_indices = random.sample(range(set_size), subset_size)
+    subset_size = rng.randint(1, min(set_size, 4))  # Limit subset size for reasonable targets
+    subset_indices = rng.sample(range(set_size), subset_size)
     target = sum(numbers[i] for i in subset_indices)
     solution_subset = [numbers[i] for i in subset_indices]
     
     # Create the Subset Sum instance
     subset_instance = SubsetSumInstance(numbers, target)
     
+    # Sum the numbers once for the total and the average; the powers of 2
+    # below 2**set_size add up to 2**set_size - 1 without a pass over them
+    if structure_type == "powers_of_2":
+        total_sum = (1 << set_size) - 1
+    else:
+        total_sum = sum(numbers)
+    
     # Create problem instance with metadata
     problem_instance = ProblemInstance(
         problem_type="SubsetSum",
@@ -247,10 +314,11 @@ def generate_structured_subset_sum_instance(set_size: int, structure_type: str =
         },
         data=subset_instance,
         metadata={
-            "total_sum": sum(numbers),
-            "average_value": sum(numbers) / len(numbers),
-            "min_value": min(numbers),
-            "max_value_actual": max(numbers),
+            "total_sum": total_sum,
+            "average_value": total_sum / set_size,
+            # Every structure is increasing, so the ends are the extremes
+            "min_value": numbers[0],
+            "max_value_actual": numbers[-1],
             "generation_method": f"structured_{structure_type}",
             "solution_subset": solution_subset,
             "solution_indices": subset_indices
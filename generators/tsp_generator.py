@@ -5,8 +5,13 @@ This module provides functionality to generate TSP problem instances
 with configurable parameters for educational and benchmarking purposes.
 """
 
+import functools
+import itertools
+import operator
 import random
 import math
+import sys
+from array import array
 from typing import List, Dict, Any, Tuple
 from core.data_models import ProblemInstance
 
@@ -44,10 +49,47 @@ class TSPInstance:
         """
         return self.distance_matrix[city1][city2]
     
+    def flat_distances(self) -> array:
+        """
+        Return the distance matrix as one contiguous row-major array.
+        
+        The distance from city i to city j is entry i * num_cities + j. This
+        is a compact copy of 8 bytes per entry without per-float Python
+        objects, suited to bulk storage or to code working on flat buffers.
+        The matrix remains the primary representation, since indexing an
+        array creates a new float on every read, and the copy is rebuilt on
+        every call.
+        
+        Returns:
+            array('d') of num_cities * num_cities distances
+        """
+        return array('d', itertools.chain.from_iterable(self.distance_matrix))
+    
+    @functools.cached_property
+    def validation(self) -> Dict[str, bool]:
+        """
+        Result of validate_distance_matrix for this instance's matrix.
+        
+        The full check is O(n^3), so it runs on first access only and the
+        result is kept on the instance; later accesses are an attribute
+        lookup. The cached result assumes the distance matrix is not
+        modified after it is first read; delete the attribute to recompute.
+        
+        Returns:
+            Dict with boolean values for each property check
+        """
+        return validate_distance_matrix(self.distance_matrix)
+    
     def calculate_tour_distance(self, tour: List[int]) -> float:
         """
         Calculate the total distance of a tour.
         
+        Edge lengths are added one at a time from the first edge to the
+        closing one. Solvers that build tour lengths incrementally, such as
+        TSPBruteForce, add in the same order and so report bit-identical
+        totals; reassociating the sum (fsum, pairwise or fastmath reductions)
+        would break that.
+        
         Args:
             tour: List of city indices representing the tour order
         
@@ -57,11 +99,12 @@ class TSPInstance:
         if len(tour) != self.num_cities:
             raise ValueError(f"Tour must visit all {self.num_cities} cities")
         
+        # Pair each city with the next one, wrapping round to the start city,
+        # and read the matrix directly rather than via get_distance
+        distance_matrix = self.distance_matrix
         total_distance = 0.0
-        for i in range(len(tour)):
-            current_city = tour[i]
-            next_city = tour[(i + 1) % len(tour)]  # Return to start city
-            total_distance += self.get_distance(current_city, next_city)
+        for current_city, next_city in zip(tour, tour[1:] + tour[:1]):
+            total_distance += distance_matrix[current_city][next_city]
         
         return total_distance
     
@@ -77,6 +120,55 @@ class TSPInstance:
         return result
 
 
+def _euclidean_distance_matrix(cities: List[Tuple[float, float]]) -> List[List[float]]:
+    """
+    Build the matrix of Euclidean distances between city coordinates.
+    
+    Each distance above the diagonal is one math.dist call, which does the
+    subtraction, squaring and square root in C rather than as separate
+    interpreted steps. The entries below the diagonal are the same float
+    objects read back from the rows above, so each distance is computed and
+    stored once, and the matrix is exactly symmetric with a 0.0 diagonal.
+    
+    Args:
+        cities: List of (x, y) coordinates
+    
+    Returns:
+        Square matrix of distances between cities
+    """
+    dist = math.dist
+    distance_matrix = []
+    
+    for i, city in enumerate(cities):
+        row = [previous_row[i] for previous_row in distance_matrix]
+        row.append(0.0)
+        row += [dist(city, other) for other in cities[i + 1:]]
+        distance_matrix.append(row)
+    
+    return distance_matrix
+
+
+def _distance_statistics(distance_matrix: List[List[float]]) -> Tuple[float, float, float]:
+    """
+    Summarise the distances above the diagonal of a distance matrix.
+    
+    Each row's part above the diagonal is taken as one slice, and the sum,
+    minimum and maximum run over those slices with C-level builtins. The sum
+    visits the distances in the same row-major order as a flat list would.
+    
+    Args:
+        distance_matrix: Square matrix of distances (at least 2 cities)
+    
+    Returns:
+        Tuple of (average, minimum, maximum) distance
+    """
+    upper_rows = [row[i + 1:] for i, row in enumerate(distance_matrix[:-1])]
+    count = len(distance_matrix) * (len(distance_matrix) - 1) // 2
+    
+    average = sum(itertools.chain.from_iterable(upper_rows)) / count
+    return average, min(map(min, upper_rows)), max(map(max, upper_rows))
+
+
 def generate_random_tsp_instance(num_cities: int, max_distance: float = 100.0, seed: int = None) -> ProblemInstance:
     """
     Generate a random TSP problem instance.
@@ -101,28 +193,28 @@ def generate_random_tsp_instance(num_cities: int, max_distance: float = 100.0, s
     if max_distance <= 0:
         raise ValueError("Maximum distance must be positive")
     
-    # Set random seed if provided for reproducible results
-    if seed is not None:
-        random.seed(seed)
-    
-    # Initialize distance matrix
-    distance_matrix = [[0.0 for _ in range(num_cities)] for _ in range(num_cities)]
-    
-    # Generate random distances for upper triangle
+    # Draw from a generator of our own if a seed is provided, for
+    # reproducible results without reseeding the global random state
+    rng = random.Random(seed) if seed is not None else random
+    
+    # Generate random distances for the upper triangle one row at a time,
+    # computing random.uniform(1.0, max_distance) inline. Each row starts
+    # with the distances already drawn for the rows above it (the matrix is
+    # symmetric) and a zero on the diagonal, so no cell is written twice
+    rand = rng.random
+    span = max_distance - 1.0
+    distance_matrix = []
     for i in range(num_cities):
-        for j in range(i + 1, num_cities):
-            distance = random.uniform(1.0, max_distance)
-            distance_matrix[i][j] = distance
-            distance_matrix[j][i] = distance  # Symmetric matrix
+        row = [previous_row[i] for previous_row in distance_matrix]
+        row.append(0.0)
+        row += [1.0 + span * rand() for _ in range(num_cities - i - 1)]
+        distance_matrix.append(row)
     
     # Create the TSP instance
     tsp_instance = TSPInstance(num_cities, distance_matrix)
     
     # Calculate some statistics
-    all_distances = [distance_matrix[i][j] for i in range(num_cities) for j in range(i + 1, num_cities)]
-    avg_distance = sum(all_distances) / len(all_distances)
-    min_distance = min(all_distances)
-    max_distance_actual = max(all_distances)
+    avg_distance, min_distance, max_distance_actual = _distance_statistics(distance_matrix)
     
     # Create problem instance with metadata
     problem_instance = ProblemInstance(
@@ -172,36 +264,23 @@ def generate_euclidean_tsp_instance(num_cities: int, grid_size: float = 100.0, s
     if grid_size <= 0:
         raise ValueError("Grid size must be positive")
     
-    # Set random seed if provided for reproducible results
-    if seed is not None:
-        random.seed(seed)
+    # Draw from a generator of our own if a seed is provided, for
+    # reproducible results without reseeding the global random state
+    rng = random.Random(seed) if seed is not None else random
     
-    # Generate random city coordinates
-    cities = []
-    for _ in range(num_cities):
-        x = random.uniform(0, grid_size)
-        y = random.uniform(0, grid_size)
-        cities.append((x, y))
+    # Generate random city coordinates, computing random.uniform(0,
+    # grid_size) inline
+    rand = rng.random
+    cities = [(grid_size * rand(), grid_size * rand()) for _ in range(num_cities)]
     
     # Calculate Euclidean distances
-    distance_matrix = [[0.0 for _ in range(num_cities)] for _ in range(num_cities)]
-    
-    for i in range(num_cities):
-        for j in range(num_cities):
-            if i != j:
-                x1, y1 = cities[i]
-                x2, y2 = cities[j]
-                distance = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-                distance_matrix[i][j] = distance
+    distance_matrix = _euclidean_distance_matrix(cities)
     
     # Create the TSP instance
     tsp_instance = TSPInstance(num_cities, distance_matrix)
     
     # Calculate some statistics
-    all_distances = [distance_matrix[i][j] for i in range(num_cities) for j in range(i + 1, num_cities)]
-    avg_distance = sum(all_distances) / len(all_distances)
-    min_distance = min(all_distances)
-    max_distance_actual = max(all_distances)
+    avg_distance, min_distance, max_distance_actual = _distance_statistics(distance_matrix)
     
     # Create problem instance with metadata
     problem_instance = ProblemInstance(
@@ -259,64 +338,53 @@ def generate_clustered_tsp_instance(num_cities: int, num_clusters: int = 3, clus
     if grid_size <= 0:
         raise ValueError("Grid size must be positive")
     
-    # Set random seed if provided for reproducible results
-    if seed is not None:
-        random.seed(seed)
-    
-    # Generate cluster centers
-    cluster_centers = []
-    for _ in range(num_clusters):
-        x = random.uniform(cluster_radius, grid_size - cluster_radius)
-        y = random.uniform(cluster_radius, grid_size - cluster_radius)
-        cluster_centers.append((x, y))
-    
-    # Assign cities to clusters and generate coordinates
-    cities = []
+    # Draw from a generator of our own if a seed is provided, for
+    # reproducible results without reseeding the global random state
+    rng = random.Random(seed) if seed is not None else random
+    
+    # Generate cluster centers, computing random.uniform(cluster_radius,
+    # grid_size - cluster_radius) inline
+    rand = rng.random
+    center_span = (grid_size - cluster_radius) - cluster_radius
+    cluster_centers = [
+        (cluster_radius + center_span * rand(), cluster_radius + center_span * rand())
+        for _ in range(num_clusters)
+    ]
+    
+    # Assign cities to clusters: every cluster gets cities_per_cluster cities
+    # and the first remaining_cities clusters get one extra, so the center of
+    # each city can be laid out up front in cluster order
     cities_per_cluster = num_cities // num_clusters
     remaining_cities = num_cities % num_clusters
+    city_centers = itertools.chain.from_iterable(
+        itertools.repeat(center, cities_per_cluster + (cluster_idx < remaining_cities))
+        for cluster_idx, center in enumerate(cluster_centers)
+    )
     
-    for cluster_idx in range(num_clusters):
-        center_x, center_y = cluster_centers[cluster_idx]
+    # Generate cities around their cluster centers at a random angle and
+    # distance, drawn in that order per city, and keep them within grid bounds
+    cos = math.cos
+    sin = math.sin
+    two_pi = 2 * math.pi
+    cities = []
+    append = cities.append
+    for center_x, center_y in city_centers:
+        angle = two_pi * rand()
+        distance = cluster_radius * rand()
         
-        # Determine how many cities to place in this cluster
-        cluster_size = cities_per_cluster
-        if cluster_idx < remaining_cities:
-            cluster_size += 1
+        x = center_x + distance * cos(angle)
+        y = center_y + distance * sin(angle)
         
-        # Generate cities around the cluster center
-        for _ in range(cluster_size):
-            # Generate random angle and distance from center
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(0, cluster_radius)
-            
-            x = center_x + distance * math.cos(angle)
-            y = center_y + distance * math.sin(angle)
-            
-            # Ensure city stays within grid bounds
-            x = max(0, min(grid_size, x))
-            y = max(0, min(grid_size, y))
-            
-            cities.append((x, y))
+        append((max(0, min(grid_size, x)), max(0, min(grid_size, y))))
     
     # Calculate Euclidean distances
-    distance_matrix = [[0.0 for _ in range(num_cities)] for _ in range(num_cities)]
-    
-    for i in range(num_cities):
-        for j in range(num_cities):
-            if i != j:
-                x1, y1 = cities[i]
-                x2, y2 = cities[j]
-                distance = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-                distance_matrix[i][j] = distance
+    distance_matrix = _euclidean_distance_matrix(cities)
     
     # Create the TSP instance
     tsp_instance = TSPInstance(num_cities, distance_matrix)
     
     # Calculate some statistics
-    all_distances = [distance_matrix[i][j] for i in range(num_cities) for j in range(i + 1, num_cities)]
-    avg_distance = sum(all_distances) / len(all_distances)
-    min_distance = min(all_distances)
-    max_distance_actual = max(all_distances)
+    avg_distance, min_distance, max_distance_actual = _distance_statistics(distance_matrix)
     
     # Create problem instance with metadata
     problem_instance = ProblemInstance(
@@ -378,33 +446,49 @@ def generate_grid_tsp_instance(grid_width: int, grid_height: int = None, spacing
     if num_cities < 2:
         raise ValueError("Grid must contain at least 2 cities")
     
-    # Generate grid coordinates
-    cities = []
+    # Generate grid coordinates row by row, multiplying each column and row
+    # index by the spacing once rather than once per city
+    xs = [col * spacing for col in range(grid_width)]
+    ys = [row * spacing for row in range(grid_height)]
+    cities = [(x, y) for y in ys for x in xs]
+    
+    # The distance between two grid cities depends only on how many rows
+    # and columns apart they are, so compute each of those distances once:
+    # offset_distances[dy][dx] is the distance dy rows and dx columns apart
+    offset_distances = [
+        [math.hypot(dx * spacing, dy * spacing) for dx in range(grid_width)]
+        for dy in range(grid_height)
+    ]
+    
+    # Each matrix row is assembled from slices of the offset table: for a
+    # city in column col, the distances to a row of cities dy rows away are
+    # the offsets col, col-1, ..., 1, 0, 1, ..., grid_width-1-col
+    distance_matrix = []
     for row in range(grid_height):
         for col in range(grid_width):
-            x = col * spacing
-            y = row * spacing
-            cities.append((x, y))
-    
-    # Calculate Euclidean distances
-    distance_matrix = [[0.0 for _ in range(num_cities)] for _ in range(num_cities)]
-    
-    for i in range(num_cities):
-        for j in range(num_cities):
-            if i != j:
-                x1, y1 = cities[i]
-                x2, y2 = cities[j]
-                distance = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-                distance_matrix[i][j] = distance
+            matrix_row = []
+            for other_row in range(grid_height):
+                offsets = offset_distances[abs(row - other_row)]
+                matrix_row += offsets[col:0:-1]
+                matrix_row += offsets[:grid_width - col]
+            distance_matrix.append(matrix_row)
     
     # Create the TSP instance
     tsp_instance = TSPInstance(num_cities, distance_matrix)
     
-    # Calculate some statistics
-    all_distances = [distance_matrix[i][j] for i in range(num_cities) for j in range(i + 1, num_cities)]
-    avg_distance = sum(all_distances) / len(all_distances)
-    min_distance = min(all_distances)
-    max_distance_actual = max(all_distances)
+    # Calculate some statistics from the offset table: (grid_width - dx) *
+    # (grid_height - dy) pairs of cities lie dx columns and dy rows apart,
+    # twice as many when both are nonzero (both diagonal directions)
+    total_distance = 0.0
+    for dy, offsets in enumerate(offset_distances):
+        for dx, distance in enumerate(offsets):
+            pairs = (grid_width - dx) * (grid_height - dy)
+            if dx and dy:
+                pairs *= 2
+            total_distance += pairs * distance
+    avg_distance = total_distance / (num_cities * (num_cities - 1) // 2)
+    min_distance = spacing
+    max_distance_actual = offset_distances[-1][-1]
     
     # Create problem instance with metadata
     problem_instance = ProblemInstance(
@@ -458,26 +542,33 @@ def validate_distance_matrix(distance_matrix: List[List[float]], tolerance: floa
             "satisfies_triangle_inequality": False
         }
     
-    # Check symmetry
+    # Check symmetry, comparing each row with the matching column above the
+    # diagonal; the element-wise work runs through C-level map calls
     is_symmetric = True
-    for i in range(n):
-        for j in range(n):
-            if abs(distance_matrix[i][j] - distance_matrix[j][i]) > tolerance:
-                is_symmetric = False
-                break
-        if not is_symmetric:
+    for i, (row, column) in enumerate(zip(distance_matrix, zip(*distance_matrix))):
+        differences = map(abs, map(operator.sub, row[i + 1:], column[i + 1:]))
+        if any(map(operator.gt, differences, itertools.repeat(tolerance))):
+            is_symmetric = False
             break
     
     # Check zero diagonal
     has_zero_diagonal = all(abs(distance_matrix[i][i]) <= tolerance for i in range(n))
     
-    # Check triangle inequality
+    # Check triangle inequality. For each pair (i, j), one C-level pass finds
+    # the largest distance[i][k] - distance[j][k] over all k; a violation
+    # needs it to exceed distance[i][j] + tolerance, so the cities k are only
+    # checked one by one, with the exact comparison and excluding k = i and
+    # k = j, when it comes within rounding error of that (or is NaN)
+    scale = max((abs(distance) for row in distance_matrix for distance in row), default=0.0)
+    margin = 8 * sys.float_info.epsilon * (scale + abs(tolerance))
     satisfies_triangle_inequality = True
-    for i in range(n):
-        for j in range(n):
+    for i, row_i in enumerate(distance_matrix):
+        for j, row_j in enumerate(distance_matrix):
+            if i == j or max(map(operator.sub, row_i, row_j)) <= row_i[j] + tolerance - margin:
+                continue
             for k in range(n):
-                if i != j and j != k and i != k:
-                    if distance_matrix[i][k] > distance_matrix[i][j] + distance_matrix[j][k] + tolerance:
+                if i != k and j != k:
+                    if row_i[k] > row_i[j] + row_j[k] + tolerance:
                         satisfies_triangle_inequality = False
                         break
             if not satisfies_triangle_inequality:
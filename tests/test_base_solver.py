@@ -31,6 +31,11 @@ class IncompleteSolver(BaseSolver):
 class TestBaseSolver(unittest.TestCase):
     """Test cases for the BaseSolver abstract base class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one concrete solver; it is stateless, so tests can share it."""
+        cls.solver = ConcreteSolver()
+    
     def test_base_solver_is_abstract(self):
         """Test that BaseSolver cannot be instantiated directly."""
         with self.assertRaises(TypeError):
@@ -49,7 +54,7 @@ class TestBaseSolver(unittest.TestCase):
     
     def test_concrete_solver_methods(self):
         """Test that concrete solver methods work as expected."""
-        solver = ConcreteSolver()
+        solver = self.solver
         
         # Test solve method
         result = solver.solve("test_problem")
@@ -68,7 +73,7 @@ class TestBaseSolver(unittest.TestCase):
         self.assertTrue(issubclass(BaseSolver, ABC))
         
         # Test that concrete solver is instance of both BaseSolver and ABC
-        solver = ConcreteSolver()
+        solver = self.solver
         self.assertIsInstance(solver, BaseSolver)
         self.assertIsInstance(solver, ABC)
 
@@ -5,6 +5,7 @@ This module tests the data model classes (ProblemInstance, BenchmarkResult,
 AlgorithmConfig) to ensure they work correctly and maintain data integrity.
 """
 
+import sys
 import unittest
 from datetime import datetime
 from typing import Dict, Any
@@ -65,6 +66,15 @@ class TestProblemInstance(unittest.TestCase):
         )
         
         self.assertEqual(instance1, instance2)
+        
+        # The interned type names are the same object, so comparing them is
+        # an identity check
+        self.assertIs(instance1.problem_type, instance2.problem_type)
+        
+        # Instances hold mutable dicts and compare by value, so they are not
+        # hashable and equality cannot be shortcut through hashes
+        with self.assertRaises(TypeError):
+            hash(instance1)
     
     def test_problem_instance_different_data(self):
         """Test that ProblemInstance instances with different data are not equal."""
@@ -85,21 +95,38 @@ class TestProblemInstance(unittest.TestCase):
         )
         
         self.assertNotEqual(instance1, instance2)
+    
+    def test_problem_instance_uses_slots(self):
+        """Test that ProblemInstance has no per-instance __dict__ and interns its type."""
+        instance = ProblemInstance(
+            problem_type="".join(["Subset", "Sum"]),
+            size=3,
+            parameters={"target": 6},
+            data=[1, 2, 3],
+            metadata={}
+        )
+        
+        self.assertFalse(hasattr(instance, "__dict__"))
+        self.assertIs(instance.problem_type, sys.intern("SubsetSum"))
+        with self.assertRaises(AttributeError):
+            instance.undeclared_field = 1
 
 
 class TestBenchmarkResult(unittest.TestCase):
     """Test cases for the BenchmarkResult data class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.problem_instance = ProblemInstance(
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by all tests; none of them modify these."""
+        cls.problem_instance = ProblemInstance(
             problem_type="SAT",
             size=5,
             parameters={"variables": 5, "clauses": 10},
             data=[[1, -2, 3]],
             metadata={}
         )
-        self.timestamp = datetime.now()
+        # A fixed timestamp: the tests only pass it through, so it need not be the current time
+        cls.timestamp = datetime(2024, 1, 1, 12, 0, 0)
     
     def test_benchmark_result_creation(self):
         """Test that BenchmarkResult can be created with all required fields."""
@@ -214,6 +241,10 @@ class TestAlgorithmConfig(unittest.TestCase):
         )
         
         self.assertEqual(config1, config2)
+        
+        # Configs hold a mutable parameters dict, so they are not hashable
+        with self.assertRaises(TypeError):
+            hash(config1)
     
     def test_algorithm_config_different_parameters(self):
         """Test that AlgorithmConfig instances with different parameters are not equal."""
@@ -13,7 +13,8 @@ from generators.sat_generator import (
     generate_satisfiable_3sat_instance,
     get_default_config,
     SATInstance,
-    DEFAULT_CONFIGS
+    DEFAULT_CONFIGS,
+    _sample_clause_variables
 )
 from core.data_models import ProblemInstance
 
@@ -29,6 +30,40 @@ class TestSATInstance(unittest.TestCase):
         self.assertEqual(instance.num_variables, 3)
         self.assertEqual(instance.clauses, clauses)
     
+    def test_flat_clauses(self):
+        """Test the CSR form of the clause list."""
+        clauses = [[1, -2, 3], [-4], [], [2, 4]]
+        instance = SATInstance(4, clauses)
+        
+        literals, starts = instance.flat_clauses()
+        
+        self.assertEqual(list(literals), [1, -2, 3, -4, 2, 4])
+        self.assertEqual(list(starts), [0, 3, 4, 4, 6])
+        for i, clause in enumerate(clauses):
+            self.assertEqual(list(literals[starts[i]:starts[i + 1]]), clause)
+    
+    def test_to_bitmasks(self):
+        """Test the bitmask form of the clause list."""
+        clauses = [[1, -2, 3], [-1, -3], [2]]
+        instance = SATInstance(3, clauses)
+        
+        pos, neg = instance.to_bitmasks()
+        
+        self.assertEqual(pos, [0b101, 0b000, 0b010])
+        self.assertEqual(neg, [0b010, 0b101, 0b000])
+        
+        # The masks agree with direct clause evaluation for every assignment
+        for assignment in range(1 << 3):
+            expected = all(
+                any((literal > 0) == bool(assignment >> (abs(literal) - 1) & 1) for literal in clause)
+                for clause in clauses
+            )
+            satisfied = all(
+                (assignment & positive_mask) | (~assignment & negative_mask)
+                for positive_mask, negative_mask in zip(pos, neg)
+            )
+            self.assertEqual(satisfied, expected)
+    
     def test_sat_instance_string_representation(self):
         """Test string representation of SAT instance."""
         clauses = [[1, -2, 3]]
@@ -46,9 +81,23 @@ class TestSATInstance(unittest.TestCase):
 class TestGenerate3SATInstance(unittest.TestCase):
     """Test cases for the generate_3sat_instance function."""
     
+    # (num_variables, num_clauses, seed) combinations run through the
+    # clause and reproducibility checks
+    CASES = [(3, 1, 111), (4, 8, 123), (5, 10, 42), (6, 15, 789), (8, 20, 999)]
+    
+    @classmethod
+    def setUpClass(cls):
+        """Generate each case's instance once; the tests only read them."""
+        cls.instances = {
+            (num_variables, num_clauses, seed): generate_3sat_instance(num_variables, num_clauses, seed=seed)
+            for num_variables, num_clauses, seed in cls.CASES
+        }
+        # The clauses of each case as contiguous (literals, starts) arrays
+        cls.flat_clauses = {case: instance.data.flat_clauses() for case, instance in cls.instances.items()}
+    
     def test_basic_generation(self):
         """Test basic 3-SAT instance generation."""
-        instance = generate_3sat_instance(5, 10, seed=42)
+        instance = self.instances[(5, 10, 42)]
         
         # Check that it returns a ProblemInstance
         self.assertIsInstance(instance, ProblemInstance)
@@ -77,42 +126,72 @@ class TestGenerate3SATInstance(unittest.TestCase):
     
     def test_reproducible_generation(self):
         """Test that generation is reproducible with the same seed."""
-        instance1 = generate_3sat_instance(4, 8, seed=123)
-        instance2 = generate_3sat_instance(4, 8, seed=123)
+        for num_variables, num_clauses, seed in self.CASES:
+            with self.subTest(vars=num_variables, clauses=num_clauses, seed=seed):
+                instance1 = self.instances[(num_variables, num_clauses, seed)]
+                instance2 = generate_3sat_instance(num_variables, num_clauses, seed=seed)
+                
+                # Should generate identical instances
+                self.assertEqual(instance1.data.clauses, instance2.data.clauses)
+    
+    def test_seed_leaves_global_random_state(self):
+        """Test that a seeded call neither reseeds nor advances the global generator."""
+        random.seed(99)
+        expected = random.random()
         
-        # Should generate identical instances
-        self.assertEqual(instance1.data.clauses, instance2.data.clauses)
+        random.seed(99)
+        generate_3sat_instance(4, 8, seed=123)
+        generate_satisfiable_3sat_instance(4, 8, seed=123)
+        self.assertEqual(random.random(), expected)
     
     def test_different_seeds_produce_different_instances(self):
         """Test that different seeds produce different instances."""
-        instance1 = generate_3sat_instance(4, 8, seed=123)
-        instance2 = generate_3sat_instance(4, 8, seed=456)
+        seeds = [123, 456, 789, 1011, 1213]
+        
+        # Compare the instances by the raw bytes of their flattened literal
+        # arrays, so distinctness is one set of short byte strings rather
+        # than pairwise comparisons of nested lists. Seed 123 is one of the
+        # shared cases; only the others need generating
+        literal_arrays = [self.flat_clauses[(4, 8, 123)][0]]
+        literal_arrays += [generate_3sat_instance(4, 8, seed=seed).data.flat_clauses()[0] for seed in seeds[1:]]
+        encodings = {literals.tobytes() for literals in literal_arrays}
         
-        # Should generate different instances (with high probability)
-        self.assertNotEqual(instance1.data.clauses, instance2.data.clauses)
+        # Should generate different instances (fixed seeds, so this is deterministic)
+        self.assertEqual(len(encodings), len(seeds))
     
     def test_clause_literal_validity(self):
         """Test that generated clauses contain valid literals."""
-        instance = generate_3sat_instance(6, 15, seed=789)
-        sat_data = instance.data
-        
-        for clause in sat_data.clauses:
-            # Each clause should have exactly 3 literals
-            self.assertEqual(len(clause), 3)
-            
-            # All literals should be non-zero and within variable range
-            for literal in clause:
-                self.assertNotEqual(literal, 0)
-                self.assertGreaterEqual(abs(literal), 1)
-                self.assertLessEqual(abs(literal), 6)
-            
-            # All literals in a clause should be distinct variables
-            variables_in_clause = [abs(literal) for literal in clause]
-            self.assertEqual(len(variables_in_clause), len(set(variables_in_clause)))
+        for num_variables, num_clauses, seed in self.CASES:
+            with self.subTest(vars=num_variables, clauses=num_clauses, seed=seed):
+                sat_data = self.instances[(num_variables, num_clauses, seed)].data
+                self.assertEqual(len(sat_data.clauses), num_clauses)
+                
+                # Check all literals at once in their flat form, where each
+                # check is one pass over a single array
+                literals, starts = self.flat_clauses[(num_variables, num_clauses, seed)]
+                variables = list(map(abs, literals))
+                
+                # Each clause should have exactly 3 literals
+                self.assertEqual(list(starts), list(range(0, 3 * num_clauses + 1, 3)))
+                
+                # All literals should be non-zero and within variable range
+                self.assertNotIn(0, literals)
+                self.assertGreaterEqual(min(variables), 1)
+                self.assertLessEqual(max(variables), num_variables)
+                
+                # All literals in a clause should be distinct variables; the
+                # strided slices line up the first, second and third variable
+                # of every clause, and any clause repeating one is reported
+                repeated = [
+                    clause_index
+                    for clause_index, (a, b, c) in enumerate(zip(variables[0::3], variables[1::3], variables[2::3]))
+                    if a == b or a == c or b == c
+                ]
+                self.assertEqual(repeated, [])
     
     def test_metadata_generation(self):
         """Test that metadata is correctly generated."""
-        instance = generate_3sat_instance(8, 20, seed=999)
+        instance = self.instances[(8, 20, 999)]
         
         # Check metadata fields
         self.assertIn("clause_to_variable_ratio", instance.metadata)
@@ -126,30 +205,34 @@ class TestGenerate3SATInstance(unittest.TestCase):
     
     def test_parameter_validation(self):
         """Test parameter validation for invalid inputs."""
-        # Test invalid number of variables
-        with self.assertRaises(ValueError):
-            generate_3sat_instance(2, 5)  # Less than 3 variables
-        
-        with self.assertRaises(ValueError):
-            generate_3sat_instance(0, 5)  # Zero variables
-        
-        with self.assertRaises(ValueError):
-            generate_3sat_instance(-1, 5)  # Negative variables
-        
-        # Test invalid number of clauses
-        with self.assertRaises(ValueError):
-            generate_3sat_instance(5, 0)  # Zero clauses
-        
-        with self.assertRaises(ValueError):
-            generate_3sat_instance(5, -1)  # Negative clauses
+        invalid_parameters = [
+            (2, 5),   # Less than 3 variables
+            (0, 5),   # Zero variables
+            (-1, 5),  # Negative variables
+            (5, 0),   # Zero clauses
+            (5, -1),  # Negative clauses
+        ]
+        for num_variables, num_clauses in invalid_parameters:
+            with self.subTest(vars=num_variables, clauses=num_clauses):
+                with self.assertRaises(ValueError):
+                    generate_3sat_instance(num_variables, num_clauses)
     
     def test_minimum_valid_parameters(self):
         """Test generation with minimum valid parameters."""
-        instance = generate_3sat_instance(3, 1, seed=111)
+        instance = self.instances[(3, 1, 111)]
         
         self.assertEqual(instance.size, 3)
         self.assertEqual(len(instance.data.clauses), 1)
         self.assertEqual(len(instance.data.clauses[0]), 3)
+    
+    def test_clause_variable_sampling(self):
+        """Test that clause variables are distinct and cover every ordering."""
+        random.seed(7)
+        samples = [_sample_clause_variables(3) for _ in range(600)]
+        
+        for sample in samples:
+            self.assertEqual(sorted(sample), [1, 2, 3])
+        self.assertEqual(len(set(samples)), 6)
 
 
 class TestGenerateSatisfiable3SATInstance(unittest.TestCase):
@@ -178,27 +261,35 @@ class TestGenerateSatisfiable3SATInstance(unittest.TestCase):
     
     def test_satisfying_assignment_validity(self):
         """Test that the generated instance is actually satisfied by the stored assignment."""
-        instance = generate_satisfiable_3sat_instance(4, 8, seed=123)
-        sat_data = instance.data
+        for num_variables, num_clauses in [(4, 8), (50, 400), (200, 2000)]:
+            with self.subTest(vars=num_variables, clauses=num_clauses):
+                instance = generate_satisfiable_3sat_instance(num_variables, num_clauses, seed=123)
+                assignment = instance.metadata["satisfying_assignment"]
+                
+                # Pack the assignment into one integer (bit i = variable i + 1)
+                # and check each clause with its bitmasks: it is satisfied if
+                # a positive literal's variable is set or a negative
+                # literal's variable is clear
+                assignment_bits = sum(1 << i for i, value in enumerate(assignment) if value)
+                pos, neg = instance.data.to_bitmasks()
+                for clause, positive_mask, negative_mask in zip(instance.data.clauses, pos, neg):
+                    clause_satisfied = (assignment_bits & positive_mask) | (~assignment_bits & negative_mask)
+                    self.assertTrue(clause_satisfied, f"Clause {clause} not satisfied by assignment {assignment}")
+    
+    def test_assignment_not_planted_at_fixed_position(self):
+        """Test that no clause position always agrees with the stored assignment."""
+        instance = generate_satisfiable_3sat_instance(50, 3000, seed=11)
         assignment = instance.metadata["satisfying_assignment"]
         
-        # Check that every clause is satisfied by the assignment
-        for clause in sat_data.clauses:
-            clause_satisfied = False
-            for literal in clause:
-                var_index = abs(literal) - 1
-                if literal > 0:
-                    # Positive literal: satisfied if variable is True
-                    if assignment[var_index]:
-                        clause_satisfied = True
-                        break
-                else:
-                    # Negative literal: satisfied if variable is False
-                    if not assignment[var_index]:
-                        clause_satisfied = True
-                        break
-            
-            self.assertTrue(clause_satisfied, f"Clause {clause} not satisfied by assignment {assignment}")
+        for position in range(3):
+            with self.subTest(position=position):
+                agreeing = sum(
+                    assignment[abs(clause[position]) - 1] == (clause[position] > 0)
+                    for clause in instance.data.clauses
+                )
+                # Each literal follows the assignment about 70% of the time
+                self.assertGreater(agreeing / 3000, 0.65)
+                self.assertLess(agreeing / 3000, 0.76)
     
     def test_reproducible_satisfiable_generation(self):
         """Test that satisfiable generation is reproducible with the same seed."""
@@ -212,13 +303,16 @@ class TestGenerateSatisfiable3SATInstance(unittest.TestCase):
     
     def test_satisfiable_parameter_validation(self):
         """Test parameter validation for satisfiable instance generation."""
-        # Test invalid number of variables
-        with self.assertRaises(ValueError):
-            generate_satisfiable_3sat_instance(2, 5)
-        
-        # Test invalid number of clauses
-        with self.assertRaises(ValueError):
-            generate_satisfiable_3sat_instance(5, 0)
+        invalid_parameters = [
+            (2, 5),   # Less than 3 variables
+            (-1, 5),  # Negative variables
+            (5, 0),   # Zero clauses
+            (5, -1),  # Negative clauses
+        ]
+        for num_variables, num_clauses in invalid_parameters:
+            with self.subTest(vars=num_variables, clauses=num_clauses):
+                with self.assertRaises(ValueError):
+                    generate_satisfiable_3sat_instance(num_variables, num_clauses)
 
 
 class TestDefaultConfigs(unittest.TestCase):
@@ -256,15 +350,9 @@ class TestDefaultConfigs(unittest.TestCase):
         for size in expected_sizes:
             self.assertIn(size, DEFAULT_CONFIGS)
         
-        # Check that configurations are reasonable (increasing sizes)
-        small_vars = DEFAULT_CONFIGS["small"]["num_variables"]
-        medium_vars = DEFAULT_CONFIGS["medium"]["num_variables"]
-        large_vars = DEFAULT_CONFIGS["large"]["num_variables"]
-        extra_large_vars = DEFAULT_CONFIGS["extra_large"]["num_variables"]
-        
-        self.assertLess(small_vars, medium_vars)
-        self.assertLess(medium_vars, large_vars)
-        self.assertLess(large_vars, extra_large_vars)
+        # Check that configurations are reasonable (strictly increasing sizes)
+        num_variables = [DEFAULT_CONFIGS[size]["num_variables"] for size in expected_sizes]
+        self.assertEqual(num_variables, sorted(set(num_variables)))
     
     def test_config_copy_independence(self):
         """Test that get_default_config returns independent copies."""
@@ -6,7 +6,7 @@ including correctness verification, edge case handling, and performance characte
 """
 
 import unittest
-from core.sat_solver import SATBruteForceSolver, SATOptimizedSolver, SATResult, verify_sat_solution
+from core.sat_solver import SATBruteForceSolver, SATOptimizedSolver, SATResult, verify_sat_solution, verify_sat_solutions, _truth_table_columns, _compile_clause_masks, _first_satisfying_assignment, _lowest_pure_literal
 from generators.sat_generator import SATInstance, generate_3sat_instance, generate_satisfiable_3sat_instance
 
 
@@ -167,6 +167,71 @@ class TestSATBruteForceSolver(unittest.TestCase):
         unsatisfiable_clauses = [[1, 1, 1], [-1, -1, -1]]  # x1 and ¬x1 - impossible
         self.assertFalse(self.solver._evaluate_assignment([True], unsatisfiable_clauses))
         self.assertFalse(self.solver._evaluate_assignment([False], unsatisfiable_clauses))
+    
+    def test_compile_clause_masks(self):
+        """Test clause mask compilation, including variables beyond 64 bits."""
+        masks = _compile_clause_masks([[1, -2, 3], [-1, 70], []])
+        
+        self.assertEqual(masks, [(0b101, 0b010), (1 << 69, 0b1), (0, 0)])
+        
+        # x70 must be True once x1 is True
+        sat_instance = SATInstance(70, [[-1, 70]])
+        assignment = [True] + [False] * 69
+        self.assertFalse(verify_sat_solution(sat_instance, assignment))
+        assignment[69] = True
+        self.assertTrue(verify_sat_solution(sat_instance, assignment))
+    
+    def test_assignments_beyond_first_block(self):
+        """Test enumeration order when the solution lies in a later block."""
+        # Only the all-True assignment satisfies (x1) ∧ ... ∧ (x20)
+        num_vars = 20
+        sat_instance = SATInstance(num_vars, [[v, v, v] for v in range(1, num_vars + 1)])
+        
+        result = self.solver.solve(sat_instance)
+        
+        self.assertTrue(result['satisfiable'])
+        self.assertEqual(result['assignment'], [True] * num_vars)
+        self.assertEqual(result['assignments_tried'], 2 ** num_vars)
+        
+        # Contradiction on a high variable only
+        sat_instance = SATInstance(num_vars, [[20, 20, 20], [-20, -20, -20], [1, 2, 3]])
+        result = self.solver.solve(sat_instance)
+        self.assertFalse(result['satisfiable'])
+        self.assertEqual(result['assignments_tried'], 2 ** num_vars)
+    
+    def test_first_satisfying_assignment_kernel(self):
+        """Test that the brute-force kernel works on packed integers only."""
+        # (¬x1 ∨ ¬x2 ∨ x3) ∧ (x1) ∧ (x2): only x1 = x2 = x3 = True, index 0b111
+        clause_masks = _compile_clause_masks([[-1, -2, 3], [1], [2]])
+        self.assertEqual(_first_satisfying_assignment(clause_masks, 3), 0b111)
+        
+        # x18 forced True and x1 forced False across block boundaries
+        clause_masks = _compile_clause_masks([[18], [-1]])
+        self.assertEqual(_first_satisfying_assignment(clause_masks, 18), 1 << 17)
+        
+        self.assertIsNone(_first_satisfying_assignment(_compile_clause_masks([[1], [-1]]), 3))
+    
+    def test_truth_table_columns(self):
+        """Test that truth-table columns match the assignment enumeration order."""
+        columns, all_assignments = _truth_table_columns(3)
+        
+        self.assertEqual(all_assignments, 0b11111111)
+        for assignment_int in range(8):
+            for i, column in enumerate(columns):
+                self.assertEqual(bool((column >> assignment_int) & 1),
+                                 bool((assignment_int >> i) & 1))
+    
+    def test_first_satisfying_assignment_in_enumeration_order(self):
+        """Test that the first satisfying assignment is reported with its position."""
+        # Only x1 = x2 = x3 = True satisfies (x1) ∧ (x2) ∧ (x3): assignment #8
+        clauses = [[1, 1, 1], [2, 2, 2], [3, 3, 3]]
+        sat_instance = SATInstance(3, clauses)
+        
+        result = self.solver.solve(sat_instance)
+        
+        self.assertTrue(result['satisfiable'])
+        self.assertEqual(result['assignment'], [True, True, True])
+        self.assertEqual(result['assignments_tried'], 8)
 
 
 class TestSATResult(unittest.TestCase):
@@ -285,6 +350,52 @@ class TestVerifySATSolution(unittest.TestCase):
         # Test non-satisfying assignment
         self.assertFalse(verify_sat_solution(sat_instance, [False, True, False]))
 
+    
+    def test_verify_solutions_batch(self):
+        """Test batch verification against single-assignment verification."""
+        sat_instance = generate_3sat_instance(6, 12, seed=3).data
+        assignments = [[bool((a >> i) & 1) for i in range(6)] for a in range(64)]
+        
+        expected = [verify_sat_solution(sat_instance, assignment) for assignment in assignments]
+        self.assertEqual(verify_sat_solutions(sat_instance, assignments), expected)
+        self.assertEqual(verify_sat_solutions(sat_instance, []), [])
+        
+        with self.assertRaises(ValueError):
+            verify_sat_solutions(sat_instance, [[True] * 6, [True] * 5])
+    
+    def test_verify_large_instances_against_reference(self):
+        """Test verification of large generated instances against a literal-by-literal check."""
+        for num_vars, num_clauses in [(100, 1000), (1000, 4000)]:
+            with self.subTest(vars=num_vars, clauses=num_clauses):
+                problem_instance = generate_satisfiable_3sat_instance(num_vars, num_clauses, seed=7)
+                sat_instance = problem_instance.data
+                stored = problem_instance.metadata["satisfying_assignment"]
+                
+                # The stored assignment, the same with each of a few variables
+                # flipped, and its complement
+                assignments = [stored]
+                for var_index in range(0, num_vars, num_vars // 10):
+                    flipped = list(stored)
+                    flipped[var_index] = not flipped[var_index]
+                    assignments.append(flipped)
+                assignments.append([not value for value in stored])
+                
+                expected = [
+                    all(
+                        any(assignment[abs(literal) - 1] == (literal > 0) for literal in clause)
+                        for clause in sat_instance.clauses
+                    )
+                    for assignment in assignments
+                ]
+                self.assertTrue(expected[0])
+                self.assertIn(False, expected)
+                
+                self.assertEqual(
+                    [verify_sat_solution(sat_instance, assignment) for assignment in assignments],
+                    expected
+                )
+                self.assertEqual(verify_sat_solutions(sat_instance, assignments), expected)
+
 
 class TestSATSolverIntegration(unittest.TestCase):
     """Integration tests combining solver with generator."""
@@ -375,6 +486,51 @@ class TestSATOptimizedSolver(unittest.TestCase):
         # Verify the solution
         self.assertTrue(verify_sat_solution(sat_instance, result['assignment']))
     
+    def test_long_implication_chain(self):
+        """Test that long unit propagation chains do not exhaust the recursion limit."""
+        # (x1) ∧ (¬x1 ∨ x2) ∧ (¬x2 ∨ x3) ∧ ... ∧ (¬x1999 ∨ x2000)
+        num_vars = 2000
+        clauses = [[1]] + [[-i, i + 1] for i in range(1, num_vars)]
+        sat_instance = SATInstance(num_vars, clauses)
+        
+        result = self.solver.solve(sat_instance)
+        
+        self.assertTrue(result['satisfiable'])
+        self.assertEqual(result['unit_propagations'], num_vars)
+        self.assertEqual(result['assignments_tried'], 0)
+        self.assertTrue(all(result['assignment']))
+    
+    def test_deep_decision_stack(self):
+        """Test that searches deeper than the recursion limit succeed."""
+        # Independent XOR pairs (x1 ⊕ x2) ∧ (x3 ⊕ x4) ∧ ... need one decision each
+        num_pairs = 1500
+        clauses = []
+        for i in range(1, 2 * num_pairs, 2):
+            clauses.append([i, i + 1])
+            clauses.append([-i, -(i + 1)])
+        sat_instance = SATInstance(2 * num_pairs, clauses)
+        
+        result = self.solver.solve(sat_instance)
+        
+        self.assertTrue(result['satisfiable'])
+        self.assertTrue(verify_sat_solution(sat_instance, result['assignment']))
+        self.assertEqual(result['assignments_tried'], num_pairs)
+        self.assertEqual(result['unit_propagations'], num_pairs)
+    
+    def test_backtracking_leaves_instance_unchanged(self):
+        """Test that backtracking restores state without touching the input clauses."""
+        # Forces a conflict on x1 = True before x1 = False succeeds
+        clauses = [[-1, 2], [-1, -2], [1, 3], [1, -3, 4], [-4, 3]]
+        sat_instance = SATInstance(4, clauses)
+        
+        first = self.solver.solve(sat_instance)
+        second = self.solver.solve(sat_instance)
+        
+        self.assertTrue(first['satisfiable'])
+        self.assertTrue(verify_sat_solution(sat_instance, first['assignment']))
+        self.assertEqual(first, second)
+        self.assertEqual(sat_instance.clauses, [[-1, 2], [-1, -2], [1, 3], [1, -3, 4], [-4, 3]])
+    
     def test_pure_literal_elimination(self):
         """Test that pure literal elimination works correctly."""
         # Create instance where x3 appears only positively: (x1 ∨ x2 ∨ x3) ∧ (¬x1 ∨ x2 ∨ x3)
@@ -470,56 +626,71 @@ class TestSATOptimizedSolver(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.solver.solve(None)
     
-    def test_simplify_clauses_method(self):
-        """Test the internal _simplify_clauses method."""
-        clauses = [[1, -2, 3], [-1, 2, -3], [1, 2, 3]]
-        assignment = [True, None, None]  # x1 = True, x2 and x3 unassigned
-        
-        simplified = self.solver._simplify_clauses(clauses, assignment)
-        
-        # First clause should be satisfied and removed
-        # Second clause should become [2, -3] (since -1 is false)
-        # Third clause should be satisfied and removed
-        expected = [[2, -3]]
-        self.assertEqual(simplified, expected)
-    
-    def test_find_unit_literal_method(self):
-        """Test the internal _find_unit_literal method."""
-        clauses = [[1, 2], [3], [-1, -2]]
-        
-        unit_literal = self.solver._find_unit_literal(clauses)
-        self.assertEqual(unit_literal, 3)
-        
-        # Test with no unit literals
-        clauses = [[1, 2], [-1, -2]]
-        unit_literal = self.solver._find_unit_literal(clauses)
-        self.assertIsNone(unit_literal)
-    
-    def test_find_pure_literal_method(self):
-        """Test the internal _find_pure_literal method."""
-        # x3 appears only positively
-        clauses = [[1, -2, 3], [-1, 2, 3]]
-        
-        pure_literal = self.solver._find_pure_literal(clauses)
-        self.assertEqual(pure_literal, 3)
-        
-        # Test with no pure literals
-        clauses = [[1, -2, 3], [-1, 2, -3]]
-        pure_literal = self.solver._find_pure_literal(clauses)
-        self.assertIsNone(pure_literal)
-    
-    def test_choose_branch_variable_method(self):
-        """Test the internal _choose_branch_variable method."""
-        assignment = [True, None, False, None]
-        
-        branch_var = self.solver._choose_branch_variable(assignment)
-        self.assertEqual(branch_var, 2)  # First unassigned variable (x2)
-        
-        # Test with all variables assigned
-        assignment = [True, False, True]
-        branch_var = self.solver._choose_branch_variable(assignment)
-        self.assertIsNone(branch_var)
-
+    def _start_search(self, num_variables, clauses):
+        """Initialize the solver's search state as solve() would."""
+        self.solver.unit_propagations = 0
+        self.solver.pure_eliminations = 0
+        self.solver._initialize_search(SATInstance(num_variables, clauses))
+    
+    def test_propagate_unit_chain(self):
+        """Test that _propagate follows a chain of unit clauses."""
+        self._start_search(4, [[-1, 2], [-2, 3], [-3, -1, 4]])
+        self.solver._assign(1)
+        
+        self.assertTrue(self.solver._propagate())
+        self.assertEqual(self.solver._assignment, [True, True, True, True])
+        self.assertEqual(self.solver.unit_propagations, 3)
+        self.assertEqual(self.solver.pure_eliminations, 0)
+    
+    def test_propagate_conflict(self):
+        """Test that _propagate reports a falsified clause."""
+        # x1 forces x2 through the first clause and falsifies the second
+        self._start_search(2, [[-1, 2], [-1, -2]])
+        self.solver._assign(1)
+        
+        self.assertFalse(self.solver._propagate())
+    
+    def test_propagate_pure_literals(self):
+        """Test that _propagate eliminates pure literals, lowest variable first."""
+        # x3 only occurs negatively; once it is false, ¬x1 is pure too
+        self._start_search(4, [[1, -2, -3], [-1, 2, 4], [-3, 4]])
+        
+        self.assertTrue(self.solver._propagate())
+        self.assertEqual(self.solver._trail, [-3, -1])
+        self.assertEqual(self.solver.pure_eliminations, 2)
+        self.assertEqual(self.solver._unsatisfied, 0)
+    
+    def test_lowest_pure_literal(self):
+        """Test pure literal selection from the presence bitsets."""
+        # x1 and x2 occur in both polarities, x3 only negatively, x4 only positively
+        self._start_search(4, [[1, -2, -3], [-1, 2, 4], [-3, 4]])
+        self.assertEqual(_lowest_pure_literal(
+            self.solver._positive_present, self.solver._negative_present, -1), -3)
+        
+        # Variables outside the candidate set are skipped
+        self.assertEqual(_lowest_pure_literal(
+            self.solver._positive_present, self.solver._negative_present, 1 << 4), 4)
+        
+        # Every variable is pure; x1 (positive) is the lowest
+        self._start_search(3, [[1, -2], [1, 3]])
+        self.assertEqual(_lowest_pure_literal(
+            self.solver._positive_present, self.solver._negative_present, -1), 1)
+        
+        # No pure literals
+        self._start_search(3, [[1, -2, 3], [-1, 2, -3]])
+        self.assertIsNone(_lowest_pure_literal(
+            self.solver._positive_present, self.solver._negative_present, -1))
+        self.assertIsNone(_lowest_pure_literal(0, 0, -1))
+    
+    def test_choose_branch_literal_jeroslow_wang(self):
+        """Test that branching prefers literals in many short clauses."""
+        # x2 and x3 tie on combined score; the lower variable wins, positive first
+        self.solver._initialize_search(SATInstance(3, [[1, 2, 3], [2, 3], [-3, -2]]))
+        self.assertEqual(self.solver._choose_branch_literal(), 2)
+        
+        # ¬x1 appears in two binary clauses, so x1 = False is tried first
+        self.solver._initialize_search(SATInstance(3, [[-1, 2], [-1, 3], [1, 2, 3]]))
+        self.assertEqual(self.solver._choose_branch_literal(), -1)
 
 class TestSATSolverComparison(unittest.TestCase):
     """Test cases comparing brute force and optimized solvers."""
@@ -5,6 +5,7 @@ This module contains comprehensive tests for the subset sum instance generation
 functionality, including parameter validation, reproducibility, and correctness.
 """
 
+import itertools
 import unittest
 import random
 from generators.subset_generator import (
@@ -13,7 +14,8 @@ from generators.subset_generator import (
     generate_solvable_subset_sum_instance,
     generate_structured_subset_sum_instance,
     get_default_config,
-    DEFAULT_CONFIGS
+    DEFAULT_CONFIGS,
+    _is_reachable_sum
 )
 from core.data_models import ProblemInstance
 
@@ -101,6 +103,17 @@ class TestGenerateSubsetSumInstance(unittest.TestCase):
         self.assertEqual(problem1.data.numbers, problem2.data.numbers)
         self.assertEqual(problem1.data.target, problem2.data.target)
     
+    def test_seed_leaves_global_random_state(self):
+        """Test that a seeded call neither reseeds nor advances the global generator."""
+        random.seed(99)
+        expected = random.random()
+        
+        random.seed(99)
+        generate_subset_sum_instance(5, seed=1)
+        generate_solvable_subset_sum_instance(5, seed=1)
+        generate_structured_subset_sum_instance(5, "geometric", seed=1)
+        self.assertEqual(random.random(), expected)
+    
     def test_different_seeds_produce_different_results(self):
         """Test that different seeds produce different results."""
         problem1 = generate_subset_sum_instance(10, max_value=20, seed=1)
@@ -147,6 +160,32 @@ class TestGenerateSubsetSumInstance(unittest.TestCase):
         self.assertEqual(metadata["min_value"], min(numbers))
         self.assertEqual(metadata["max_value_actual"], max(numbers))
         self.assertEqual(metadata["generation_method"], "random_subset_sum")
+    
+    def test_solvability_metadata(self):
+        """Test that a given target is checked for reachability."""
+        for seed in range(20):
+            with self.subTest(seed=seed):
+                problem = generate_subset_sum_instance(6, max_value=10, target=23, seed=seed)
+                numbers = problem.data.numbers
+                expected = any(
+                    sum(combination) == 23
+                    for size in range(len(numbers) + 1)
+                    for combination in itertools.combinations(numbers, size)
+                )
+                self.assertEqual(problem.metadata["is_solvable"], expected)
+        
+        # A generated target is the sum of a chosen subset
+        problem = generate_subset_sum_instance(6, max_value=10, seed=3)
+        self.assertTrue(problem.metadata["is_solvable"])
+    
+    def test_is_reachable_sum(self):
+        """Test the bitset reachability check on small cases."""
+        self.assertTrue(_is_reachable_sum([3, 5, 7], 0))
+        self.assertTrue(_is_reachable_sum([3, 5, 7], 12))
+        self.assertTrue(_is_reachable_sum([3, 5, 7], 15))
+        self.assertFalse(_is_reachable_sum([3, 5, 7], 4))
+        self.assertFalse(_is_reachable_sum([3, 5, 7], 16))
+        self.assertFalse(_is_reachable_sum([], 1))
 
 
 class TestGenerateSolvableSubsetSumInstance(unittest.TestCase):
@@ -232,6 +271,8 @@ class TestGenerateStructuredSubsetSumInstance(unittest.TestCase):
         
         # Check metadata
         self.assertEqual(problem.metadata["generation_method"], "structured_powers_of_2")
+        self.assertEqual(problem.metadata["total_sum"], sum(expected))
+        self.assertEqual(problem.metadata["max_value_actual"], 16)
     
     def test_invalid_structure_type(self):
         """Test invalid structure type."""
@@ -6,12 +6,20 @@ including correctness verification, edge cases, and performance characteristics.
 """
 
 import unittest
+from array import array
 from core.subset_sum import (
     SubsetSumBruteForce,
+    SubsetSumBranchAndBound,
     SubsetSumDP,
+    SubsetSumSparseDP,
+    SubsetSumMITM,
     SubsetSumResult,
     verify_subset_sum_solution,
-    find_all_subset_sum_solutions
+    find_all_subset_sum_solutions,
+    find_all_subset_sum_solutions_iter,
+    _gray_code_sums,
+    _mask_indices,
+    _gray_code_sum_table
 )
 from generators.subset_generator import SubsetSumInstance, generate_solvable_subset_sum_instance
 
@@ -140,6 +148,122 @@ class TestSubsetSumBruteForce(unittest.TestCase):
         self.assertEqual(result['subsets_tried'], 8)
         self.assertFalse(result['solution_found'])
 
+    
+    def test_gray_code_enumeration_order(self):
+        """Test that subsets are enumerated in Gray-code order."""
+        # Gray-code order visits {}, {1}, {1, 2}, ... so {1, 2} is the third subset
+        instance = SubsetSumInstance([1, 2, 3], 3)
+        
+        result = self.solver.solve(instance)
+        
+        self.assertEqual(result['solution_indices'], [0, 1])
+        self.assertEqual(result['solution_subset'], [1, 2])
+        self.assertEqual(result['subsets_tried'], 3)
+    
+    def test_gray_code_sums(self):
+        """Test both Gray-code sum enumerators against direct subset sums."""
+        numbers = [3, -1, 4, 1, -5, 9, 2, 6, 5, -3, 5]
+        expected = []
+        for step in range(2 ** len(numbers)):
+            mask = step ^ (step >> 1)
+            expected.append(sum(x for i, x in enumerate(numbers) if mask >> i & 1))
+        
+        self.assertEqual(list(_gray_code_sums(numbers)), expected)
+        self.assertEqual(_gray_code_sum_table(numbers), expected)
+        self.assertEqual(list(_gray_code_sums([])), [0])
+    
+    def test_mask_indices(self):
+        """Test decoding subset masks into element indices."""
+        self.assertEqual(_mask_indices(0), [])
+        self.assertEqual(_mask_indices(0b1), [0])
+        self.assertEqual(_mask_indices(0b101100), [2, 3, 5])
+        self.assertEqual(_mask_indices(1 << 70), [70])
+    
+    def test_solution_beyond_first_block(self):
+        """Test Gray-code positions for solutions among the high elements."""
+        # Only {10^6} works; mask 1 << 17 is the last of the 2^18 Gray-code subsets
+        numbers = list(range(1, 18)) + [10 ** 6]
+        instance = SubsetSumInstance(numbers, 10 ** 6)
+        
+        result = self.solver.solve(instance)
+        
+        self.assertEqual(result['solution_indices'], [17])
+        self.assertEqual(result['subsets_tried'], 2 ** 18)
+        
+        all_solutions = find_all_subset_sum_solutions(SubsetSumInstance(numbers, 10 ** 6 + 3))
+        self.assertEqual(sorted(all_solutions), [[1, 2, 10 ** 6], [3, 10 ** 6]])
+
+class TestSubsetSumBranchAndBound(unittest.TestCase):
+    """Test cases for the SubsetSumBranchAndBound solver."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.solver = SubsetSumBranchAndBound()
+    
+    def test_simple_solvable_case(self):
+        """Test a simple case with a known solution."""
+        numbers = [1, 2, 3, 4, 5]
+        instance = SubsetSumInstance(numbers, 7)
+        
+        result = self.solver.solve(instance)
+        
+        self.assertTrue(result['solution_found'])
+        self.assertEqual(sum(result['solution_subset']), 7)
+        self.assertEqual(result['solution_indices'], sorted(result['solution_indices']))
+        for i, idx in enumerate(result['solution_indices']):
+            self.assertEqual(result['solution_subset'][i], numbers[idx])
+    
+    def test_pruning(self):
+        """Test that hopeless branches are cut off."""
+        # Even the full set sums to 15 < 100, so only the root is visited
+        result = self.solver.solve(SubsetSumInstance([1, 2, 3, 4, 5], 100))
+        
+        self.assertFalse(result['solution_found'])
+        self.assertEqual(result['subsets_tried'], 1)
+        
+        # Fewer nodes than the 2^n subsets brute force would try
+        result = self.solver.solve(SubsetSumInstance([2, 4, 6, 8, 10, 12, 14, 16], 33))
+        self.assertFalse(result['solution_found'])
+        self.assertLess(result['subsets_tried'], 2 ** 8)
+    
+    def test_negative_numbers(self):
+        """Test that bounds account for negative elements."""
+        instance = SubsetSumInstance([5, -7, 3, -2], -4)
+        
+        result = self.solver.solve(instance)
+        
+        self.assertTrue(result['solution_found'])
+        self.assertEqual(sum(result['solution_subset']), -4)
+    
+    def test_agrees_with_brute_force(self):
+        """Test agreement with brute force on generated instances."""
+        brute_force = SubsetSumBruteForce()
+        
+        for seed in range(10):
+            with self.subTest(seed=seed):
+                problem = generate_solvable_subset_sum_instance(9, max_value=30, seed=seed)
+                for target in (problem.data.target, problem.data.target + 1, 1, 0):
+                    instance = SubsetSumInstance(problem.data.numbers, target)
+                    result = self.solver.solve(instance)
+                    self.assertEqual(result['solution_found'],
+                                     brute_force.solve(instance)['solution_found'])
+                    if result['solution_found']:
+                        self.assertEqual(sum(result['solution_subset']), target)
+    
+    def test_solver_reused_across_sizes(self):
+        """Test that one solver object handles a batch of differently sized instances."""
+        # Per-instance search state is rebuilt by every solve
+        self.assertTrue(self.solver.solve(SubsetSumInstance([3, 9, 4, 7, 1, 8], 12))['solution_found'])
+        result = self.solver.solve(SubsetSumInstance([6], 6))
+        self.assertEqual(result['solution_indices'], [0])
+        self.assertEqual(result['subsets_tried'], 2)
+        self.assertFalse(self.solver.solve(SubsetSumInstance([], 1))['solution_found'])
+        self.assertTrue(self.solver.solve(SubsetSumInstance([3, 9, 4, 7, 1, 8], 12))['solution_found'])
+    
+    def test_invalid_input_type(self):
+        """Test error handling for invalid input type."""
+        with self.assertRaises(TypeError):
+            self.solver.solve("not a SubsetSumInstance")
 
 class TestSubsetSumResult(unittest.TestCase):
     """Test cases for the SubsetSumResult class."""
@@ -175,6 +299,16 @@ class TestSubsetSumResult(unittest.TestCase):
         self.assertIn("= 5", str_repr)
         self.assertIn("tried 10", str_repr)
     
+    def test_result_solution_sum(self):
+        """Test that the solution sum is computed once or taken as given."""
+        result = SubsetSumResult(solution_found=True, solution_subset=[2, 3], target=5)
+        self.assertEqual(result.solution_sum, 5)
+        
+        result = SubsetSumResult(solution_found=True, solution_subset=[2, 3],
+                                 target=5, solution_sum=5)
+        self.assertEqual(result.solution_sum, 5)
+        self.assertIn("= 5", str(result))
+    
     def test_result_str_representation_not_found(self):
         """Test string representation when no solution is found."""
         result = SubsetSumResult(
@@ -206,6 +340,24 @@ class TestSubsetSumResult(unittest.TestCase):
         self.assertEqual(result_dict['subsets_tried'], 8)
         self.assertEqual(result_dict['target'], 5)
         self.assertEqual(result_dict['algorithm'], "brute_force")
+    
+    def test_result_with_array_sequences(self):
+        """Test that array-backed subsets are kept and converted on request."""
+        result = SubsetSumResult(
+            solution_found=True,
+            solution_subset=array('q', [1, 4]),
+            solution_indices=array('q', [0, 3]),
+            target=5
+        )
+        
+        self.assertEqual(result.solution_sum, 5)
+        self.assertIn("{1, 4}", str(result))
+        self.assertIsInstance(result.to_dict()['solution_subset'], array)
+        
+        result_dict = result.to_dict(as_lists=True)
+        self.assertEqual(result_dict['solution_subset'], [1, 4])
+        self.assertEqual(result_dict['solution_indices'], [0, 3])
+        self.assertTrue(verify_subset_sum_solution(SubsetSumInstance([1, 2, 3, 4], 5), result))
 
 
 class TestVerifySubsetSumSolution(unittest.TestCase):
@@ -239,6 +391,36 @@ class TestVerifySubsetSumSolution(unittest.TestCase):
         with self.assertRaises(ValueError):
             verify_subset_sum_solution(instance, solution)
     
+    def test_invalid_solution_element_reused(self):
+        """Test verification of solution using an element too many times."""
+        instance = SubsetSumInstance([2, 3, 3, 5], 8)
+        
+        # 3 occurs twice, so it may be used twice
+        self.assertTrue(verify_subset_sum_solution(instance, [2, 3, 3]))
+        with self.assertRaises(ValueError):
+            verify_subset_sum_solution(instance, [2, 2, 2, 2])
+    
+    def test_result_solution(self):
+        """Test verification of a SubsetSumResult through its indices."""
+        instance = SubsetSumInstance([2, 3, 3, 5], 8)
+        
+        result = SubsetSumResult(True, solution_subset=[3, 5], solution_indices=[2, 3], target=8)
+        self.assertTrue(verify_subset_sum_solution(instance, result))
+        
+        # Index 1 holds 3, not 2
+        result = SubsetSumResult(True, solution_subset=[2, 3], solution_indices=[1, 2], target=8)
+        with self.assertRaises(ValueError):
+            verify_subset_sum_solution(instance, result)
+        
+        # The same position cannot be used twice
+        result = SubsetSumResult(True, solution_subset=[3, 3], solution_indices=[1, 1], target=8)
+        with self.assertRaises(ValueError):
+            verify_subset_sum_solution(instance, result)
+        
+        # Without indices the elements are checked by value
+        result = SubsetSumResult(True, solution_subset=[3, 5], target=8)
+        self.assertTrue(verify_subset_sum_solution(instance, result))
+    
     def test_empty_solution(self):
         """Test verification of empty solution."""
         numbers = [1, 2, 3]
@@ -304,6 +486,22 @@ class TestFindAllSubsetSumSolutions(unittest.TestCase):
         
         self.assertEqual(len(all_solutions), 1)
         self.assertEqual(all_solutions[0], [])
+    
+    def test_iter_with_limit(self):
+        """Test generating solutions lazily with and without a limit."""
+        # Every subset of twenty 1s with ten elements is a solution
+        instance = SubsetSumInstance([1] * 20, 10)
+        
+        first_three = list(find_all_subset_sum_solutions_iter(instance, limit=3))
+        self.assertEqual(len(first_three), 3)
+        for solution in first_three:
+            self.assertEqual(solution, [1] * 10)
+        
+        self.assertEqual(list(find_all_subset_sum_solutions_iter(instance, limit=0)), [])
+        
+        small = SubsetSumInstance([1, 2, 3, 4], 5)
+        self.assertEqual(list(find_all_subset_sum_solutions_iter(small)),
+                         find_all_subset_sum_solutions(small))
 
 
 class TestSubsetSumDP(unittest.TestCase):
@@ -400,6 +598,51 @@ class TestSubsetSumDP(unittest.TestCase):
         self.assertEqual(self.solver.get_complexity_class(), "Pseudo-polynomial Time (O(n * sum))")
         self.assertEqual(self.solver.get_algorithm_name(), "Dynamic Programming Subset Sum Solver")
     
+    def test_reconstruction_across_checkpoints(self):
+        """Test backtracking through several recomputed bitset segments."""
+        # 40 elements give checkpoints every 6 rows; only the elements at
+        # indices 0, 13, 26 and 39 can make up the odd target
+        numbers = [2 * i for i in range(1, 41)]
+        numbers[0], numbers[13], numbers[26], numbers[39] = 1, 1001, 10001, 100001
+        target = 1 + 1001 + 10001 + 100001
+        instance = SubsetSumInstance(numbers, target)
+        
+        result = self.solver.solve(instance)
+        
+        self.assertTrue(result['solution_found'])
+        self.assertTrue(verify_subset_sum_solution(instance, result['solution_subset']))
+        for i, idx in enumerate(result['solution_indices']):
+            self.assertEqual(result['solution_subset'][i], numbers[idx])
+        for idx in (0, 13, 26, 39):
+            self.assertIn(idx, result['solution_indices'])
+        
+        # Negative elements shift rows down instead of up
+        numbers = [5, -3, 7, -2, 11, 4, -6, 9, 13, -1]
+        instance = SubsetSumInstance(numbers, 6)
+        result = self.solver.solve(instance)
+        self.assertTrue(verify_subset_sum_solution(instance, result['solution_subset']))
+    
+    def test_partial_sums_outside_target_window(self):
+        """Test solutions whose partial sums leave the range [0, target]."""
+        brute_force = SubsetSumBruteForce()
+        cases = [
+            ([3, -1], 2),             # 3 overshoots the target before -1
+            ([-4, 1, 5], 1),          # -4 dips below 0 first
+            ([-1, -5, 9], -6),        # negative target
+            ([8, -7, -7, 4, -5], -3),
+            ([2, 7, -12, -5, 8], -9),
+        ]
+        for numbers, target in cases:
+            with self.subTest(numbers=numbers, target=target):
+                instance = SubsetSumInstance(numbers, target)
+                result = self.solver.solve(instance)
+                
+                self.assertTrue(brute_force.solve(instance)['solution_found'])
+                self.assertTrue(result['solution_found'])
+                self.assertEqual(sum(result['solution_subset']), target)
+                self.assertEqual([numbers[i] for i in result['solution_indices']],
+                                 result['solution_subset'])
+    
     def test_dp_table_size_calculation(self):
         """Test that DP table size is calculated correctly."""
         numbers = [1, 2, 3]
@@ -418,6 +661,151 @@ class TestSubsetSumDP(unittest.TestCase):
             self.solver.solve("not a SubsetSumInstance")
 
 
+class TestSubsetSumSparseDP(unittest.TestCase):
+    """Test cases for the SubsetSumSparseDP solver."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.solver = SubsetSumSparseDP()
+    
+    def test_large_sparse_target(self):
+        """Test a target far larger than the number of reachable sums."""
+        numbers = [10 ** 9, 3 * 10 ** 9, 7 * 10 ** 9, 12 * 10 ** 9]
+        target = 10 ** 10
+        instance = SubsetSumInstance(numbers, target)
+        
+        result = self.solver.solve(instance)
+        
+        self.assertTrue(result['solution_found'])
+        self.assertEqual(result['solution_subset'], [3 * 10 ** 9, 7 * 10 ** 9])
+        self.assertEqual(result['solution_indices'], [1, 2])
+        self.assertLessEqual(result['sums_reached'], 2 ** len(numbers))
+    
+    def test_unsolvable_case(self):
+        """Test a case with no solution."""
+        instance = SubsetSumInstance([2, 4, 6, 8, 10], 5)
+        
+        result = self.solver.solve(instance)
+        
+        self.assertFalse(result['solution_found'])
+        self.assertIsNone(result['solution_subset'])
+        self.assertIsNone(result['solution_indices'])
+    
+    def test_edge_cases(self):
+        """Test empty set, empty subset, negative target and duplicate cases."""
+        self.assertEqual(self.solver.solve(SubsetSumInstance([], 0))['solution_subset'], [])
+        self.assertFalse(self.solver.solve(SubsetSumInstance([], 3))['solution_found'])
+        self.assertFalse(self.solver.solve(SubsetSumInstance([1, 2], -1))['solution_found'])
+        self.assertEqual(self.solver.solve(SubsetSumInstance([4, 4], 8))['solution_indices'], [0, 1])
+    
+    def test_agrees_with_brute_force_on_negative_elements(self):
+        """Test agreement with brute force when partial sums leave [0, target]."""
+        brute_force = SubsetSumBruteForce()
+        cases = [
+            ([3, -1], 2),
+            ([-4, 1, 5], 1),
+            ([-1, -5, 9], -6),
+            ([2, 7, -12, -5, 8], -9),
+            ([5, -3, 7, -2, 11, 4, -6, 9, 13, -1], 6),
+            ([5, -3, 7, -2, 11], 100),
+        ]
+        for numbers, target in cases:
+            with self.subTest(numbers=numbers, target=target):
+                instance = SubsetSumInstance(numbers, target)
+                result = self.solver.solve(instance)
+                
+                self.assertEqual(result['solution_found'],
+                                 brute_force.solve(instance)['solution_found'])
+                if result['solution_found']:
+                    self.assertEqual(sum(result['solution_subset']), target)
+                    self.assertEqual([numbers[i] for i in result['solution_indices']],
+                                     result['solution_subset'])
+    
+    def test_agrees_with_dp(self):
+        """Test agreement with the bitset DP solver on generated instances."""
+        dp = SubsetSumDP()
+        
+        for seed in range(10):
+            with self.subTest(seed=seed):
+                problem = generate_solvable_subset_sum_instance(9, max_value=30, seed=seed)
+                for target in (problem.data.target, problem.data.target + 1, 1):
+                    instance = SubsetSumInstance(problem.data.numbers, target)
+                    result = self.solver.solve(instance)
+                    self.assertEqual(result['solution_found'],
+                                     dp.solve(instance)['solution_found'])
+                    if result['solution_found']:
+                        self.assertTrue(verify_subset_sum_solution(instance, result['solution_subset']))
+    
+    def test_invalid_input_type(self):
+        """Test error handling for invalid input type."""
+        with self.assertRaises(TypeError):
+            self.solver.solve("not a SubsetSumInstance")
+
+
+class TestSubsetSumMITM(unittest.TestCase):
+    """Test cases for the SubsetSumMITM solver."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.solver = SubsetSumMITM()
+    
+    def test_solution_spanning_both_halves(self):
+        """Test a solution that combines elements from both halves."""
+        numbers = [3, 34, 4, 12, 5, 2]
+        target = 9
+        instance = SubsetSumInstance(numbers, target)
+        
+        result = self.solver.solve(instance)
+        
+        self.assertTrue(result['solution_found'])
+        self.assertEqual(sum(result['solution_subset']), target)
+        self.assertEqual(result['solution_indices'], sorted(result['solution_indices']))
+        for i, idx in enumerate(result['solution_indices']):
+            self.assertEqual(result['solution_subset'][i], numbers[idx])
+        self.assertEqual(result['sums_enumerated'], 2 ** 3 + 2 ** 3)
+    
+    def test_unsolvable_case(self):
+        """Test a case with no solution."""
+        instance = SubsetSumInstance([2, 4, 6, 8, 10], 5)
+        
+        result = self.solver.solve(instance)
+        
+        self.assertFalse(result['solution_found'])
+        self.assertIsNone(result['solution_subset'])
+        self.assertIsNone(result['solution_indices'])
+    
+    def test_edge_cases(self):
+        """Test empty set, empty subset and single element cases."""
+        self.assertEqual(self.solver.solve(SubsetSumInstance([], 0))['solution_subset'], [])
+        self.assertFalse(self.solver.solve(SubsetSumInstance([], 3))['solution_found'])
+        self.assertEqual(self.solver.solve(SubsetSumInstance([1, 2, 3], 0))['solution_indices'], [])
+        self.assertEqual(self.solver.solve(SubsetSumInstance([7], 7))['solution_subset'], [7])
+    
+    def test_agrees_with_brute_force(self):
+        """Test agreement with brute force on generated instances."""
+        brute_force = SubsetSumBruteForce()
+        
+        for seed in range(10):
+            with self.subTest(seed=seed):
+                problem = generate_solvable_subset_sum_instance(9, max_value=30, seed=seed)
+                for target in (problem.data.target, problem.data.target + 1, 1):
+                    instance = SubsetSumInstance(problem.data.numbers, target)
+                    result = self.solver.solve(instance)
+                    self.assertEqual(result['solution_found'],
+                                     brute_force.solve(instance)['solution_found'])
+                    if result['solution_found']:
+                        self.assertEqual(sum(result['solution_subset']), target)
+    
+    def test_invalid_input_type(self):
+        """Test error handling for invalid input type."""
+        with self.assertRaises(TypeError):
+            self.solver.solve("not a SubsetSumInstance")
+    
+    def test_algorithm_properties(self):
+        """Test algorithm property methods."""
+        self.assertEqual(self.solver.get_complexity_class(), "NP-Complete (O(2^(n/2)) Time)")
+        self.assertEqual(self.solver.get_algorithm_name(), "Meet-in-the-Middle Subset Sum Solver")
+
 class TestSolverComparison(unittest.TestCase):
     """Test cases comparing brute force and DP solvers."""
     
@@ -0,0 +1,246 @@
+"""
+Unit tests for the timeout management system.
+
+This module tests the TimeoutManager class and the module-level convenience
+functions, covering successful execution, timeout detection and cleanup.
+"""
+
+import signal
+import threading
+import time
+import unittest
+from benchmarks.timeout_manager import (
+    TimeoutManager,
+    TimeoutError,
+    default_timeout_manager,
+    execute_with_timeout,
+    timeout,
+    _deadline_stack
+)
+
+
+class TestTimeoutManager(unittest.TestCase):
+    """Test cases for the TimeoutManager class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.manager = TimeoutManager(default_timeout=5.0)
+    
+    def test_default_timeout(self):
+        """Test that the default timeout is stored."""
+        self.assertEqual(self.manager.default_timeout, 5.0)
+        self.assertEqual(TimeoutManager().default_timeout, 30.0)
+    
+    def test_execute_with_timeout_returns_result(self):
+        """Test that a fast function returns its result."""
+        result = self.manager.execute_with_timeout(lambda: 42, timeout_seconds=1.0)
+        
+        self.assertEqual(result, 42)
+    
+    def test_execute_with_timeout_propagates_exceptions(self):
+        """Test that non-timeout exceptions are propagated unchanged."""
+        def failing():
+            raise ValueError("boom")
+        
+        with self.assertRaises(ValueError):
+            self.manager.execute_with_timeout(failing, timeout_seconds=1.0)
+    
+    def test_zero_timeout_disables_timeout(self):
+        """Test that a non-positive timeout runs the function without a limit."""
+        self.assertEqual(self.manager.execute_with_timeout(lambda: "done", timeout_seconds=0), "done")
+        self.assertEqual(self.manager.execute_with_timeout(lambda: "done", timeout_seconds=-1), "done")
+    
+    @unittest.skipUnless(hasattr(signal, 'SIGALRM'), "requires signal-based timeouts")
+    def test_sub_second_timeout(self):
+        """Test that fractional timeouts below one second are enforced."""
+        start = time.monotonic()
+        
+        with self.assertRaises(TimeoutError):
+            self.manager.execute_with_timeout(lambda: time.sleep(2.0), timeout_seconds=0.05)
+        
+        self.assertLess(time.monotonic() - start, 1.0)
+    
+    @unittest.skipUnless(hasattr(signal, 'SIGALRM'), "requires signal-based timeouts")
+    def test_handler_installed_once_and_forwards_alarms(self):
+        """Test that the timer is disarmed and other alarms reach the previous handler."""
+        received = []
+        
+        def host_handler(signum, frame):
+            received.append(signum)
+        
+        original_handler = signal.signal(signal.SIGALRM, host_handler)
+        try:
+            self.manager.execute_with_timeout(lambda: None, timeout_seconds=0.5)
+            timeout_handler = signal.getsignal(signal.SIGALRM)
+            self.assertIsNot(timeout_handler, host_handler)
+            
+            # Later timed calls reuse the installed handler
+            with self.manager.timeout(0.5):
+                TimeoutManager().execute_with_timeout(lambda: None, timeout_seconds=0.5)
+                # Alarms sent well before the deadline are not timeouts
+                signal.raise_signal(signal.SIGALRM)
+            
+            self.assertIs(signal.getsignal(signal.SIGALRM), timeout_handler)
+            self.assertEqual(signal.getitimer(signal.ITIMER_REAL), (0.0, 0.0))
+            
+            # Alarms outside a timed block reach the host's handler
+            signal.raise_signal(signal.SIGALRM)
+            self.assertEqual(received, [signal.SIGALRM, signal.SIGALRM])
+        finally:
+            signal.signal(signal.SIGALRM, original_handler)
+    
+    @unittest.skipUnless(hasattr(signal, 'SIGALRM'), "requires signal-based timeouts")
+    def test_nested_timeouts(self):
+        """Test that nested timeouts keep the enclosing deadline armed."""
+        # The enclosing deadline fires even inside a longer inner timeout
+        start = time.monotonic()
+        with self.assertRaises(TimeoutError) as context:
+            with self.manager.timeout(0.1):
+                with TimeoutManager().timeout(5.0):
+                    time.sleep(2.0)
+        self.assertIn("0.1", str(context.exception))
+        self.assertLess(time.monotonic() - start, 1.0)
+        
+        # Leaving an inner block re-arms the timer for the enclosing one
+        start = time.monotonic()
+        with self.assertRaises(TimeoutError):
+            with self.manager.timeout(0.2):
+                self.manager.execute_with_timeout(lambda: None, timeout_seconds=0.05)
+                time.sleep(2.0)
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(signal.getitimer(signal.ITIMER_REAL), (0.0, 0.0))
+    
+    @unittest.skipUnless(hasattr(signal, 'SIGALRM'), "requires signal-based timeouts")
+    def test_timeout_at_block_exit_does_not_leak(self):
+        """Test that alarms racing the end of a block neither leak its deadline nor escape it."""
+        received = []
+        
+        def host_handler(signum, frame):
+            received.append(signum)
+        
+        def spin():
+            deadline = time.monotonic() + 0.001
+            while time.monotonic() < deadline:
+                pass
+        
+        original_handler = signal.signal(signal.SIGALRM, host_handler)
+        try:
+            for enclosing in (False, True):
+                with self.subTest(enclosing=enclosing):
+                    outer = self.manager.timeout(5.0) if enclosing else TimeoutManager().timeout(0)
+                    with outer:
+                        depth = len(_deadline_stack)
+                        # The body takes about as long as the timeout, so the
+                        # alarm lands anywhere from the body to the cleanup
+                        for _ in range(200):
+                            try:
+                                self.manager.execute_with_timeout(spin, timeout_seconds=0.001)
+                            except TimeoutError:
+                                pass
+                            self.assertEqual(len(_deadline_stack), depth)
+                        time.sleep(0.05)
+                    
+                    self.assertEqual(_deadline_stack, [])
+                    self.assertEqual(signal.getitimer(signal.ITIMER_REAL), (0.0, 0.0))
+                    self.assertEqual(received, [])
+        finally:
+            signal.signal(signal.SIGALRM, original_handler)
+    
+    @unittest.skipUnless(hasattr(signal, 'SIGALRM'), "requires signal-based timeouts")
+    def test_safe_execute_timeout(self):
+        """Test that safe_execute reports a timeout with the default value."""
+        result, success = self.manager.safe_execute(
+            lambda: time.sleep(2.0), timeout_seconds=0.05, default_value="timed out"
+        )
+        
+        self.assertEqual(result, "timed out")
+        self.assertFalse(success)
+    
+    def test_safe_execute_success(self):
+        """Test that safe_execute reports success with the function result."""
+        result, success = self.manager.safe_execute(lambda: [1, 2, 3], timeout_seconds=1.0)
+        
+        self.assertEqual(result, [1, 2, 3])
+        self.assertTrue(success)
+
+    def test_thread_timeout_reports_overrun(self):
+        """Test that the deadline-based context manager reports an overrun block."""
+        with self.manager._thread_timeout(1.0):
+            pass
+        
+        with self.assertRaises(TimeoutError):
+            with self.manager._thread_timeout(0.01):
+                time.sleep(0.05)
+    
+    def test_worker_execution_returns_result(self):
+        """Test that the worker-thread path returns the function result."""
+        result = self.manager._execute_in_worker(lambda: threading.current_thread().name, 1.0)
+        
+        self.assertNotEqual(result, threading.current_thread().name)
+    
+    def test_worker_execution_timeout_interrupts_function(self):
+        """Test that a timed-out worker call is interrupted rather than left running."""
+        finished = threading.Event()
+        
+        def spin():
+            try:
+                deadline = time.monotonic() + 5.0
+                while time.monotonic() < deadline:
+                    pass
+            finally:
+                finished.set()
+        
+        start = time.monotonic()
+        with self.assertRaises(TimeoutError):
+            self.manager._execute_in_worker(spin, 0.05)
+        
+        self.assertTrue(finished.wait(2.0))
+        self.assertLess(time.monotonic() - start, 2.0)
+    
+    def test_execute_with_timeout_off_main_thread(self):
+        """Test that timeouts work from threads that cannot install signal handlers."""
+        outcome = {}
+        
+        def worker():
+            outcome['result'] = self.manager.execute_with_timeout(lambda: "ok", timeout_seconds=1.0)
+            try:
+                self.manager.execute_with_timeout(lambda: time.sleep(0.5), timeout_seconds=0.05)
+            except TimeoutError:
+                outcome['timed_out'] = True
+        
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join(5.0)
+        
+        self.assertEqual(outcome.get('result'), "ok")
+        self.assertTrue(outcome.get('timed_out'))
+
+
+class TestModuleFunctions(unittest.TestCase):
+    """Test cases for the module-level convenience functions."""
+    
+    def test_default_timeout_manager(self):
+        """Test that the module exposes a shared TimeoutManager."""
+        self.assertIsInstance(default_timeout_manager, TimeoutManager)
+    
+    def test_execute_with_timeout(self):
+        """Test the convenience execute_with_timeout function."""
+        self.assertEqual(execute_with_timeout(lambda: "ok", 1.0), "ok")
+    
+    def test_timeout_context_manager(self):
+        """Test the convenience timeout context manager."""
+        with timeout(1.0):
+            value = sum(range(10))
+        
+        self.assertEqual(value, 45)
+    
+    @unittest.skipUnless(hasattr(signal, 'SIGALRM'), "requires signal-based timeouts")
+    def test_timeout_context_manager_expires(self):
+        """Test that the timeout context manager interrupts long operations."""
+        with self.assertRaises(TimeoutError):
+            with timeout(0.05):
+                time.sleep(2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,10 +5,11 @@ This module contains comprehensive tests for the TSP solver algorithms,
 including correctness verification, edge case handling, and performance characteristics.
 """
 
+import itertools
 import unittest
 from core.traveling_salesman import (
     TSPBruteForce, TSPNearestNeighbor, TSPNearestNeighborWith2Opt,
-    TSPResult, verify_tsp_solution, calculate_tour_improvement
+    TSPResult, verify_tsp_solution, calculate_tour_improvement, _cached_neighbors
 )
 from generators.tsp_generator import TSPInstance, generate_random_tsp_instance, generate_euclidean_tsp_instance
 
@@ -130,6 +131,26 @@ class TestTSPBruteForce(unittest.TestCase):
         self.assertTrue(result['tour_found'])
         self.assertEqual(result['best_distance'], 7.0)
 
+    
+    def test_matches_exhaustive_enumeration(self):
+        """Test that the shared-prefix search keeps enumeration order and exact distances."""
+        problem = generate_random_tsp_instance(7, seed=42)
+        tsp_instance = problem.data
+        
+        # First tour of minimal length in itertools.permutations order
+        best_tour, best_distance = None, float('inf')
+        for perm in itertools.permutations(range(1, 7)):
+            tour = [0] + list(perm)
+            distance = tsp_instance.calculate_tour_distance(tour)
+            if distance < best_distance:
+                best_tour, best_distance = tour, distance
+        
+        result = self.solver.solve(tsp_instance)
+        
+        self.assertEqual(result['best_tour'], best_tour)
+        self.assertEqual(result['best_distance'], best_distance)
+        self.assertEqual(result['tours_tried'], 720)
+
 
 class TestTSPNearestNeighbor(unittest.TestCase):
     """Test cases for the TSPNearestNeighbor class."""
@@ -227,6 +248,50 @@ class TestTSPNearestNeighbor(unittest.TestCase):
         # The algorithm should find a reasonable tour following nearest neighbors
         self.assertGreater(result['best_distance'], 0)
         self.assertTrue(verify_tsp_solution(tsp_instance, result['best_tour']))
+    
+    def test_single_start_and_ties(self):
+        """Test one start city, with equally near cities taken lowest index first."""
+        distance_matrix = [
+            [0.0, 5.0, 2.0, 2.0],
+            [5.0, 0.0, 1.0, 1.0],
+            [2.0, 1.0, 0.0, 4.0],
+            [2.0, 1.0, 4.0, 0.0]
+        ]
+        tsp_instance = TSPInstance(4, distance_matrix)
+        
+        # From 0, cities 2 and 3 are equally near; 2 is taken first
+        tour, distance, calculations = self.solver._nearest_neighbor_from_city(tsp_instance, 0)
+        
+        self.assertEqual(tour, [0, 2, 1, 3])
+        self.assertEqual(distance, 2.0 + 1.0 + 1.0 + 2.0)
+        self.assertEqual(calculations, 3 + 2 + 1 + 1)
+    
+    def test_neighbor_lists_cached_per_instance(self):
+        """Test that neighbour lists are reused until the matrix is replaced."""
+        tsp_instance = TSPInstance(4, [
+            [0.0, 1.0, 10.0, 10.0],
+            [1.0, 0.0, 2.0, 10.0],
+            [10.0, 2.0, 0.0, 3.0],
+            [10.0, 10.0, 3.0, 0.0]
+        ])
+        
+        self.solver.solve(tsp_instance)
+        neighbors = _cached_neighbors(tsp_instance)
+        TSPNearestNeighborWith2Opt().solve(tsp_instance)
+        self.solver.solve(tsp_instance)
+        self.assertIs(_cached_neighbors(tsp_instance), neighbors)
+        
+        # A new matrix gets new neighbour lists
+        tsp_instance.distance_matrix = [
+            [0.0, 10.0, 10.0, 1.0],
+            [10.0, 0.0, 3.0, 10.0],
+            [10.0, 3.0, 0.0, 2.0],
+            [1.0, 10.0, 2.0, 0.0]
+        ]
+        result = self.solver.solve(tsp_instance)
+        self.assertIsNot(_cached_neighbors(tsp_instance), neighbors)
+        self.assertEqual(_cached_neighbors(tsp_instance)[0], [0, 3, 1, 2])
+        self.assertEqual(result['best_distance'], 16.0)
 
 
 class TestTSPNearestNeighborWith2Opt(unittest.TestCase):
@@ -326,6 +391,58 @@ class TestTSPNearestNeighborWith2Opt(unittest.TestCase):
         self.assertGreater(result['initial_distance'], 0)
         self.assertGreaterEqual(result['improvement_iterations'], 0)
         self.assertGreater(result['distance_calculations'], 0)
+    
+    def test_single_nearest_neighbor_start(self):
+        """Test that n_starts limits the nearest neighbor warm start."""
+        tsp_instance = generate_euclidean_tsp_instance(12, seed=7).data
+        
+        self.solver.n_starts = 1
+        result = self.solver.solve(tsp_instance)
+        tour, distance, calculations = TSPNearestNeighbor()._nearest_neighbor_from_city(tsp_instance, 0)
+        
+        self.assertEqual(result['initial_distance'], distance)
+        self.assertLessEqual(result['best_distance'], distance)
+        self.assertGreater(result['distance_calculations'], calculations)
+        self.assertTrue(verify_tsp_solution(tsp_instance, result['best_tour']))
+        
+        # By default every city is tried as a start
+        self.assertIsNone(TSPNearestNeighborWith2Opt.n_starts)
+        default_result = TSPNearestNeighborWith2Opt().solve(tsp_instance)
+        nn_result = TSPNearestNeighbor().solve(tsp_instance)
+        self.assertEqual(default_result['initial_distance'], nn_result['best_distance'])
+    
+    def test_two_opt_leaves_initial_tour_unchanged(self):
+        """Test that segments are reversed in a copy, not in the caller's tour."""
+        tsp_instance = generate_euclidean_tsp_instance(20, seed=5).data
+        initial_tour = list(range(20))
+        
+        tour, distance, iterations, calculations = \
+            self.solver._two_opt_improvement(tsp_instance, initial_tour)
+        
+        self.assertEqual(initial_tour, list(range(20)))
+        self.assertGreater(iterations, 0)
+        self.assertTrue(verify_tsp_solution(tsp_instance, tour))
+        self.assertAlmostEqual(distance, tsp_instance.calculate_tour_distance(tour))
+    
+    def test_result_is_two_opt_local_optimum(self):
+        """Test that the sweep ends with no improving move and a consistent distance."""
+        tsp_instance = generate_euclidean_tsp_instance(30, seed=123).data
+        
+        result = self.solver.solve(tsp_instance)
+        tour = result['best_tour']
+        
+        self.assertTrue(verify_tsp_solution(tsp_instance, tour))
+        self.assertAlmostEqual(result['best_distance'], tsp_instance.calculate_tour_distance(tour))
+        
+        n = len(tour)
+        d = tsp_instance.get_distance
+        for i in range(n):
+            for j in range(i + 2, n):
+                if i == 0 and j == n - 1:
+                    continue
+                change = (d(tour[i], tour[j]) + d(tour[i + 1], tour[(j + 1) % n])) - \
+                    (d(tour[i], tour[i + 1]) + d(tour[j], tour[(j + 1) % n]))
+                self.assertGreaterEqual(change, -1e-9)
 
 
 class TestTSPResult(unittest.TestCase):
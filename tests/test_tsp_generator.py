@@ -8,6 +8,7 @@ distance matrix properties, and edge case handling.
 
 import unittest
 import math
+import random
 from generators.tsp_generator import (
     generate_random_tsp_instance,
     generate_euclidean_tsp_instance,
@@ -50,6 +51,42 @@ class TestTSPInstance(unittest.TestCase):
         self.assertEqual(instance.get_distance(2, 0), 15.0)
         self.assertEqual(instance.get_distance(0, 0), 0.0)
     
+    def test_flat_distances(self):
+        """Test the row-major copy of the distance matrix."""
+        distance_matrix = [
+            [0.0, 10.0, 15.0],
+            [10.0, 0.0, 20.0],
+            [15.0, 20.0, 0.0]
+        ]
+        instance = TSPInstance(3, distance_matrix)
+        
+        flat = instance.flat_distances()
+        
+        self.assertEqual(flat.typecode, 'd')
+        self.assertEqual(len(flat), 9)
+        for i in range(3):
+            for j in range(3):
+                self.assertEqual(flat[i * 3 + j], distance_matrix[i][j])
+
+    def test_validation_cached(self):
+        """Test that the distance matrix validation is computed once."""
+        distance_matrix = [
+            [0.0, 10.0, 15.0],
+            [10.0, 0.0, 20.0],
+            [15.0, 20.0, 0.0]
+        ]
+        instance = TSPInstance(3, distance_matrix)
+
+        validation = instance.validation
+
+        self.assertEqual(validation, validate_distance_matrix(distance_matrix))
+        self.assertIs(instance.validation, validation)
+
+        # Deleting the cached attribute recomputes it for a modified matrix
+        distance_matrix[0][1] = 50.0
+        del instance.validation
+        self.assertFalse(instance.validation["is_symmetric"])
+
     def test_calculate_tour_distance(self):
         """Test tour distance calculation."""
         distance_matrix = [
@@ -153,6 +190,17 @@ class TestGenerateRandomTSPInstance(unittest.TestCase):
         # Should generate identical instances
         self.assertEqual(instance1.data.distance_matrix, instance2.data.distance_matrix)
     
+    def test_seed_leaves_global_random_state(self):
+        """Test that a seeded call neither reseeds nor advances the global generator."""
+        random.seed(99)
+        expected = random.random()
+        
+        random.seed(99)
+        generate_random_tsp_instance(5, seed=1)
+        generate_euclidean_tsp_instance(5, seed=1)
+        generate_clustered_tsp_instance(5, seed=1)
+        self.assertEqual(random.random(), expected)
+    
     def test_different_seeds_produce_different_instances(self):
         """Test that different seeds produce different instances."""
         instance1 = generate_random_tsp_instance(3, max_distance=30.0, seed=111)
@@ -316,6 +364,20 @@ class TestGenerateClusteredTSPInstance(unittest.TestCase):
                     break
             # Note: Due to grid boundary constraints, cities might be slightly outside
             # the cluster radius, so we don't enforce this strictly
+
+    def test_clustered_cities_follow_cluster_order(self):
+        """Test that cities are laid out cluster by cluster, extras first."""
+        instance = generate_clustered_tsp_instance(8, num_clusters=3, cluster_radius=1.0,
+                                                 grid_size=100.0, seed=7)
+
+        coordinates = instance.metadata["city_coordinates"]
+        cluster_centers = instance.metadata["cluster_centers"]
+
+        # 8 cities over 3 clusters: the first two clusters get 3, the last gets 2
+        expected_clusters = [0, 0, 0, 1, 1, 1, 2, 2]
+        for (city_x, city_y), cluster_idx in zip(coordinates, expected_clusters):
+            center_x, center_y = cluster_centers[cluster_idx]
+            self.assertLessEqual(math.dist((city_x, city_y), (center_x, center_y)), 1.0 + 1e-10)
     
     def test_clustered_parameter_validation(self):
         """Test parameter validation for clustered instance generation."""
@@ -386,6 +448,28 @@ class TestGenerateGridTSPInstance(unittest.TestCase):
                     expected_distance = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
                     self.assertAlmostEqual(matrix[i][j], expected_distance, places=10)
     
+    def test_grid_statistics(self):
+        """Test that the closed-form grid statistics match the distance matrix."""
+        for width, height in [(2, 1), (1, 3), (4, 3), (5, 5)]:
+            with self.subTest(width=width, height=height):
+                instance = generate_grid_tsp_instance(width, height, spacing=2.5)
+                coordinates = instance.metadata["city_coordinates"]
+                matrix = instance.data.distance_matrix
+                num_cities = width * height
+                
+                distances = []
+                for i in range(num_cities):
+                    for j in range(num_cities):
+                        expected_distance = math.dist(coordinates[i], coordinates[j])
+                        self.assertAlmostEqual(matrix[i][j], expected_distance, places=10)
+                        if i < j:
+                            distances.append(matrix[i][j])
+                
+                self.assertAlmostEqual(instance.metadata["average_distance"],
+                                       sum(distances) / len(distances), places=10)
+                self.assertEqual(instance.metadata["min_distance"], min(distances))
+                self.assertEqual(instance.metadata["max_distance_actual"], max(distances))
+    
     def test_grid_parameter_validation(self):
         """Test parameter validation for grid instance generation."""
         with self.assertRaises(ValueError):
@@ -494,6 +578,19 @@ class TestValidateDistanceMatrix(unittest.TestCase):
         self.assertTrue(result["is_symmetric"])
         self.assertTrue(result["has_zero_diagonal"])
         self.assertTrue(result["satisfies_triangle_inequality"])
+    
+    def test_triangle_inequality_boundaries(self):
+        """Test exact equality with zero tolerance and a single tiny violation."""
+        # Collinear grid cities meet the triangle inequality with equality
+        matrix = generate_grid_tsp_instance(4, 3).data.distance_matrix
+        self.assertTrue(validate_distance_matrix(matrix, tolerance=0)["satisfies_triangle_inequality"])
+        
+        # Stretching one distance just past its shortcut is a violation
+        matrix = [row[:] for row in matrix]
+        matrix[0][11] = matrix[11][0] = matrix[0][1] + matrix[1][11] + 1e-6
+        result = validate_distance_matrix(matrix)
+        self.assertTrue(result["is_symmetric"])
+        self.assertFalse(result["satisfies_triangle_inequality"])
 
 
 class TestDefaultConfigs(unittest.TestCase):